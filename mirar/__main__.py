@@ -17,11 +17,17 @@ from mirar.data import cache
 from mirar.monitor.base_monitor import Monitor
 from mirar.paths import PACKAGE_NAME, RAW_IMG_SUB_DIR, TEMP_DIR
 from mirar.pipelines import Pipeline, get_pipeline
+from mirar.processors.base_processor import BaseProcessor
 from mirar.processors.utils import ImageLoader
 from mirar.utils.docs.pipeline_visualisation import flowify
 
 logger = logging.getLogger(__name__)
 
+# No log format uses thread or process details, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 parser = argparse.ArgumentParser(
     description=f"{PACKAGE_NAME}: Modular Image Reduction and Analysis Resource"
 )
@@ -78,9 +84,21 @@ parser.add_argument(
     default=RAW_IMG_SUB_DIR,
     help="Subdirectory to look in for raw images of a given night",
 )
+parser.add_argument(
+    "-j",
+    "--maxcpu",
+    default=None,
+    type=int,
+    help="Maximum number of batches each processor runs in parallel "
+    "(default: MAX_N_CPU environment variable, or half the available CPUs)",
+)
 
 args = parser.parse_args()
 
+if args.maxcpu is not None:
+    # Processors with their own, stricter limit keep it
+    BaseProcessor.max_n_cpu = args.maxcpu
+
 if args.download:
     Pipeline.pipelines[args.pipeline.lower()].download_raw_images_for_night(
         night=args.night
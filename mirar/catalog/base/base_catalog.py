@@ -3,7 +3,9 @@ Module for Catalog base class
 """
 
 import logging
+import threading
 from abc import ABC
+from collections import OrderedDict
 from pathlib import Path
 from typing import Type
 
@@ -19,6 +21,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SNR_THRESHOLD = 3.0
 
+# Catalogs already queried by this process, so that repeated queries
+# for the same field do not need to be requeried
+QUERY_CACHE_SIZE = 64
+
+_query_cache: OrderedDict[tuple, astropy.table.Table] = OrderedDict()
+_query_cache_lock = threading.Lock()
+
 
 class ABCatalog:
     """
@@ -81,12 +90,70 @@ class BaseCatalog(ABCatalog, ABC):
         """
         raise NotImplementedError()
 
-    def write_catalog(self, image: Image, output_dir: str | Path) -> Path:
+    def get_query_cache_key(self, ra_deg: float, dec_deg: float) -> tuple | None:
+        """
+        Get the key for caching a catalog query in memory, or None if the
+        result of the query should not be cached.
+        Subclasses must extend the key with any attribute that changes the
+        result of get_catalog.
+
+        The key uses the exact position, because a catalog queried for
+        a nearby centre would not cover the full search radius.
+
+        :param ra_deg: RA
+        :param dec_deg: Dec
+        :return: cache key
+        """
+        return (
+            type(self).__name__,
+            ra_deg,
+            dec_deg,
+            self.search_radius_arcmin,
+            self.min_mag,
+            self.max_mag,
+            self.filter_name,
+        )
+
+    def get_cached_catalog(self, ra_deg: float, dec_deg: float) -> astropy.table.Table:
+        """
+        Returns a catalog centered on ra/dec, reusing the result of
+        an earlier query with the same parameters if possible
+
+        :param ra_deg: RA
+        :param dec_deg: Dec
+        :return: Catalog
+        """
+        key = self.get_query_cache_key(ra_deg=ra_deg, dec_deg=dec_deg)
+
+        if key is None:
+            return self.get_catalog(ra_deg=ra_deg, dec_deg=dec_deg)
+
+        with _query_cache_lock:
+            if key in _query_cache:
+                logger.debug(f"Using cached {self.abbreviation} catalog")
+                _query_cache.move_to_end(key)
+                return _query_cache[key].copy()
+
+        cat = self.get_catalog(ra_deg=ra_deg, dec_deg=dec_deg)
+
+        with _query_cache_lock:
+            _query_cache[key] = cat.copy()
+            _query_cache.move_to_end(key)
+            while len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+
+        return cat
+
+    def write_catalog(
+        self, image: Image, output_dir: str | Path, use_query_cache: bool = False
+    ) -> Path:
         """
         Generates a custom catalog for an image
 
         :param image: Image
         :param output_dir: output directory for catalog
+        :param use_query_cache: whether to reuse catalogs already queried
+            for the same field
         :return: path of catalog
         """
         if isinstance(output_dir, str):
@@ -95,7 +162,10 @@ class BaseCatalog(ABCatalog, ABC):
 
         base_name = Path(image[BASE_NAME_KEY]).with_suffix(".ldac").name
 
-        cat = self.get_catalog(ra_deg=ra_deg, dec_deg=dec_deg)
+        if use_query_cache:
+            cat = self.get_cached_catalog(ra_deg=ra_deg, dec_deg=dec_deg)
+        else:
+            cat = self.get_catalog(ra_deg=ra_deg, dec_deg=dec_deg)
 
         output_path = self.get_output_path(output_dir, base_name)
         output_path.unlink(missing_ok=True)
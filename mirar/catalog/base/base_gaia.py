@@ -73,6 +73,18 @@ class BaseGaia2Mass(BaseCatalog, ABC):
             if val is None:
                 self.acceptable_ph_quals[filt] = ["A", "B", "C"]
 
+    def get_query_cache_key(self, ra_deg: float, dec_deg: float) -> tuple | None:
+        if self.trim:
+            # Trimmed catalogs depend on the sources of one specific image
+            return None
+        key = super().get_query_cache_key(ra_deg=ra_deg, dec_deg=dec_deg)
+        if key is None:
+            return None
+        ph_quals = tuple(
+            (filt, tuple(quals)) for filt, quals in self.acceptable_ph_quals.items()
+        )
+        return key + (self.snr_threshold, ph_quals)
+
     def convert_to_ab_mag(self, src_list: astropy.table.Table) -> astropy.table.Table:
         """
         Convert 2MASS magnitudes to AB magnitudes
@@ -33,3 +33,7 @@ class CatalogFromFile(BaseCatalog):
     def get_catalog(self, ra_deg: float, dec_deg: float) -> astropy.table.Table:
         catalog = get_table_from_ldac(self.catalog_path)
         return catalog
+
+    def get_query_cache_key(self, ra_deg: float, dec_deg: float) -> None:
+        # The catalog is already local, and the file may change between reads
+        return None
@@ -53,6 +53,12 @@ class VizierCatalog(BaseCatalog, ABC):
         super().__init__(*args, **kwargs)
         self.snr_threshold = snr_threshold
 
+    def get_query_cache_key(self, ra_deg: float, dec_deg: float) -> tuple | None:
+        key = super().get_query_cache_key(ra_deg=ra_deg, dec_deg=dec_deg)
+        if key is None:
+            return None
+        return key + (self.snr_threshold,)
+
     def get_mag_key(self) -> str:
         """
         Returns the key for mag in table
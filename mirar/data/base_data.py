@@ -16,6 +16,7 @@ A :class:`~wintedrp.processors.BaseProcessor` will iterate over each
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Type
 
@@ -27,8 +28,9 @@ logger = logging.getLogger(__name__)
 class DataBlock:
     """Base unit for processing, corresponding to a single image."""
 
+    __slots__ = ("base_name",)
+
     def __init__(self):
-        self.raw_img_list = [Path(x) for x in self[RAW_IMG_KEY].split(",")]
         self.base_name = self[BASE_NAME_KEY]
 
     def __getitem__(self, item):
@@ -55,7 +57,7 @@ class DataBlock:
 
         :return: List of path strings
         """
-        return [Path(x) for x in self[RAW_IMG_KEY].split(",")]  # self.raw_img_list
+        return [Path(x) for x in self[RAW_IMG_KEY].split(",")]
 
 
 class PseudoList:
@@ -70,6 +72,8 @@ class PseudoList:
     and `for y in x` work as intended.
     """
 
+    __slots__ = ("_datalist",)
+
     @property
     def data_type(self):
         """
@@ -148,15 +152,16 @@ class PseudoList:
 
     def __add__(self, other):
         new = self.__class__()
-        for item in self.get_data_list():
-            new.append(item)
-        for item in other.get_data_list():
-            new.append(item)
+        new._datalist = self._datalist.copy()
+        other_list = other.get_data_list()
+        if len(other_list) > 0:
+            # The items of other already share a type, so checking the first is enough
+            new.append(other_list[0])
+            new._datalist.extend(other_list[1:])
         return new
 
     def __iadd__(self, other):
-        for item in other.get_data_list():
-            self._datalist.append(item)
+        self._datalist.extend(other.get_data_list())
         return self
 
     def __len__(self):
@@ -174,6 +179,8 @@ class DataBatch(PseudoList):
     by a :class:`~wintedrp.processors.BaseProcessor`
     """
 
+    __slots__ = ()
+
     @property
     def data_type(self) -> Type[DataBlock]:
         raise NotImplementedError()
@@ -189,15 +196,16 @@ class DataBatch(PseudoList):
         """
         return self.get_data_list()
 
-    def get_raw_image_names(self) -> list[Path]:
+    def get_raw_image_names(self) -> list[str]:
         """Returns the name of each parent raw image
 
         :return: list of raw image names
         """
-        img_list = []
-        for data_block in self.get_batch():
-            img_list += [Path(x).name for x in data_block.get_raw_img_list()]
-        return img_list
+        return [
+            os.path.basename(x)
+            for data_block in self.get_batch()
+            for x in data_block[RAW_IMG_KEY].split(",")
+        ]
 
     def __str__(self):
         return (
@@ -213,6 +221,8 @@ class Dataset(PseudoList):
     A :class:`~wintedrp.processors.BaseProcessor` will iterate over these.
     """
 
+    __slots__ = ()
+
     data_type = DataBatch
 
     def get_batches(self):
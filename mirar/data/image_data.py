@@ -12,10 +12,14 @@ inefficient/slow for a typical laptop or many larger processing machines.
 
 To mitigate this, the code can be operated in **cache mode**. In that case,
 after raw images are loaded, only the header data is stored in memory.
-The actual image data itself is stored temporarily in as a npy file
+The actual image data itself is stored temporarily in as a raw binary file
 in a dedicated cache directory, and only loaded into memory when needed.
-When the data is updated, the npy file is changed.
-The path of the file is a unique hash, and includes the read time of the file,
+The shape and dtype are kept on the image, so the file has no header to parse.
+Loading memory-maps the file copy-on-write, so pages are only read from
+disk when accessed, and modifying the loaded array never changes the cache.
+When the data is updated, a new file is written and swapped in.
+Any arrays which were loaded previously remain valid and unchanged.
+The name of the file combines the process id with a running counter,
 so multiple copies of an image can be read and modified independently.
 
 In cache mode, all of the image data is temporarily stored in a cache,
@@ -25,11 +29,11 @@ The location of the cache is in the configurable
 To mitigate that, and to avoid cleaning the cache by hand,
 the code tries to automatically delete cache files as needed.
 
-Python provides a default `__del__()` method for handling clean up when an object
-is deleted. Images automatically delete their cache in this method. However, has a
-somewhat-complicated method of 'garbage collection' (see
+Each Image registers a `weakref.finalize` callback, which deletes its cache file
+once the Image is garbage-collected (or at the latest, when the interpreter exits).
+However, python has a somewhat-complicated method of 'garbage collection' (see
 `the official description <https://devguide.python.org/internals/garbage-collector>`_
-for more info), and it is not guaranteed that Image objects will
+for more info), and it is not guaranteed when Image objects will
 clean themselves.
 
 As a fallback, when you run the code from the command line (and therefore call
@@ -56,21 +60,36 @@ and setting the output data directory.
 """
 
 import copy
-import hashlib
+import itertools
 import logging
-import threading
+import math
+import os
+import shutil
+import weakref
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 from astropy.io.fits import Header
-from astropy.time import Time
 
 from mirar.data.base_data import DataBatch, DataBlock
 from mirar.data.cache import USE_CACHE, cache
 
 logger = logging.getLogger(__name__)
 
+# Counter used to give each cached image a unique file name within a process
+_cache_counter = itertools.count()
+
+
+def _remove_cache_file(cache_path: Path):
+    """
+    Delete the cache file of an image which no longer exists
+
+    :param cache_path: path of the cache file
+    :return: None
+    """
+    cache_path.unlink(missing_ok=True)
+
 
 class Image(DataBlock):
     """
@@ -82,29 +101,42 @@ class Image(DataBlock):
     :class:`~mirar.processors.base_processor.BaseCandidateGenerator` processors.
     """
 
-    cache_files = []
+    __slots__ = (
+        "_data",
+        "header",
+        "cache_path",
+        "_data_dtype",
+        "_data_shape",
+        "__weakref__",
+    )
 
     def __init__(self, data: np.ndarray, header: Header):
-        self._data = None
+        """
+        :param data: image data
+        :param header: image header
+        """
+        self._data: Optional[np.ndarray] = None
         self.header = header
+        # Layout of the cached data, set along with it in set_cache_data
+        self._data_dtype: Optional[np.dtype] = None
+        self._data_shape: Optional[tuple[int, ...]] = None
         super().__init__()
         if USE_CACHE:
             self.cache_path = self.get_cache_path()
-            self.cache_files.append(self.cache_path)
+            weakref.finalize(self, _remove_cache_file, self.cache_path)
         else:
             self.cache_path = None
         self.set_data(data=data)
 
     def get_cache_path(self) -> Path:
         """
-        Get a unique cache path for the image (.npy file).
-        This is hash, using name and time, so should be unique even
-        when rerunning on the same image.
+        Get a unique cache path for the image (raw binary .dat file).
+        This uses the process id and a counter, so should be unique even
+        when rerunning on the same image, or in several threads/processes.
 
         :return: unique cache file path
         """
-        base = "".join([str(Time.now()), self.get_name(), str(threading.get_ident())])
-        name = f"{hashlib.sha1(base.encode()).hexdigest()}.npy"
+        name = f"{os.getpid()}_{next(_cache_counter)}.dat"
         return cache.get_cache_dir().joinpath(name)
 
     def set_data(self, data: np.ndarray):
@@ -126,7 +158,16 @@ class Image(DataBlock):
         :param data: Updated image data
         :return: None
         """
-        np.save(self.cache_path.as_posix(), data, allow_pickle=False)
+        # Write a new file and swap it in, rather than overwriting the old one,
+        # because arrays returned by get_cache_data may still map the old file
+        data = np.asarray(data)
+        temp_path = self.cache_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as temp_file:
+            data.tofile(temp_file)
+        os.replace(temp_path, self.cache_path)
+
+        self._data_dtype = data.dtype
+        self._data_shape = data.shape
 
     def set_ram_data(self, data: np.ndarray):
         """
@@ -155,15 +196,27 @@ class Image(DataBlock):
         :return: mask data (numpy array)
         """
         img_data = self.get_data()
-        return ~np.isnan(img_data)
+        # NaN != NaN, so this finds the non-NaN pixels in a single pass
+        return img_data == img_data  # pylint: disable=comparison-with-itself
 
     def get_cache_data(self) -> np.ndarray:
         """
-        Get the image data from cache
+        Get the image data from cache.
+        The data is memory-mapped copy-on-write, so it is only read as needed,
+        and can be modified without changing the cached copy.
 
         :return: image data (numpy array)
         """
-        return np.load(self.cache_path.as_posix(), allow_pickle=True)
+        shape, dtype = self._data_shape, self._data_dtype
+        if (shape is None) or (dtype is None):
+            raise ValueError(f"No data has been cached for {self}")
+
+        if math.prod(shape) == 0:
+            # Empty files cannot be memory-mapped
+            return np.empty(shape, dtype=dtype)
+        return np.asarray(
+            np.memmap(self.cache_path, dtype=dtype, mode="c", shape=shape)
+        )
 
     def get_ram_data(self) -> np.ndarray:
         """
@@ -171,6 +224,8 @@ class Image(DataBlock):
 
         :return: image data (numpy array)
         """
+        if self._data is None:
+            raise ValueError(f"No data has been set for {self}")
         return self._data
 
     def get_header(self) -> Header:
@@ -196,6 +251,9 @@ class Image(DataBlock):
     def __setitem__(self, key, value):
         self.header.__setitem__(key, value)
 
+    def __contains__(self, item):
+        return self.header.__contains__(item)
+
     def keys(self):
         """
         Get the header keys
@@ -204,22 +262,38 @@ class Image(DataBlock):
         """
         return self.header.keys()
 
-    def __del__(self):
-        if self.cache_path is not None:
-            self.cache_path.unlink(missing_ok=True)
-            self.cache_files.remove(self.cache_path)
+    def _copy_with_header(self, header: Header) -> "Image":
+        """
+        Copy the image, with a new header.
+        In cache mode, the copy's cache file is a hard link to the existing one,
+        so no image data is read or written. Cache files are never modified
+        in place (see set_cache_data), so either image can later update
+        its data without affecting the other.
+
+        :param header: header for the copy
+        :return: copied image
+        """
+        if self.cache_path is None:
+            return type(self)(data=copy.deepcopy(self.get_data()), header=header)
+
+        new = type(self)(data=np.empty(0), header=header)
+        temp_path = new.cache_path.with_suffix(".tmp")
+        try:
+            os.link(self.cache_path, temp_path)
+        except OSError:
+            # Not every filesystem supports hard links
+            shutil.copyfile(self.cache_path, temp_path)
+        os.replace(temp_path, new.cache_path)
+        # pylint: disable=protected-access
+        new._data_dtype = self._data_dtype
+        new._data_shape = self._data_shape
+        return new
 
     def __deepcopy__(self, memo):
-        new = type(self)(
-            data=copy.deepcopy(self.get_data()), header=copy.deepcopy(self.get_header())
-        )
-        return new
+        return self._copy_with_header(copy.deepcopy(self.get_header()))
 
     def __copy__(self):
-        new = type(self)(
-            data=self.get_data().__copy__(), header=self.get_header().__copy__()
-        )
-        return new
+        return self._copy_with_header(self.get_header().__copy__())
 
 
 class ImageBatch(DataBatch):
@@ -233,6 +307,8 @@ class ImageBatch(DataBatch):
     :class:`~mirar.processors.utils.image_selector.ImageSelector`.
     """
 
+    __slots__ = ()
+
     data_type = Image
 
     def __init__(self, batch: Optional[list[Image] | Image] = None):
@@ -15,6 +15,8 @@ class SourceTable(DataBlock):
     sources detected in an image
     """
 
+    __slots__ = ("source_list", "metadata")
+
     def __init__(self, source_list: pd.DataFrame, metadata: dict):
         self.source_list = source_list
         self.metadata = metadata
@@ -68,6 +70,8 @@ class SourceBatch(DataBatch):
     DataBatch class for holding SourceTables
     """
 
+    __slots__ = ()
+
     data_type = SourceTable
 
     def __init__(self, batch: Optional[list[SourceTable] | SourceTable] = None):
@@ -4,6 +4,7 @@ Module to define PSQL database tables using sqlalchemy
 
 import logging
 from datetime import date
+from functools import cache
 from typing import Any, ClassVar, Type
 
 import pandas as pd
@@ -13,6 +14,7 @@ from pydantic import (
     ConfigDict,
     Field,
     FieldValidationInfo,
+    TypeAdapter,
     field_validator,
     model_validator,
 )
@@ -21,8 +23,9 @@ from sqlalchemy.exc import IntegrityError
 
 from mirar.database.constants import POSTGRES_DUPLICATE_PROTOCOLS
 from mirar.database.constraints import DBQueryConstraints
-from mirar.database.transactions import select_from_table
-from mirar.database.transactions.insert import _insert_in_table
+from mirar.database.transactions import exists_in_table, select_from_table
+from mirar.database.transactions.cache import invalidate_cached_selects
+from mirar.database.transactions.insert import _insert_in_table, _insert_many_in_table
 from mirar.database.transactions.update import _update_database_entry
 from mirar.errors import ProcessorError
 
@@ -74,15 +77,62 @@ class BaseDB(PydanticBase):
         :param info: field info
         :return: value
         """
-        if info.field_name not in cls.sql_model.__table__.columns.keys():
+        if info.field_name not in cls.get_sql_column_names():
             err = f"Field '{info.field_name}' not duplicated in {cls.sql_model}"
             raise ValueError(err)
         return value
 
+    @classmethod
+    @cache
+    def get_sql_column_names(cls) -> frozenset[str]:
+        """
+        Get the names of the columns in the associated sql table (cached)
+
+        :return: column names
+        """
+        return frozenset(cls.sql_model.__table__.columns.keys())
+
+    @classmethod
+    @cache
+    def _get_list_adapter(cls) -> TypeAdapter:
+        """
+        Get a (cached) type adapter for validating lists of this model
+
+        :return: type adapter
+        """
+        return TypeAdapter(list[cls])
+
+    @classmethod
+    def validate_entries(cls, rows: list[dict]) -> list["BaseDB"]:
+        """
+        Validate many rows at once, returning a model instance for each.
+        The whole list is validated in a single call to pydantic,
+        rather than a separate model construction per row.
+
+        :param rows: list of row dictionaries
+        :return: list of validated models
+        """
+        return cls._get_list_adapter().validate_python(rows)
+
+    @classmethod
+    @cache
+    def get_column_names(cls) -> tuple[str, ...]:
+        """
+        Get the names of the (non-computed) fields declared on this model.
+        The result is cached, as it is fixed once the class is defined.
+
+        :return: column names
+        """
+        return tuple(
+            x
+            for x in cls.__dict__["__annotations__"]
+            if (x != "sql_model") & (x not in cls.model_computed_fields.keys())
+        )
+
     def _insert_entry(
         self,
         duplicate_protocol: str,
-        returning_key_names: str | list[str] = None,
+        returning_key_names: str | list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Insert the pydantic-ified data into the corresponding sql database
@@ -110,6 +160,9 @@ class BaseDB(PydanticBase):
             if not isinstance(exc.orig, errors.UniqueViolation):
                 raise exc
 
+            # The entry was written elsewhere, so any cached selects are stale
+            invalidate_cached_selects(self.sql_model)
+
             db_name = self.sql_model.db_name
 
             if duplicate_protocol == "fail":
@@ -166,31 +219,55 @@ class BaseDB(PydanticBase):
 
         return res
 
-    def get_primary_key(self) -> str:
+    @classmethod
+    @cache
+    def get_primary_key(cls) -> str:
         """
-        Get the primary key of the table
+        Get the primary key of the table.
+        The result is cached, as the table schema is fixed.
 
         :return: primary key
         """
-        primary_key = inspect(self.sql_model).primary_key[0]
+        primary_key = inspect(cls.sql_model).primary_key[0]
         return primary_key.name
 
-    def get_unique_keys(self) -> list[Column]:
+    @classmethod
+    @cache
+    def _get_unique_keys(cls) -> tuple[Column, ...]:
+        """
+        Get the unique keys of the table, and cache them
+
+        :return: unique keys
+        """
+        return tuple(x for x in cls.sql_model.__table__.columns if x.unique)
+
+    @classmethod
+    def get_unique_keys(cls) -> list[Column]:
         """
         Get the unique key of the table
 
         :return: unique keys
         """
-        cols = [x for x in self.sql_model.__table__.columns if x.unique]
-        return cols
+        return list(cls._get_unique_keys())
+
+    @classmethod
+    @cache
+    def _get_available_unique_keys(cls) -> tuple[Column, ...]:
+        """
+        Get the unique keys of the table which are model fields, and cache them
+
+        :return: unique keys
+        """
+        return tuple(x for x in cls._get_unique_keys() if x.name in cls.model_fields)
 
-    def get_available_unique_keys(self) -> list[Column]:
+    @classmethod
+    def get_available_unique_keys(cls) -> list[Column]:
         """
         Get the unique keys of the table which are present in the data
 
         :return: unique keys
         """
-        return [x for x in self.get_unique_keys() if x.name in self.model_fields]
+        return list(cls._get_available_unique_keys())
 
     def insert_entry(
         self,
@@ -211,6 +288,109 @@ class BaseDB(PydanticBase):
         logger.debug(f"Return result {result}")
         return result
 
+    @classmethod
+    def _insert_entries(
+        cls,
+        entries: list["BaseDB"],
+        duplicate_protocol: str,
+        returning_key_names: str | list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Insert several pydantic-ified entries into the corresponding sql database,
+        using a single batched transaction.
+
+        If any entry is a duplicate, the batch is rolled back,
+        and each entry is instead inserted individually following
+        the duplicate protocol.
+
+        :param entries: entries to insert
+        :param duplicate_protocol: protocol to follow if duplicate entry is found
+        :param returning_key_names: names of keys to return
+        :return: sequence_key dataframe, with one row per entry
+        """
+        assert duplicate_protocol in POSTGRES_DUPLICATE_PROTOCOLS
+
+        if len(entries) == 0:
+            return pd.DataFrame()
+
+        if returning_key_names is None:
+            returning_key_names = entries[0].get_primary_key()
+
+        if not isinstance(returning_key_names, list):
+            returning_key_names = [returning_key_names]
+
+        try:
+            res = _insert_many_in_table(
+                new_entries=[x.model_dump() for x in entries],
+                sql_table=cls.sql_model,
+                returning_keys=returning_key_names,
+            )
+        except IntegrityError as exc:
+            if not isinstance(exc.orig, errors.UniqueViolation):
+                raise exc
+
+            logger.debug(
+                f"Found duplicate entry in batch for {cls.sql_model.__tablename__} - "
+                f"inserting entries individually instead."
+            )
+
+            results = []
+            for entry in entries:
+                entry_res = entry._insert_entry(  # pylint: disable=protected-access
+                    duplicate_protocol=duplicate_protocol,
+                    returning_key_names=returning_key_names,
+                )
+                assert len(entry_res) == 1
+                results.append(entry_res)
+
+            res = pd.concat(results, ignore_index=True)
+
+        assert len(res) == len(entries)
+
+        return res
+
+    @classmethod
+    def insert_entries(
+        cls,
+        entries: list["BaseDB"],
+        duplicate_protocol: str,
+        returning_key_names: str | list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Insert several entries into the corresponding sql database.
+        If the child class overrides insert_entry, that is called for each entry.
+        Otherwise, the entries are inserted in a single batch.
+        Users can override this function to provide a batched version
+        of their custom insert_entry.
+
+        :param entries: entries to insert
+        :param duplicate_protocol: protocol to follow if duplicate entry is found
+        :param returning_key_names: names of the keys to return
+        :return: dataframe of the sequence keys, with one row per entry
+        """
+        if cls.insert_entry is not BaseDB.insert_entry:
+            if len(entries) == 0:
+                return pd.DataFrame()
+
+            results = []
+            for entry in entries:
+                entry_res = entry.insert_entry(
+                    duplicate_protocol=duplicate_protocol,
+                    returning_key_names=returning_key_names,
+                )
+                assert len(entry_res) == 1
+                results.append(entry_res)
+
+            return pd.concat(results, ignore_index=True)
+
+        result = cls._insert_entries(
+            entries=entries,
+            duplicate_protocol=duplicate_protocol,
+            returning_key_names=returning_key_names,
+        )
+        logger.debug(f"Return result {result}")
+        return result
+
     def _update_entry(self, update_key_names: list[str] | str | None = None):
         """
         Update database entry
@@ -247,12 +427,7 @@ class BaseDB(PydanticBase):
             logger.error(err)
             raise DatabaseUpdateError(err)
 
-        full_dict = self.model_dump()
-
-        if update_key_names is None:
-            update_key_names = full_dict.keys()
-
-        update_dict = {key: full_dict[key] for key in update_key_names}
+        update_dict = self.get_update_dict(update_key_names)
 
         _update_database_entry(
             update_dict=update_dict,
@@ -260,6 +435,33 @@ class BaseDB(PydanticBase):
             db_constraints=valid_constraint,
         )
 
+    def get_update_dict(self, update_key_names: list[str] | str | None = None) -> dict:
+        """
+        Get the values to write when updating the database entry
+
+        :param update_key_names: names of keys to be updated,
+            if None, will update all keys
+        :return: dictionary of values to update
+        """
+        full_dict = self.model_dump()
+
+        if update_key_names is None:
+            return full_dict
+
+        if not isinstance(update_key_names, list):
+            update_key_names = [update_key_names]
+
+        unknown_keys = [key for key in update_key_names if key not in full_dict]
+        if len(unknown_keys) > 0:
+            err = (
+                f"Cannot update {unknown_keys} in {self.sql_model}, "
+                f"as they are not fields of {self.__class__.__name__}."
+            )
+            logger.error(err)
+            raise DatabaseUpdateError(err)
+
+        return {key: full_dict[key] for key in update_key_names}
+
     def update_entry(self, update_keys=None):
         """
         Wrapper to update database entry. Users should override this function.
@@ -270,24 +472,25 @@ class BaseDB(PydanticBase):
         self._update_entry(update_keys)
 
     @classmethod
-    def _exists(cls, values, keys: str | list = None) -> bool:
+    def _exists(cls, values, keys: str | list = None, use_cache: bool = False) -> bool:
         """
         Function to query a table and see whether an entry with key==value exists.
         If key is None, key will default to the table's primary key.
 
         :param values: values to query
         :param keys: keys to query
+        :param use_cache: whether to reuse the results of identical earlier checks
         :return: True if entry exists, False otherwise
         """
         db_constraints = DBQueryConstraints(
             columns=keys, accepted_values=values, comparison_types="="
         )
 
-        match = select_from_table(
+        return exists_in_table(
             db_constraints=db_constraints,
             sql_table=cls.sql_model,
+            use_cache=use_cache,
         )
-        return len(match) > 0
 
 
 ra_field: float = Field(title="RA (degrees)", ge=0.0, le=360.0)
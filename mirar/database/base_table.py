@@ -3,6 +3,7 @@ Module to define PSQL database tables using sqlalchemy
 """
 
 import logging
+from functools import cache
 
 from sqlalchemy import inspect
 
@@ -27,10 +28,12 @@ class BaseTable:
         """
         raise NotImplementedError
 
-    def get_primary_key(self) -> str:
+    @classmethod
+    @cache
+    def get_primary_key(cls) -> str:
         """
-        Function to get primary key of table
+        Function to get primary key of table (cached, as the schema is fixed)
         Returns:
         primary key
         """
-        return inspect(self.__class__).primary_key[0].name
+        return inspect(cls).primary_key[0].name
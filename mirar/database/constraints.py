@@ -3,6 +3,8 @@ Module for DBQueryConstraints to carefully specify postgres query constraints
 """
 
 import numpy as np
+from sqlalchemy import BindParameter, Float, TextClause, bindparam, text
+from sqlalchemy.types import NullType
 
 POSTGRES_ACCEPTED_COMPARISONS = ["=", "<", ">", "<=", ">=", "between", "<>", "!="]
 
@@ -24,7 +26,11 @@ class DBQueryConstraints:
         self.accepted_values = []
         self.comparison_types = []
 
-        self.q3c_query = None
+        self.q3c_query: dict | None = None
+
+        # Cached sql, cleared whenever a constraint is added
+        self._parsed_constraints: str | None = None
+        self._text_clause: TextClause | None = None
 
         if columns is None:
             assert accepted_values is None
@@ -72,6 +78,7 @@ class DBQueryConstraints:
         self.columns.append(column)
         self.accepted_values.append(accepted_values)
         self.comparison_types.append(comparison_type)
+        self._clear_cache()
 
     def add_q3c_constraint(
         self,
@@ -92,29 +99,35 @@ class DBQueryConstraints:
         :return: None
         """
 
-        crossmatch_radius_deg = crossmatch_radius_arcsec / 3600.0
+        self.q3c_query = {
+            "ra": ra,
+            "dec": dec,
+            "crossmatch_radius_arcsec": crossmatch_radius_arcsec,
+            "ra_field_name": ra_field_name,
+            "dec_field_name": dec_field_name,
+        }
+        self._clear_cache()
 
-        constraints = (
-            f"q3c_radial_query({ra_field_name},{dec_field_name},"
-            f"{ra},{dec},{crossmatch_radius_deg}) "
-        )
+    def _clear_cache(self):
+        """
+        Clear the cached sql, after the constraints have changed
 
-        self.q3c_query = constraints
+        :return: None
+        """
+        self._parsed_constraints = None
+        self._text_clause = None
 
     def __add__(self, other):
         new = self.__class__(self.columns, self.accepted_values, self.comparison_types)
         new.q3c_query = self.q3c_query
-        for args in other:
-            new.add_constraint(*args)
-            if other.q3c_query is not None:
-                new.add_q3c_constraint(*other.q3c_query)
+        new += other
         return new
 
     def __iadd__(self, other):
         for args in other:
             self.add_constraint(*args)
-            if other.q3c_query is not None:
-                self.add_q3c_constraint(*other.q3c_query)
+        if other.q3c_query is not None:
+            self.add_q3c_constraint(**other.q3c_query)
         return self
 
     def __len__(self):
@@ -128,13 +141,29 @@ class DBQueryConstraints:
     ) -> str:
         """
         Converts the list of constraints to sql
+        (cached until the constraints are modified)
+
+        :return: sql string
+        """
+        if self._parsed_constraints is None:
+            self._parsed_constraints = self._parse_constraints()
+        return self._parsed_constraints
+
+    def _parse_constraints(self) -> str:
+        """
+        Converts the list of constraints to sql
 
         :return: sql string
         """
         constraints = []
 
         if self.q3c_query is not None:
-            constraints.append(self.q3c_query)
+            constraints.append(
+                f"q3c_radial_query({self.q3c_query['ra_field_name']},"
+                f"{self.q3c_query['dec_field_name']},"
+                f"{self.q3c_query['ra']},{self.q3c_query['dec']},"
+                f"{self.q3c_query['crossmatch_radius_arcsec'] / 3600.0}) "
+            )
 
         for i, column in enumerate(self.columns):
             if self.comparison_types[i] == "between":
@@ -149,3 +178,67 @@ class DBQueryConstraints:
                 )
 
         return " AND ".join(constraints)
+
+    def get_text_clause(self) -> TextClause:
+        """
+        Converts the list of constraints to an sql clause, with the values passed
+        as bound parameters rather than written into the sql itself.
+        Queries which only differ by their values then share the same sql,
+        so postgres can reuse a prepared statement for them.
+
+        Values are bound as strings (untyped), so postgres converts them to the
+        column type just like the quoted values in :meth:`parse_constraints`.
+        The q3c position and radius are bound as floats.
+        The clause is cached until the constraints are modified.
+
+        :return: sqlalchemy text clause
+        """
+        if self._text_clause is None:
+            self._text_clause = self._get_text_clause()
+        return self._text_clause
+
+    def _get_text_clause(self) -> TextClause:
+        """
+        Converts the list of constraints to an sql clause with bound parameters
+
+        :return: sqlalchemy text clause
+        """
+        constraints = []
+        params = {}
+        bindparams: list[BindParameter] = []
+
+        if self.q3c_query is not None:
+            constraints.append(
+                f"q3c_radial_query({self.q3c_query['ra_field_name']},"
+                f"{self.q3c_query['dec_field_name']},"
+                f":q3c_ra,:q3c_dec,:q3c_radius)"
+            )
+            bindparams += [
+                bindparam("q3c_ra", float(self.q3c_query["ra"]), type_=Float),
+                bindparam("q3c_dec", float(self.q3c_query["dec"]), type_=Float),
+                bindparam(
+                    "q3c_radius",
+                    self.q3c_query["crossmatch_radius_arcsec"] / 3600.0,
+                    type_=Float,
+                ),
+            ]
+
+        for i, column in enumerate(self.columns):
+            if self.comparison_types[i] == "between":
+                constraints.append(
+                    f"{column.lower()} between :constraint_{i}_low "
+                    f"and :constraint_{i}_high"
+                )
+                params[f"constraint_{i}_low"] = str(self.accepted_values[i][0])
+                params[f"constraint_{i}_high"] = str(self.accepted_values[i][1])
+            else:
+                constraints.append(
+                    f"{column.lower()} {self.comparison_types[i]} :constraint_{i}"
+                )
+                params[f"constraint_{i}"] = str(self.accepted_values[i])
+
+        bindparams += [
+            bindparam(key, value, type_=NullType()) for key, value in params.items()
+        ]
+
+        return text(" AND ".join(constraints)).bindparams(*bindparams)
@@ -2,7 +2,11 @@
 Util functions for database interactions
 """
 
-from sqlalchemy import URL, Engine, NullPool, create_engine
+import os
+import threading
+
+from psycopg import sql
+from sqlalchemy import URL, Engine, create_engine
 
 from mirar.database.credentials import (
     DB_HOSTNAME,
@@ -12,6 +16,27 @@ from mirar.database.credentials import (
     DB_USER,
 )
 
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 20
+
+# Engines (and so their connection pools) are shared for each database/user
+_engines: dict[tuple[URL, str], Engine] = {}
+_engine_lock = threading.Lock()
+
+
+def _dispose_engines_after_fork():
+    """
+    Ensure forked processes open their own connections,
+    rather than sharing those of the parent process
+
+    :return: None
+    """
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_dispose_engines_after_fork)
+
 
 def get_engine(
     db_name: str,
@@ -22,7 +47,9 @@ def get_engine(
     db_schema: str = DB_SCHEMA,
 ) -> Engine:
     """
-    Function to create a postgres engine
+    Function to get a postgres engine.
+    Engines are created once per set of credentials, and then reused,
+    so that connections are pooled rather than opened for every query.
 
     :param db_user: User for db
     :param db_password: password for db
@@ -42,9 +69,35 @@ def get_engine(
         database=db_name,
     )
 
-    return create_engine(
-        url_object,
-        future=True,
-        poolclass=NullPool,
-        connect_args={"options": f"-csearch_path={db_schema}"},
-    )
+    key = (url_object, db_schema)
+
+    with _engine_lock:
+        if key not in _engines:
+            _engines[key] = create_engine(
+                url_object,
+                future=True,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                connect_args={"options": f"-csearch_path={db_schema}"},
+            )
+
+    return _engines[key]
+
+
+def execute_composed_statement(engine: Engine, statement: sql.Composable):
+    """
+    Function to execute and commit a statement composed with psycopg.sql,
+    e.g. DDL that cannot take bound parameters.
+    The statement is run through the sqlalchemy connection, so that the
+    transaction state of the pooled connection stays consistent.
+
+    :param engine: sqlalchemy engine
+    :param statement: composed statement
+    :return: None
+    """
+    with engine.connect() as conn:
+        query = statement.as_string(conn.connection.driver_connection)
+        # Without parameters, '%' in the statement is not treated as a placeholder
+        conn.exec_driver_sql(query, execution_options={"no_parameters": True})
+        conn.commit()
@@ -4,9 +4,10 @@ Module to create q3c extension and index on table
 
 import logging
 
-from sqlalchemy import DDL
+from psycopg import sql
+from sqlalchemy import text
 
-from mirar.database.engine import get_engine
+from mirar.database.engine import execute_composed_statement, get_engine
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +29,11 @@ def create_q3c_extension(
     """
 
     logger.debug(f"Checking if q3c index exists on table {table_name}...")
-    trig_ddl = DDL(f"SELECT indexname FROM pg_indexes WHERE tablename='{table_name}';")
+    query = text("SELECT indexname FROM pg_indexes WHERE tablename = :table_name")
     engine = get_engine(db_name=db_name)
 
     with engine.connect() as conn:
-        res = conn.execute(trig_ddl).fetchall()
+        res = conn.execute(query, {"table_name": table_name}).fetchall()
         if len(res) > 0:
             for index in res:
                 if f"{table_name}_q3c_ang2ipix_idx" in index:
@@ -40,13 +41,15 @@ def create_q3c_extension(
                     return
 
     logger.info(f"Creating q3c extension and index on table {table_name}...")
-    trig_ddl = DDL(
-        f"CREATE INDEX ON {table_name} "
-        f"(q3c_ang2ipix({ra_column_name}, {dec_column_name}));"
-        f"CLUSTER {table_name} USING {table_name}_q3c_ang2ipix_idx;"
-        f"ANALYZE {table_name};"
+    trig_ddl = sql.SQL(
+        "CREATE INDEX ON {table} (q3c_ang2ipix({ra}, {dec}));"
+        "CLUSTER {table} USING {index};"
+        "ANALYZE {table};"
+    ).format(
+        table=sql.Identifier(table_name),
+        ra=sql.Identifier(ra_column_name),
+        dec=sql.Identifier(dec_column_name),
+        index=sql.Identifier(f"{table_name}_q3c_ang2ipix_idx"),
     )
 
-    with engine.connect() as conn:
-        conn.execute(trig_ddl)
-        conn.commit()
+    execute_composed_statement(engine, trig_ddl)
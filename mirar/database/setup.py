@@ -37,7 +37,10 @@ def setup_database(db_base: Union[DeclarativeBase, BaseTable]):
         )
         pg_admin = PostgresAdmin()
         pg_admin.validate_credentials()
-        pg_admin.create_new_user(new_db_user=DB_USER, new_password=DB_PASSWORD)
+        if not pg_admin.has_user(
+            DB_USER, engine=pg_admin.get_engine(db_name="postgres")
+        ):
+            pg_admin.create_new_user(new_db_user=DB_USER, new_password=DB_PASSWORD)
         pg_user.validate_credentials()
 
     pg_user.create_db(db_name=db_name)
@@ -2,10 +2,19 @@
 Central module for all DB transaction types.
 """
 
-from mirar.database.transactions.insert import _insert_in_table
+from mirar.database.transactions.insert import _insert_in_table, _insert_many_in_table
 from mirar.database.transactions.select import (
     check_table_exists,
+    copy_select_from_table,
+    crossmatch_many_from_table,
+    exists_in_table,
     is_populated,
+    iter_select,
+    iter_select_from_table,
     select_from_table,
+    select_many_from_table,
+)
+from mirar.database.transactions.update import (
+    _update_database_entry,
+    _update_many_database_entries,
 )
-from mirar.database.transactions.update import _update_database_entry
@@ -0,0 +1,111 @@
+"""
+Module for caching the results of select queries within a process.
+
+Cached results are keyed on the table version, which is bumped whenever
+the table is modified by this process. Changes made by other processes
+are not tracked, so caching should only be used for tables which are
+not expected to be modified elsewhere during a run.
+"""
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from sqlalchemy import Select
+
+from mirar.database.base_table import BaseTable
+from mirar.database.engine import get_engine
+
+SELECT_CACHE_SIZE = 256
+
+_select_cache: OrderedDict[tuple, pd.DataFrame | bool] = OrderedDict()
+_table_versions: dict[tuple[str, str], int] = {}
+_cache_lock = threading.Lock()
+
+
+def _get_table_key(sql_table: BaseTable) -> tuple[str, str]:
+    """
+    Get a unique key for a table
+
+    :param sql_table: database SQL table
+    :return: key
+    """
+    return sql_table.db_name, sql_table.__tablename__
+
+
+def invalidate_cached_selects(sql_table: BaseTable):
+    """
+    Mark any cached results for a table as stale,
+    because the table has been modified
+
+    :param sql_table: database SQL table
+    :return: None
+    """
+    key = _get_table_key(sql_table)
+    with _cache_lock:
+        _table_versions[key] = _table_versions.get(key, 0) + 1
+
+
+def get_select_cache_key(
+    query: Select,
+    sql_table: BaseTable,
+    columns: list[str] | None = None,
+) -> tuple:
+    """
+    Get the cache key for a select query
+
+    :param query: select query
+    :param sql_table: table the query runs on
+    :param columns: columns to output
+    :return: cache key
+    """
+    compiled = query.compile(dialect=get_engine(db_name=sql_table.db_name).dialect)
+    table_key = _get_table_key(sql_table)
+    return (
+        table_key,
+        _table_versions.get(table_key, 0),
+        str(compiled),
+        tuple(sorted(compiled.params.items())),
+        None if columns is None else tuple(columns),
+    )
+
+
+def _copy_result(res: pd.DataFrame | bool) -> pd.DataFrame | bool:
+    """
+    Copy a select result, so the cached version cannot be modified
+
+    :param res: result of a select (or exists) query
+    :return: copy of result
+    """
+    if isinstance(res, pd.DataFrame):
+        return res.copy()
+    return res
+
+
+def get_cached_select(key: tuple) -> pd.DataFrame | bool | None:
+    """
+    Get a copy of a cached select result, if it exists
+
+    :param key: cache key
+    :return: result, or None if not cached
+    """
+    with _cache_lock:
+        if key not in _select_cache:
+            return None
+        _select_cache.move_to_end(key)
+        return _copy_result(_select_cache[key])
+
+
+def set_cached_select(key: tuple, res: pd.DataFrame | bool):
+    """
+    Cache a select result, dropping the least recently used one if full
+
+    :param key: cache key
+    :param res: result to cache
+    :return: None
+    """
+    with _cache_lock:
+        _select_cache[key] = _copy_result(res)
+        _select_cache.move_to_end(key)
+        while len(_select_cache) > SELECT_CACHE_SIZE:
+            _select_cache.popitem(last=False)
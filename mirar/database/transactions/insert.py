@@ -11,6 +11,7 @@ from sqlalchemy import Insert, column
 from mirar.database.base_table import BaseTable
 from mirar.database.constants import POSTGRES_DUPLICATE_PROTOCOLS
 from mirar.database.engine import get_engine
+from mirar.database.transactions.cache import invalidate_cached_selects
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ def _insert_in_table(
     new_entry: dict,
     sql_table: Type[BaseTable],
     duplicate_protocol: str = "fail",
-    returning_keys: list[str] | str = None,
+    returning_keys: list[str] | str | None = None,
 ) -> pd.DataFrame:
     """
     Export a list of fields in value dict to a database table
@@ -49,4 +50,44 @@ def _insert_in_table(
         res = conn.execute(stmt)
         conn.commit()
 
+    invalidate_cached_selects(sql_table)
+
+    return pd.DataFrame(res.fetchall())
+
+
+def _insert_many_in_table(
+    new_entries: list[dict],
+    sql_table: Type[BaseTable],
+    returning_keys: list[str] | str | None = None,
+) -> pd.DataFrame:
+    """
+    Export several entries to a database table, using a single batched INSERT
+    rather than one round trip per entry.
+    The returned rows are in the same order as the input entries.
+
+    :param new_entries: list of dictionaries to export
+    :param sql_table: table of DB to export to
+    :param returning_keys: keys to return
+    :return: dataframe of returned keys, one row per entry
+    """
+
+    assert returning_keys is not None
+
+    if not isinstance(returning_keys, list):
+        returning_keys = [returning_keys]
+
+    db_name = sql_table.db_name
+
+    stmt = Insert(sql_table).returning(
+        *[column(x) for x in returning_keys], sort_by_parameter_order=True
+    )
+
+    engine = get_engine(db_name=db_name)
+
+    with engine.connect() as conn:
+        res = conn.execute(stmt, new_entries)
+        conn.commit()
+
+    invalidate_cached_selects(sql_table)
+
     return pd.DataFrame(res.fetchall())
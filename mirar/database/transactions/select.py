@@ -2,18 +2,30 @@
 Module to select database entries
 """
 
+from collections.abc import Iterator
+from io import BytesIO
+
 import pandas as pd
-from sqlalchemy import Select, text
+from sqlalchemy import Float, Select, bindparam, exists, func, text, true
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from mirar.database.base_table import BaseTable
 from mirar.database.constraints import DBQueryConstraints
 from mirar.database.engine import get_engine
+from mirar.database.transactions.cache import (
+    get_cached_select,
+    get_select_cache_key,
+    set_cached_select,
+)
+
+SELECT_CHUNK_SIZE = 10000
 
 
 def run_select(
     query: Select,
     sql_table: BaseTable,
     columns: list[str] | None = None,
+    use_cache: bool = False,
 ) -> pd.DataFrame:
     """
     Run a select query
@@ -21,9 +33,17 @@ def run_select(
     :param query: select query to run
     :param sql_table: table to run query on
     :param columns: columns to output (default: all)
+    :param use_cache: whether to reuse results of identical earlier queries
+        (see :mod:`mirar.database.transactions.cache`)
     :return: results
     """
 
+    if use_cache:
+        cache_key = get_select_cache_key(query, sql_table, columns)
+        cached = get_cached_select(cache_key)
+        if isinstance(cached, pd.DataFrame):
+            return cached
+
     engine = get_engine(db_name=sql_table.db_name)
 
     with engine.connect() as conn:
@@ -32,6 +52,9 @@ def run_select(
     if (columns is not None) & len(res) > 0:
         res = res[columns]
 
+    if use_cache:
+        set_cached_select(cache_key, res)
+
     return res
 
 
@@ -40,6 +63,7 @@ def select_from_table(
     sql_table: BaseTable,
     output_columns: list[str] | None = None,
     max_num_results: int | None = None,
+    use_cache: bool = False,
 ) -> pd.DataFrame:
     """
     Select database entries
@@ -48,20 +72,307 @@ def select_from_table(
     :param sql_table: database SQL table
     :param output_columns: columns to output (default: all)
     :param max_num_results: maximum number of results to return (default: all)
+    :param use_cache: whether to reuse results of identical earlier queries
     :return: results
     """
-    query = Select(sql_table).where(text(db_constraints.parse_constraints()))
+    query = Select(sql_table).where(db_constraints.get_text_clause())
     if max_num_results is not None:
         query = query.limit(max_num_results)
     res = run_select(
         query=query,
         sql_table=sql_table,
         columns=output_columns,
+        use_cache=use_cache,
     )
 
     return res
 
 
+def exists_in_table(
+    db_constraints: DBQueryConstraints,
+    sql_table: BaseTable,
+    use_cache: bool = False,
+) -> bool:
+    """
+    Check whether any database entry matches the constraints.
+    The check is done server-side with SELECT EXISTS, so at most one row
+    is scanned and only a single boolean is returned.
+
+    :param db_constraints: database query constraints
+    :param sql_table: database SQL table
+    :param use_cache: whether to reuse results of identical earlier checks
+        (see :mod:`mirar.database.transactions.cache`)
+    :return: True if a matching entry exists, False otherwise
+    """
+    query = Select(Select(sql_table).where(db_constraints.get_text_clause()).exists())
+
+    if use_cache:
+        cache_key = get_select_cache_key(query, sql_table)
+        cached = get_cached_select(cache_key)
+        if isinstance(cached, bool):
+            return cached
+
+    engine = get_engine(db_name=sql_table.db_name)
+
+    with engine.connect() as conn:
+        res = bool(conn.execute(query).scalar())
+
+    if use_cache:
+        set_cached_select(cache_key, res)
+
+    return res
+
+
+def copy_select_from_table(
+    db_constraints: DBQueryConstraints,
+    sql_table: BaseTable,
+    output_columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Select database entries in bulk, using COPY ... TO STDOUT.
+    Postgres streams the rows as CSV, which is parsed by pandas in one go,
+    rather than decoding and converting each row in python.
+    This is much faster for large downloads, but apart from float columns,
+    column types are inferred from the CSV text (e.g. timestamps are
+    returned as strings).
+
+    :param db_constraints: database query constraints
+    :param sql_table: database SQL table
+    :param output_columns: columns to output (default: all)
+    :return: results
+    """
+    columns = sql_table.__table__.c
+    if output_columns is not None:
+        columns = [columns[x] for x in output_columns]
+
+    query = Select(*columns).where(db_constraints.get_text_clause())
+
+    engine = get_engine(db_name=sql_table.db_name)
+    compiled = query.compile(dialect=engine.dialect)
+
+    buffer = BytesIO()
+
+    with engine.connect() as conn:
+        pg_conn = conn.connection.driver_connection
+        assert pg_conn is not None
+        with pg_conn.cursor() as cursor:
+            with cursor.copy(
+                f"COPY ({compiled}) TO STDOUT WITH (FORMAT CSV, HEADER)",
+                compiled.params,
+            ) as copy:
+                for block in copy:
+                    buffer.write(block)
+
+    buffer.seek(0)
+
+    # Postgres writes whole floats without a decimal point
+    float_columns = {x.name: float for x in columns if isinstance(x.type, Float)}
+
+    return pd.read_csv(buffer, dtype=float_columns)
+
+
+def iter_select(
+    query: Select,
+    sql_table: BaseTable,
+    columns: list[str] | None = None,
+    chunksize: int = SELECT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Run a select query, yielding the results in chunks.
+    A server-side cursor is used, so only one chunk of rows is held
+    in memory at a time rather than the full result set.
+
+    :param query: select query to run
+    :param sql_table: table to run query on
+    :param columns: columns to output (default: all)
+    :param chunksize: maximum number of rows per chunk
+    :return: iterator of results
+    """
+
+    engine = get_engine(db_name=sql_table.db_name)
+
+    with engine.connect().execution_options(
+        stream_results=True, max_row_buffer=chunksize
+    ) as conn:
+        for res in pd.read_sql(query, conn, columns=columns, chunksize=chunksize):
+            if (columns is not None) & (len(res) > 0):
+                res = res[columns]
+            yield res
+
+
+def iter_select_from_table(
+    db_constraints: DBQueryConstraints,
+    sql_table: BaseTable,
+    output_columns: list[str] | None = None,
+    chunksize: int = SELECT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Select database entries, yielding the results in chunks
+
+    :param db_constraints: database query constraints
+    :param sql_table: database SQL table
+    :param output_columns: columns to output (default: all)
+    :param chunksize: maximum number of rows per chunk
+    :return: iterator of results
+    """
+    query = Select(sql_table).where(db_constraints.get_text_clause())
+    yield from iter_select(
+        query=query,
+        sql_table=sql_table,
+        columns=output_columns,
+        chunksize=chunksize,
+    )
+
+
+def select_many_from_table(  # pylint: disable=too-many-locals
+    db_constraints: list[DBQueryConstraints],
+    sql_table: BaseTable,
+    output_columns: list[str] | None = None,
+    max_num_results: int | None = None,
+    use_cache: bool = False,
+) -> list[pd.DataFrame]:
+    """
+    Run several independent select queries on the same table.
+    The queries are sent in a single psycopg pipeline on one connection,
+    so they do not each wait for a full round trip to the database.
+
+    :param db_constraints: list of database query constraints, one per query
+    :param sql_table: database SQL table
+    :param output_columns: columns to output (default: all)
+    :param max_num_results: maximum number of results to return per query
+    :param use_cache: whether to reuse results of identical earlier queries
+    :return: list of results, one per query
+    """
+    queries = []
+    for constraints in db_constraints:
+        query = Select(sql_table).where(constraints.get_text_clause())
+        if max_num_results is not None:
+            query = query.limit(max_num_results)
+        queries.append(query)
+
+    results: dict[int, pd.DataFrame] = {}
+
+    if use_cache:
+        cache_keys = [
+            get_select_cache_key(query, sql_table, output_columns) for query in queries
+        ]
+        for i, key in enumerate(cache_keys):
+            cached = get_cached_select(key)
+            if isinstance(cached, pd.DataFrame):
+                results[i] = cached
+
+    missing = [i for i in range(len(queries)) if i not in results]
+
+    if len(missing) == 0:
+        return [results[i] for i in range(len(queries))]
+
+    engine = get_engine(db_name=sql_table.db_name)
+
+    with engine.connect() as conn:
+        pg_conn = conn.connection.driver_connection
+        assert pg_conn is not None
+
+        cursors = []
+        with pg_conn.pipeline():
+            for i in missing:
+                compiled = queries[i].compile(dialect=engine.dialect)
+                cursor = pg_conn.cursor()
+                cursor.execute(str(compiled), compiled.params)
+                cursors.append(cursor)
+
+        for i, cursor in zip(missing, cursors):
+            res = pd.DataFrame.from_records(
+                cursor.fetchall(),
+                columns=[x.name for x in cursor.description],
+                coerce_float=True,
+            )
+            cursor.close()
+
+            if (output_columns is not None) & (len(res) > 0):
+                res = res[output_columns]
+
+            if use_cache:
+                set_cached_select(cache_keys[i], res)
+
+            results[i] = res
+
+    return [results[i] for i in range(len(queries))]
+
+
+def crossmatch_many_from_table(  # pylint: disable=too-many-arguments,too-many-locals
+    ra: list[float],
+    dec: list[float],
+    crossmatch_radius_arcsec: float,
+    sql_table: BaseTable,
+    ra_field_name: str = "ra",
+    dec_field_name: str = "dec",
+    db_constraints: DBQueryConstraints | None = None,
+    output_columns: list[str] | None = None,
+    max_num_results: int | None = None,
+) -> list[pd.DataFrame]:
+    """
+    Spatially crossmatch many positions against a table in a single query.
+    The positions are sent as two arrays, unnested into a set of targets
+    server-side, and joined to the table with q3c_join (using the q3c index).
+
+    :param ra: ra of each position
+    :param dec: dec of each position
+    :param crossmatch_radius_arcsec: crossmatch radius in arcsec
+    :param sql_table: database SQL table
+    :param ra_field_name: ra field name in database
+    :param dec_field_name: dec field name in database
+    :param db_constraints: additional constraints, applied to every position
+    :param output_columns: columns to output (default: all)
+    :param max_num_results: maximum number of results to return per position
+    :return: list of results, one per position
+    """
+    assert len(ra) == len(dec)
+
+    targets = (
+        func.unnest(
+            bindparam("target_ra", [float(x) for x in ra], type_=ARRAY(Float)),
+            bindparam("target_dec", [float(x) for x in dec], type_=ARRAY(Float)),
+        )
+        .table_valued("target_ra", "target_dec", with_ordinality="target_idx")
+        .render_derived()
+    )
+
+    columns = sql_table.__table__.c
+    if output_columns is not None:
+        columns = [columns[x] for x in output_columns]
+
+    matches = Select(*columns).where(
+        func.q3c_join(
+            targets.c.target_ra,
+            targets.c.target_dec,
+            sql_table.__table__.c[ra_field_name],
+            sql_table.__table__.c[dec_field_name],
+            crossmatch_radius_arcsec / 3600.0,
+        )
+    )
+    if db_constraints is not None:
+        matches = matches.where(db_constraints.get_text_clause())
+    if max_num_results is not None:
+        matches = matches.limit(max_num_results)
+    lateral_matches = matches.lateral("matches")
+
+    query = Select(targets.c.target_idx, lateral_matches).join(lateral_matches, true())
+
+    engine = get_engine(db_name=sql_table.db_name)
+
+    with engine.connect() as conn:
+        res = pd.read_sql(query, conn)
+
+    empty = res.iloc[:0].drop(columns="target_idx")
+    groups = {
+        idx: group.drop(columns="target_idx").reset_index(drop=True)
+        for idx, group in res.groupby("target_idx")
+    }
+
+    # Ordinality counts from 1
+    return [groups.get(i + 1, empty.copy()) for i in range(len(ra))]
+
+
 def check_table_exists(
     sql_table: BaseTable,
 ) -> bool:
@@ -77,14 +388,15 @@ def check_table_exists(
     with engine.connect() as conn:
         res = conn.execute(
             text(
-                f"""
+                """
                 SELECT EXISTS (
                     SELECT FROM information_schema.tables
                     WHERE  table_schema = 'public'
-                    AND    table_name   = '{sql_table.__tablename__}'
+                    AND    table_name   = :table_name
                 );
                 """
-            )
+            ),
+            {"table_name": sql_table.__tablename__},
         )
 
     return res.fetchone()[0]
@@ -103,14 +415,6 @@ def is_populated(
     engine = get_engine(db_name=sql_table.db_name)
 
     with engine.connect() as conn:
-        res = conn.execute(
-            text(
-                f"""
-                SELECT EXISTS (
-                    SELECT FROM {sql_table.__tablename__}
-                );
-                """
-            )
-        )
+        res = conn.execute(Select(exists().select_from(sql_table)))
 
     return res.fetchone()[0]
@@ -2,11 +2,12 @@
 Module to update database entries
 """
 
-from sqlalchemy import text, update
+from sqlalchemy import bindparam, update
 
 from mirar.database.base_table import BaseTable
 from mirar.database.constraints import DBQueryConstraints
 from mirar.database.engine import get_engine
+from mirar.database.transactions.cache import invalidate_cached_selects
 
 
 def _update_database_entry(
@@ -28,9 +29,57 @@ def _update_database_entry(
     with engine.connect() as conn:
         stmt = (
             update(sql_table)
-            .where(text(db_constraints.parse_constraints()))
+            .where(db_constraints.get_text_clause())
             .values(**update_dict)
         )
 
         conn.execute(stmt)
         conn.commit()
+
+    invalidate_cached_selects(sql_table)
+
+
+def _update_many_database_entries(
+    update_dicts: list[dict],
+    key_names: str | list[str],
+    sql_table: BaseTable,
+):
+    """
+    Update many database entries, each identified by the values of key_names,
+    using a single executemany call on one connection
+
+    :param update_dicts: dictionaries of key values and values to update
+    :param key_names: names of the columns identifying each entry
+    :param sql_table: database SQL table
+    :return: None
+    """
+    if len(update_dicts) == 0:
+        return
+
+    if not isinstance(key_names, list):
+        key_names = [key_names]
+
+    update_names = [x for x in update_dicts[0].keys() if x not in key_names]
+
+    columns = sql_table.__table__.c
+
+    stmt = update(sql_table)
+    for key in key_names:
+        stmt = stmt.where(columns[key] == bindparam(f"key_{key}"))
+    stmt = stmt.values({key: bindparam(f"new_{key}") for key in update_names})
+
+    params = [
+        {
+            **{f"key_{key}": entry[key] for key in key_names},
+            **{f"new_{key}": entry[key] for key in update_names},
+        }
+        for entry in update_dicts
+    ]
+
+    engine = get_engine(db_name=sql_table.db_name)
+
+    with engine.connect() as conn:
+        conn.execute(stmt, params)
+        conn.commit()
+
+    invalidate_cached_selects(sql_table)
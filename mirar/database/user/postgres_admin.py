@@ -2,7 +2,7 @@
 Postgres Admin class
 """
 
-from sqlalchemy.sql.ddl import DDL
+from psycopg import sql
 
 from mirar.database.credentials import (
     ADMIN_PASSWORD,
@@ -13,10 +13,21 @@ from mirar.database.credentials import (
     PG_ADMIN_PWD_KEY,
     PG_ADMIN_USER_KEY,
 )
-from mirar.database.engine import get_engine
+from mirar.database.engine import execute_composed_statement
 from mirar.database.user.postgres_user import PostgresUser
 
 
+def fold_identifier(name: str) -> sql.Identifier:
+    """
+    Quote a name as an identifier, after folding it to lower case
+    as Postgres does for unquoted names
+
+    :param name: name of role, schema or extension
+    :return: quoted identifier
+    """
+    return sql.Identifier(name.lower())
+
+
 class PostgresAdmin(PostgresUser):
     """
     An Admin postgres user, with additional functionality for creating new users
@@ -49,19 +60,11 @@ class PostgresAdmin(PostgresUser):
         :param new_password: new user password
         :return: None
         """
-        engine = get_engine(
-            db_name="postgres",
-            db_user=self.db_user,
-            db_password=self.db_password,
-            db_hostname=self.db_hostname,
-            db_port=self.db_port,
-        )
-        with engine.connect() as conn:
-            command = DDL(
-                f"CREATE ROLE {new_db_user} WITH password '{new_password}' CREATEDB NOCREATEROLE LOGIN;"
-            )
-            conn.execute(command)
-            conn.commit()
+        engine = self.get_engine(db_name="postgres")
+        command = sql.SQL(
+            "CREATE ROLE {user} WITH PASSWORD {password} CREATEDB NOCREATEROLE LOGIN;"
+        ).format(user=fold_identifier(new_db_user), password=sql.Literal(new_password))
+        execute_composed_statement(engine, command)
 
     def create_extension(self, extension_name: str, db_name: str):
         """
@@ -71,19 +74,15 @@ class PostgresAdmin(PostgresUser):
         :param db_name: name of database to create extension in
         :return: None
         """
-        engine = get_engine(
-            db_name=db_name,
-            db_user=self.db_user,
-            db_password=self.db_password,
-            db_hostname=self.db_hostname,
-            db_port=self.db_port,
+        engine = self.get_engine(db_name=db_name)
+        command = sql.SQL("CREATE EXTENSION IF NOT EXISTS {extension};").format(
+            extension=fold_identifier(extension_name)
         )
-        with engine.connect() as conn:
-            command = DDL(f"CREATE EXTENSION IF NOT EXISTS {extension_name};")
-            conn.execute(command)
-            conn.commit()
+        execute_composed_statement(engine, command)
 
-        assert self.has_extension(extension_name=extension_name, db_name=db_name)
+        assert self.has_extension(
+            extension_name=extension_name.lower(), db_name=db_name
+        )
 
     def create_schema(self, schema_name: str, db_name: str, db_user: str):
         """
@@ -94,18 +93,10 @@ class PostgresAdmin(PostgresUser):
         :param db_user: name of schema owner
         :return: None
         """
-        engine = get_engine(
-            db_name=db_name,
-            db_user=self.db_user,
-            db_password=self.db_password,
-            db_hostname=self.db_hostname,
-            db_port=self.db_port,
-        )
-        with engine.connect() as conn:
-            command = DDL(
-                f"CREATE SCHEMA IF NOT EXISTS {schema_name} AUTHORIZATION {db_user};"
-            )
-            conn.execute(command)
-            conn.commit()
-
-        assert self.has_schema(schema_name=schema_name, db_name=db_name)
+        engine = self.get_engine(db_name=db_name)
+        command = sql.SQL(
+            "CREATE SCHEMA IF NOT EXISTS {schema} AUTHORIZATION {user};"
+        ).format(schema=fold_identifier(schema_name), user=fold_identifier(db_user))
+        execute_composed_statement(engine, command)
+
+        assert self.has_schema(schema_name=schema_name.lower(), db_name=db_name)
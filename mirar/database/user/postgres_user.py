@@ -4,8 +4,8 @@ Module containing postgres util functions
 
 import logging
 
-from sqlalchemy import text
-from sqlalchemy_utils import create_database, database_exists
+from sqlalchemy import Engine, text
+from sqlalchemy_utils import create_database
 
 from mirar.database.credentials import (
     DB_HOSTNAME,
@@ -44,6 +44,21 @@ class PostgresUser:
         self.db_name = db_name
         self.db_port = db_port
 
+    def get_engine(self, db_name: str | None = None) -> Engine:
+        """
+        Get the (shared) engine for this user
+
+        :param db_name: name of database (default: the user's database)
+        :return: sqlalchemy engine
+        """
+        return get_engine(
+            db_name=db_name if db_name is not None else self.db_name,
+            db_user=self.db_user,
+            db_password=self.db_password,
+            db_hostname=self.db_hostname,
+            db_port=self.db_port,
+        )
+
     def validate_credentials(self):
         """
         Checks that user credentials exist
@@ -66,15 +81,7 @@ class PostgresUser:
             logger.error(err)
             raise DataBaseError(err)
 
-        engine = get_engine(
-            db_name=self.db_name,
-            db_user=self.db_user,
-            db_password=self.db_password,
-            db_hostname=self.db_hostname,
-            db_port=self.db_port,
-        )
-
-        with engine.connect() as conn:
+        with self.get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
 
     @staticmethod
@@ -87,10 +94,74 @@ class PostgresUser:
         """
 
         engine = get_engine(db_name=db_name)
-        if not database_exists(engine.url):
+        if not PostgresUser.has_database(db_name=db_name):
             create_database(engine.url)
 
-        assert database_exists(engine.url)
+        assert PostgresUser.has_database(db_name=db_name)
+
+    @staticmethod
+    def has_user(user_name: str, engine: Engine | None = None) -> bool:
+        """
+        Function to check if a postgres user (role) exists.
+        The name is folded to lower case, as for roles created by create_new_user.
+
+        :param user_name: name of user to check
+        :param engine: engine to run the check with (default: the default user's
+            engine for the 'postgres' database). Pass another user's engine if
+            the user being checked may not be able to log in yet.
+        :return: boolean user exists
+        """
+        if engine is None:
+            engine = get_engine(db_name="postgres")
+        with engine.connect() as conn:
+            command = text(
+                "SELECT EXISTS "
+                "(SELECT 1 FROM pg_catalog.pg_roles WHERE rolname = :name)"
+            )
+            return bool(conn.execute(command, {"name": user_name.lower()}).scalar())
+
+    @staticmethod
+    def has_database(db_name: str) -> bool:
+        """
+        Function to check if a database exists
+
+        :param db_name: name of database to check
+        :return: boolean database exists
+        """
+        engine = get_engine(db_name="postgres")
+        with engine.connect() as conn:
+            command = text(
+                "SELECT EXISTS "
+                "(SELECT 1 FROM pg_catalog.pg_database WHERE datname = :name)"
+            )
+            return bool(conn.execute(command, {"name": db_name}).scalar())
+
+    @staticmethod
+    def has_table(
+        table_name: str,
+        db_name: str,
+        schema_name: str = "public",
+    ) -> bool:
+        """
+        Function to check if a table exists
+
+        :param table_name: name of table to check
+        :param db_name: name of database to check
+        :param schema_name: name of schema containing the table
+        :return: boolean table exists
+        """
+        engine = get_engine(db_name=db_name)
+        with engine.connect() as conn:
+            command = text(
+                "SELECT EXISTS (SELECT 1 FROM pg_catalog.pg_class c "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :name AND n.nspname = :schema)"
+            )
+            return bool(
+                conn.execute(
+                    command, {"name": table_name, "schema": schema_name}
+                ).scalar()
+            )
 
     @staticmethod
     def has_extension(
@@ -108,13 +179,10 @@ class PostgresUser:
         engine = get_engine(db_name=db_name)
         with engine.connect() as conn:
             command = text(
-                f"SELECT extname FROM pg_extension WHERE extname='{extension_name}'"
+                "SELECT EXISTS "
+                "(SELECT 1 FROM pg_catalog.pg_extension WHERE extname = :name)"
             )
-            res = conn.execute(command).all()
-
-        assert len(res) <= 1, "More than one extension found"
-
-        return len(res) == 1
+            return bool(conn.execute(command, {"name": extension_name}).scalar())
 
     @staticmethod
     def has_schema(
@@ -132,10 +200,7 @@ class PostgresUser:
         engine = get_engine(db_name=db_name)
         with engine.connect() as conn:
             command = text(
-                f"SELECT schema_name FROM information_schema.schemata WHERE schema_name='{schema_name}'"
+                "SELECT EXISTS (SELECT 1 FROM information_schema.schemata "
+                "WHERE schema_name = :name)"
             )
-            res = conn.execute(command).all()
-
-        assert len(res) <= 1, "More than one schema found"
-
-        return len(res) == 1
+            return bool(conn.execute(command, {"name": schema_name}).scalar())
@@ -12,17 +12,25 @@ from mirar.database.engine import get_engine
 logger = logging.getLogger(__name__)
 
 
+# Sequence keys found per (table, database), as they do not change once created
+_sequence_keys: dict[tuple[str, str], tuple] = {}
+
+
 def get_sequence_key_names_from_table(
     db_table: str,
     db_name: str,
 ) -> list:
     """
-    Gets sequence keys of db table
+    Gets sequence keys of db table.
+    The database is only queried until any keys are found for the table.
 
     :param db_table: database table to use
     :param db_name: database name
-    :return: numpy array of keys
+    :return: list of keys
     """
+    if (db_table, db_name) in _sequence_keys:
+        return list(_sequence_keys[(db_table, db_name)])
+
     engine = get_engine(db_name=db_name)
     with engine.connect() as conn:
         res = conn.execute(
@@ -34,4 +42,7 @@ def get_sequence_key_names_from_table(
     seq_columns = np.array([x.split("_")[1] for x in sequences])
     table_sequence_keys = seq_columns[(seq_tables == db_table)]
 
+    if len(table_sequence_keys) > 0:
+        _sequence_keys[(db_table, db_name)] = tuple(table_sequence_keys)
+
     return list(table_sequence_keys)
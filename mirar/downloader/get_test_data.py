@@ -4,6 +4,7 @@ Module handling the downloading of test data
 
 import logging
 import os
+from functools import cache
 from pathlib import Path
 
 from mirar.paths import PACKAGE_NAME, base_code_dir
@@ -48,6 +49,7 @@ def require_test_data():
     :return: None
     """
     os.environ[NEED_TEST_DATA] = "True"
+    get_test_data_dir.cache_clear()
 
 
 def update_test_data():
@@ -85,9 +87,11 @@ def update_test_data():
     os.environ[COMPLETED_CHECK_BOOL] = "True"
 
 
+@cache
 def get_test_data_dir() -> Path:
     """
-    Returns the local path of the test data directory
+    Returns the local path of the test data directory.
+    The result is cached, and reset whenever test data is required.
 
     :return: None
     """
@@ -68,8 +68,9 @@ def save_hdu_as_fits(
     :param overwrite: boolean whether to overwrite
     :return: None
     """
-    hdu.verify("silentfix+exception")
-    hdu.writeto(path, overwrite=overwrite)
+    # Verify as part of the write, rather than separately beforehand,
+    # as otherwise every header card is verified twice
+    hdu.writeto(path, overwrite=overwrite, output_verify="silentfix+exception")
 
 
 def save_to_path(
@@ -164,7 +165,7 @@ def open_fits(path: str | Path) -> tuple[np.ndarray, fits.Header]:
     if BASE_NAME_KEY not in header:
         header[BASE_NAME_KEY] = Path(path).name
 
-    if RAW_IMG_KEY not in header.keys():
+    if RAW_IMG_KEY not in header:
         header[RAW_IMG_KEY] = path.as_posix()
 
     return data, header
@@ -254,7 +255,7 @@ def combine_mef_extension_file_headers(
     zipped = list(zip(primary_header.values(), primary_header.comments))
 
     for k in ["XTENSION", "BITPIX"]:
-        if k in extension_header.keys():
+        if k in extension_header:
             del extension_header[k]
 
     # append primary_header to hdrext
@@ -263,7 +264,7 @@ def combine_mef_extension_file_headers(
         comment = zipped[count][1]
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=AstropyWarning)
-            if key not in extension_header.keys():
+            if key not in extension_header:
                 extension_header.append((key, value, comment))
 
     return extension_header
@@ -394,8 +395,8 @@ def check_image_has_core_fields(img: Image):
     :return: None
     """
     for key in core_fields:
-        if key not in img.keys():
-            if BASE_NAME_KEY in img.keys():
+        if key not in img:
+            if BASE_NAME_KEY in img:
                 msg = f"({img[BASE_NAME_KEY]}) "
                 err = (
                     f"New image {msg}is missing the core field {key}. "
@@ -14,10 +14,16 @@ from queue import Queue
 from threading import Thread
 from typing import Optional
 
-import numpy as np
 from astropy import units as u
 from astropy.time import Time
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_MOVED,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 from mirar.data import Dataset, Image, ImageBatch
@@ -55,20 +61,42 @@ class ImageTimeoutError(ProcessorError):
     """Timeout for downloading an image has been exceeded."""
 
 
+# inotify reports when a file is closed after writing, so on linux new files
+# are only queued once complete. Elsewhere, they are queued once created.
+CLOSE_EVENTS_AVAILABLE = sys.platform.startswith("linux")
+
+
 class NewImageHandler(FileSystemEventHandler):
-    """Class to watch a directory, and add newly-created files to a queue."""
+    """Class to watch a directory, and add new files to a queue."""
+
+    # Only these events are requested from the OS, e.g. no inotify IN_MODIFY
+    # events are generated for every write while a file is being transferred
+    if CLOSE_EVENTS_AVAILABLE:
+        event_types = [FileClosedEvent, FileMovedEvent]
+    else:
+        event_types = [FileCreatedEvent, FileMovedEvent]
 
     def __init__(self, queue):
         FileSystemEventHandler.__init__(self)
         self.queue = queue
 
     def on_created(self, event):
-        if event.event_type == "created":
+        if not CLOSE_EVENTS_AVAILABLE:
             self.queue.put(event)
 
+    def on_closed(self, event):
+        self.queue.put(event)
+
+    def on_moved(self, event):
+        # Files renamed into the directory (e.g. by rsync) are already complete
+        self.queue.put(event)
+
 
 FILE_TRANSFER_TIMEOUT_S = 60.0
 
+# Number of threads waiting for and loading new files, which is I/O bound
+N_LOAD_WORKERS = 2
+
 
 class Monitor:
     """Class to 'monitor' a directory, watching for newly created files.
@@ -131,6 +159,8 @@ class Monitor:
         self.log_path = self.configure_logs(log_level)
         self.error_path = self.pipeline.get_error_output_path()
         self.error_path.unlink(missing_ok=True)  # Do not just append log to the old one
+        self.error_log_lock = threading.Lock()
+        self.n_logged_errors = None  # Always write the error log the first time
 
         self.final_postprocess_hours = float(final_postprocess_hours) * u.hour
         logger.info(f"Will terminate after {final_postprocess_hours} hours.")
@@ -146,8 +176,8 @@ class Monitor:
             )
             self.midway_postprocess_hours = 0.95 * self.final_postprocess_hours
 
-        check_email = np.sum([x is not None for x in [email_recipients, email_sender]])
-        if np.sum(check_email) == 1:
+        n_email = int(email_sender is not None) + int(email_recipients is not None)
+        if n_email == 1:
             err = (
                 "In order to send emails, you must specify both a sender"
                 f" and a recipient. \n In this case, sender is {email_sender} "
@@ -156,7 +186,7 @@ class Monitor:
             logger.error(err)
             raise ValueError(err)
 
-        if np.sum(check_email) == 2:
+        if n_email == 2:
             logger.info(
                 f"Will send an email summary after "
                 f"{self.midway_postprocess_hours} hours."
@@ -177,6 +207,7 @@ class Monitor:
         self.queue_t = None
 
         self.processed_science_images = []
+        self.processed_science_basenames: list[str] = []
         self.processed_cal_images = []
         self.failed_images = []
 
@@ -208,9 +239,11 @@ class Monitor:
 
     def get_cals(self) -> ImageBatch:
         """
-        Returns a copy of the calibration images (new and archival)
+        Returns a copy of the calibration images (new and archival).
+        In cache mode, the copies share the cached image data until modified,
+        so this does not copy the pixel data.
 
-        :return:
+        :return: copy of the calibration images
         """
         return copy.deepcopy(self.new_cals + self.archival_cals)
 
@@ -298,32 +331,45 @@ class Monitor:
             dir_root=self.pipeline.night_sub_dir,
         )
 
-        try:
-            os.makedirs(os.path.dirname(log_output_path))
-        except OSError:
-            pass
+        os.makedirs(os.path.dirname(log_output_path), exist_ok=True)
 
         log = logging.getLogger("mirar")
 
-        handler = logging.FileHandler(log_output_path)
-        # handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s: %(name)s [l %(lineno)d] - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        log.addHandler(handler)
+        # Handlers are only added once, even if several monitors are created,
+        # so that each message is not written multiple times
+        if not any(
+            isinstance(x, logging.FileHandler)
+            and x.baseFilename == os.path.abspath(log_output_path)
+            for x in log.handlers
+        ):
+            handler = logging.FileHandler(log_output_path)
+            formatter = logging.Formatter(
+                "%(asctime)s: %(name)s [l %(lineno)d] - %(levelname)s - %(message)s"
+            )
+            handler.setFormatter(formatter)
+            log.addHandler(handler)
         log.setLevel(log_level)
 
         root = logging.getLogger()
         root.setLevel(log_level)
 
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(log_level)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        root.addHandler(handler)
+        stdout_handlers = [
+            x
+            for x in root.handlers
+            if isinstance(x, logging.StreamHandler)
+            and not isinstance(x, logging.FileHandler)
+            and x.stream is sys.stdout
+        ]
+        if not stdout_handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+            handler.setFormatter(formatter)
+            root.addHandler(handler)
+            stdout_handlers = [handler]
+        for handler in stdout_handlers:
+            handler.setLevel(log_level)
 
         logger.info(f"Logging level: {self.log_level}, saving log to {log_output_path}")
         return log_output_path
@@ -333,27 +379,61 @@ class Monitor:
 
         :return: None
         """
-        # create queue
+        # create queues
         monitor_queue = Queue()
 
+        # Loaded images wait here for a reduction worker. The queue is bounded,
+        # so loading pauses (rather than filling memory) when reduction lags.
+        reduce_queue = Queue(maxsize=2 * max_n_cpu)
+
         workers = []
 
-        n_cpu = max_n_cpu
+        for _ in range(N_LOAD_WORKERS):
+            workers.append(
+                Thread(
+                    target=self.process_load_queue,
+                    args=(monitor_queue, reduce_queue),
+                    daemon=True,
+                )
+            )
 
-        for _ in range(n_cpu):
-            # Set up a worker thread to process database load
-            worker = Thread(target=self.process_load_queue, args=(monitor_queue,))
-            worker.daemon = True
+        for _ in range(max_n_cpu):
+            workers.append(
+                Thread(
+                    target=self.process_reduce_queue,
+                    args=(reduce_queue,),
+                    daemon=True,
+                )
+            )
+
+        for worker in workers:
             worker.start()
 
-            workers.append(worker)
+        midway_wait = self.midway_postprocess_hours - (Time.now() - self.t_start)
+        midway_timer = threading.Timer(
+            max(midway_wait.to(u.second).value, 0.0), self.midway_postprocess
+        )
+        midway_timer.daemon = True
+        midway_timer.start()
 
         # setup watchdog to monitor directory for trigger files
         logger.info(f"Watching {self.raw_image_directory}")
 
         event_handler = NewImageHandler(monitor_queue)
-        observer = Observer()
-        observer.schedule(event_handler, path=str(self.raw_image_directory))
+        if CLOSE_EVENTS_AVAILABLE:
+            # Report files moved in from other directories as moves, not creations
+            observer = Observer(generate_full_events=True)
+        else:
+            observer = Observer()
+        try:
+            observer.schedule(
+                event_handler,
+                path=str(self.raw_image_directory),
+                event_filter=event_handler.event_types,
+            )
+        except TypeError:
+            # watchdog<4 cannot filter events, so the handler ignores the others
+            observer.schedule(event_handler, path=str(self.raw_image_directory))
         observer.start()
 
         try:
@@ -361,6 +441,7 @@ class Monitor:
                 time.sleep(2)
         finally:
             logger.info("No longer waiting for new images.")
+            midway_timer.cancel()
             observer.stop()
             observer.join()
             self.postprocess()
@@ -369,8 +450,17 @@ class Monitor:
     def update_error_log(self):
         """Function to overwrite the error file with the latest version.
         The error summary is cumulative, so this just updates the file.
+        The file is only rewritten if there have been new errors since
+        the last update.
         """
-        self.errorstack.summarise_error_stack(verbose=True, output_path=self.error_path)
+        with self.error_log_lock:
+            n_errors = len(self.errorstack.get_all_reports())
+            if n_errors == self.n_logged_errors:
+                return
+            self.errorstack.summarise_error_stack(
+                verbose=True, output_path=self.error_path
+            )
+            self.n_logged_errors = n_errors
 
     def postprocess(self):
         """Function to be run after some realtime postprocessing has been run.
@@ -397,14 +487,12 @@ class Monitor:
 
             postprocess_config += self.pipeline.postprocess_configuration(
                 errorstack=self.errorstack,
-                processed_images=[
-                    os.path.basename(x) for x in self.processed_science_images
-                ],
+                processed_images=list(self.processed_science_basenames),
                 selected_configurations=self.postprocess_configurations,
             )
 
             protected_key = "_monitor"
-            while protected_key in self.pipeline.all_pipeline_configurations.keys():
+            while protected_key in self.pipeline.all_pipeline_configurations:
                 protected_key += "_2"
 
             self.pipeline.add_configuration(protected_key, postprocess_config)
@@ -422,177 +510,209 @@ class Monitor:
             self.errorstack += errorstack
             self.update_error_log()
 
-    def process_load_queue(self, queue: Queue):
-        """This is the worker thread function. It is run as a daemon
-        threads that only exit when the main thread ends.
+    def midway_postprocess(self):
+        """Function to run the midway postprocessing, and send a summary email
+        if configured to do so. This is run once, by a timer started
+        in :meth:`process_realtime`, after the midway postprocess time.
+
+        :return: None
+        """
+        self.midway_postprocess_complete = True
+        logger.info("Postprocess time!")
+        self.postprocess()
+        if self.email_to_send:
+            logger.info(
+                f"More than {self.midway_postprocess_hours} "
+                f"hours have elapsed. Sending summary email."
+            )
+            self.summarise_errors(errorstack=self.errorstack)
+
+    def process_load_queue(self, queue: Queue, reduce_queue: Queue):
+        """This is the loading worker thread function. It is run as a daemon
+        thread that only exits when the main thread ends.
+        It waits for each new file to be fully transferred, loads it,
+        and passes the images on for reduction.
 
-        Args
-        ==========
-          queue:  Queue() object
+        :param queue: queue of new file events
+        :param reduce_queue: bounded queue of loaded images to reduce
+        :return: None
         """
         while True:
-            if Time.now() - self.t_start > self.midway_postprocess_hours:
-                if not self.midway_postprocess_complete:
-                    self.midway_postprocess_complete = True
-                    logger.info("Postprocess time!")
-                    self.postprocess()
-                    if self.email_to_send:
-                        logger.info(
-                            f"More than {self.midway_postprocess_hours} "
-                            f"hours have elapsed. Sending summary email."
+            # Block until a new file arrives, rather than polling the queue
+            event = queue.get()
+
+            if event.event_type == EVENT_TYPE_MOVED:
+                file_path = event.dest_path
+            else:
+                file_path = event.src_path
+
+            if file_path[-5:] == ".fits":
+                # Closed or moved files are complete. Newly-created ones
+                # may not be, so verify the file transfer (e.g. for rsync)
+                transfer_done = event.event_type != EVENT_TYPE_CREATED
+                t_start = Time.now()
+
+                while not transfer_done:
+                    transfer_done = check_file_is_complete(file_path)
+
+                    wait = (Time.now() - t_start).to(u.second).value
+
+                    # If a corrupt image comes in, give up eventually
+                    if wait > FILE_TRANSFER_TIMEOUT_S:
+                        err = (
+                            f"File {file_path} has not been fully "
+                            f"transferred after 60 seconds. "
+                            f"It is probably corrupted. Skipping this file."
                         )
-                        self.summarise_errors(errorstack=self.errorstack)
+                        logger.error(err)
+                        try:
+                            raise ImageTimeoutError(err)
+                        except ImageTimeoutError as exc:
+                            err_report = ErrorReport(
+                                exc, "monitor", contents=[file_path]
+                            )
+                            self.errorstack.add_report(err_report)
+                        self.failed_images.append(file_path)
+                        break
+
+                    if not transfer_done:
+                        msg = (
+                            f"Seems like the file {file_path} is not "
+                            f"fully transferred. Waited for {wait:.1f} seconds so far, "
+                            f"and will time out after {FILE_TRANSFER_TIMEOUT_S} s. "
+                            f"Will try again."
+                        )
+                        logger.info(msg)
+                        # self.update_error_log()
+                        time.sleep(3)
+
+                if transfer_done:
+                    try:
+                        img_batch = self.pipeline.load_raw_image(file_path)
+                    # The monitor should never crash, as in process_reduce_queue
+                    except Exception as exc:  # pylint: disable=broad-except
+                        err_report = ErrorReport(exc, "monitor", contents=[file_path])
+                        self.errorstack.add_report(err_report)
+                        self.update_error_log()
+                        self.failed_images.append(file_path)
+                    else:
+                        # Blocks while the reduction workers are all busy
+                        reduce_queue.put((file_path, img_batch))
+
+    def process_reduce_queue(self, queue: Queue):
+        """This is the reduction worker thread function. It is run as a daemon
+        thread that only exits when the main thread ends.
+        It reduces each loaded image batch, along with the calibration images
+        and any queued dithers.
+
+        :param queue: queue of (file path, loaded images) to reduce
+        :return: None
+        """
+        while True:
+            file_path, img_batch = queue.get()
 
-            if not queue.empty():
-                event = queue.get()
+            try:
+                is_science = img_batch[0][OBSCLASS_KEY] == "science"
 
-                if event.src_path[-5:] == ".fits":
-                    # Verify that file transfer is complete, useful for rsync latency
+                if not is_science:
+                    for img in img_batch:
+                        self.update_cals(img)
 
-                    transfer_done = False
-                    t_start = Time.now()
+                else:
+                    # Start clock with first science image
+                    if self.queue_t is None:
+                        self.queue_t = Time.now()
 
-                    while not transfer_done:
-                        transfer_done = check_file_is_complete(event.src_path)
+                sci_img_batch = img_batch
+                load_queue = list(self.queued_images)
 
-                        wait = (Time.now() - t_start).to(u.second).value
+                img = img_batch[-1]
 
-                        # If a corrupt image comes in, give up eventually
-                        if wait > FILE_TRANSFER_TIMEOUT_S:
-                            err = (
-                                f"File {event.src_path} has not been fully "
-                                f"transferred after 60 seconds. "
-                                f"It is probably corrupted. Skipping this file."
-                            )
-                            logger.error(err)
-                            try:
-                                raise ImageTimeoutError(err)
-                            except ImageTimeoutError as exc:
-                                err_report = ErrorReport(
-                                    exc, "monitor", contents=[event.src_path]
-                                )
-                                self.errorstack.add_report(err_report)
-                            self.failed_images.append(event.src_path)
-                            break
-
-                        if not transfer_done:
-                            msg = (
-                                f"Seems like the file {event.src_path} is not "
-                                f"fully transferred. Waited for {wait:.1f} seconds so far, "
-                                f"and will time out after {FILE_TRANSFER_TIMEOUT_S} s. "
-                                f"Will try again."
+                if (DITHER_N_KEY in img) & (MAX_DITHER_KEY in img):
+                    logger.info(
+                        "Image %s is dither number %s of %s",
+                        file_path,
+                        img[DITHER_N_KEY],
+                        img[MAX_DITHER_KEY],
+                    )
+                    # self.update_error_log()
+
+                    # If you have a new dither set, just process
+                    if int(img[DITHER_N_KEY]) == 1 and len(self.queued_images) > 0:
+                        if img[MAX_DITHER_KEY] > 1:
+                            sci_img_batch = ImageBatch([])
+                            self.queued_images = [file_path]
+                            logger.info(
+                                f"Adding {file_path} to queue. "
+                                f"It has dither number {img[DITHER_N_KEY]}."
+                                f"The previous dither set was incomplete. "
+                                f"Processing these {len(sci_img_batch)} "
+                                f"images now."
                             )
-                            logger.info(msg)
                             # self.update_error_log()
-                            time.sleep(3)
 
-                    if transfer_done:
-                        try:
-                            # Start processing
-                            img_batch = self.pipeline.load_raw_image(event.src_path)
-
-                            is_science = img_batch[0][OBSCLASS_KEY] == "science"
-
-                            if not is_science:
-                                for img in img_batch:
-                                    self.update_cals(img)
-
-                            else:
-                                # Start clock with first science image
-                                if self.queue_t is None:
-                                    self.queue_t = Time.now()
-
-                            sci_img_batch = img_batch + self.get_cals()
-                            load_queue = list(self.queued_images)
-
-                            img = img_batch[-1]
-
-                            if (DITHER_N_KEY in img.keys()) & (
-                                MAX_DITHER_KEY in img.keys()
-                            ):
-                                msg = (
-                                    f"Image {event.src_path} is dither number "
-                                    f"{img[DITHER_N_KEY]} of {img[MAX_DITHER_KEY]}"
-                                )
-                                print(msg)
-                                logger.info(msg)
-                                # self.update_error_log()
-
-                                # If you have a new dither set, just process
-                                if np.logical_and(
-                                    int(img[DITHER_N_KEY]) == 1,
-                                    len(self.queued_images) > 0,
-                                ):
-                                    if img[MAX_DITHER_KEY] > 1:
-                                        sci_img_batch = ImageBatch([])
-                                        self.queued_images = [event.src_path]
-                                        logger.info(
-                                            f"Adding {event.src_path} to queue. "
-                                            f"It has dither number {img[DITHER_N_KEY]}."
-                                            f"The previous dither set was incomplete. "
-                                            f"Processing these {len(sci_img_batch)} "
-                                            f"images now."
-                                        )
-                                        # self.update_error_log()
-
-                                elif img[DITHER_N_KEY] != img[MAX_DITHER_KEY]:
-                                    if (Time.now() - self.queue_t) < (1.0 * u.hour):
-                                        self.queued_images.append(event.src_path)
-                                        sci_img_batch = None
-                                        logger.info(
-                                            f"Added {event.src_path} to queue. "
-                                            f"It has dither number {img[DITHER_N_KEY]}. "
-                                            f"Waiting for dither {img[MAX_DITHER_KEY]}."
-                                            f"Time since last image: "
-                                            f"{(Time.now() - self.queue_t).to('hour'):.3f}"
-                                            f" hours. There are "
-                                            f"{len(self.queued_images)} images"
-                                            f" in the queue."
-                                        )
-                                        # self.update_error_log()
-                                    else:
-                                        self.queued_images = []
-
-                            if sci_img_batch is not None:
-                                self.queue_t = Time.now()
-
-                                all_img = sci_img_batch + self.get_cals()
-
-                                for x in load_queue:
-                                    all_img += self.pipeline.load_raw_image(x)
-
-                                msg = (
-                                    f"Reducing {event.src_path} "
-                                    f"on thread {threading.get_ident()}, "
-                                    f"alongside {len(load_queue)} queue images"
-                                    f"(science={is_science})"
-                                )
-                                print(msg)
-                                logger.info(msg)
-                                # self.update_error_log()
-
-                                _, errorstack = self.pipeline.reduce_images(
-                                    dataset=Dataset(all_img),
-                                    selected_configurations=self.realtime_configurations,
-                                    catch_all_errors=True,
-                                )
-                                self.errorstack += errorstack
-                                self.update_error_log()
-
-                                if is_science:
-                                    self.processed_science_images.append(event.src_path)
-                                else:
-                                    self.processed_cal_images.append(event.src_path)
-
-                        # RS: Please forgive me for this coding sin
-                        # I just want the monitor to never crash
-                        except Exception as exc:  # pylint: disable=broad-except
-                            err_report = ErrorReport(
-                                exc, "monitor", contents=[event.src_path]
+                    elif img[DITHER_N_KEY] != img[MAX_DITHER_KEY]:
+                        if (Time.now() - self.queue_t) < (1.0 * u.hour):
+                            self.queued_images.append(file_path)
+                            sci_img_batch = None
+                            logger.info(
+                                f"Added {file_path} to queue. "
+                                f"It has dither number {img[DITHER_N_KEY]}. "
+                                f"Waiting for dither {img[MAX_DITHER_KEY]}."
+                                f"Time since last image: "
+                                f"{(Time.now() - self.queue_t).to('hour'):.3f}"
+                                f" hours. There are "
+                                f"{len(self.queued_images)} images"
+                                f" in the queue."
                             )
-                            self.errorstack.add_report(err_report)
-                            self.update_error_log()
-                            self.failed_images.append(event.src_path)
+                            # self.update_error_log()
+                        else:
+                            self.queued_images = []
+
+                if sci_img_batch is not None:
+                    self.queue_t = Time.now()
+
+                    all_img = self.get_cals()
+
+                    # Calibration images are already included, via update_cals
+                    if is_science:
+                        all_img = sci_img_batch + all_img
+
+                    # Queued images are reloaded for each new exposure
+                    for x in load_queue:
+                        all_img += self.pipeline.load_raw_image(x, use_cache=True)
+
+                    # Formatted lazily, so nothing is done if INFO is disabled
+                    logger.info(
+                        "Reducing %s on thread %s, alongside %d queue images "
+                        "(science=%s)",
+                        file_path,
+                        threading.get_ident(),
+                        len(load_queue),
+                        is_science,
+                    )
+                    # self.update_error_log()
 
-            else:
-                time.sleep(1)
+                    _, errorstack = self.pipeline.reduce_images(
+                        dataset=Dataset(all_img),
+                        selected_configurations=self.realtime_configurations,
+                        catch_all_errors=True,
+                    )
+                    self.errorstack += errorstack
+                    self.update_error_log()
+
+                    if is_science:
+                        self.processed_science_images.append(file_path)
+                        self.processed_science_basenames.append(
+                            os.path.basename(file_path)
+                        )
+                    else:
+                        self.processed_cal_images.append(file_path)
+
+            # RS: Please forgive me for this coding sin
+            # I just want the monitor to never crash
+            except Exception as exc:  # pylint: disable=broad-except
+                err_report = ErrorReport(exc, "monitor", contents=[file_path])
+                self.errorstack.add_report(err_report)
+                self.update_error_log()
+                self.failed_images.append(file_path)
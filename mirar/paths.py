@@ -5,6 +5,7 @@ Central module hosting all shared paths/directory conventions/keys/variables
 import logging
 import os
 import shutil
+from functools import cache, lru_cache
 from importlib import metadata
 from pathlib import Path
 
@@ -25,12 +26,21 @@ VARIABLES_LOADED = dotenv.load_dotenv()
 if VARIABLES_LOADED:
     logger.info("Environment variables were automatically loaded from .env file.")
 
-_n_cpu = os.cpu_count()
-if _n_cpu is None:
-    default_n_cpu: int = 1
-else:
-    default_n_cpu = max(int(_n_cpu / 2), 1)
-max_n_cpu: int = int(os.getenv("MAX_N_CPU", default_n_cpu))
+
+def _get_max_n_cpu() -> int:
+    """
+    Get the maximum number of CPUs to use, from the MAX_N_CPU environment
+    variable if set, and otherwise half of the available CPUs
+
+    :return: maximum number of CPUs
+    """
+    env_n_cpu = os.getenv("MAX_N_CPU")
+    if env_n_cpu:
+        return int(env_n_cpu)
+    return max((os.cpu_count() or 1) // 2, 1)
+
+
+max_n_cpu: int = _get_max_n_cpu()
 
 # Set up default directories
 
@@ -64,8 +74,25 @@ else:
     base_output_dir = Path(_base_output_dir)
 
 # Set up special directories
-TEMP_DIR = base_output_dir.joinpath(f"{PACKAGE_NAME}_temp")
-TEMP_DIR.mkdir(exist_ok=True)
+
+# Temporary files, including the image cache, can be kept on a separate
+# (ideally memory-backed) filesystem such as /dev/shm
+_base_temp_dir = os.getenv("TEMP_DATA_DIR")
+
+if _base_temp_dir is None:
+    TEMP_DIR = base_output_dir.joinpath(f"{PACKAGE_NAME}_temp")
+else:
+    TEMP_DIR = Path(_base_temp_dir).joinpath(f"{PACKAGE_NAME}_temp")
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+# Outputs of the astromatic tools can be reused between runs with identical
+# inputs, by setting ASTROMATIC_CACHE_DIR (disabled by default)
+_astromatic_cache_dir = os.getenv("ASTROMATIC_CACHE_DIR")
+
+if _astromatic_cache_dir is None:
+    astromatic_cache_dir: Path | None = None
+else:
+    astromatic_cache_dir = Path(_astromatic_cache_dir)
 
 RAW_IMG_SUB_DIR = "raw"
 CAL_OUTPUT_SUB_DIR = "calibration"
@@ -77,6 +104,7 @@ config_dir = base_output_dir.joinpath("configs")
 config_dir.mkdir(exist_ok=True)
 
 
+@cache
 def raw_img_dir(
     sub_dir: str = "", raw_dir: Path = base_raw_dir, img_sub_dir: str = RAW_IMG_SUB_DIR
 ) -> Path:
@@ -88,9 +116,10 @@ def raw_img_dir(
     :param img_sub_dir: Default 'raw'
     :return: Full path of raw images
     """
-    return raw_dir.joinpath(os.path.join(str(sub_dir), img_sub_dir))
+    return raw_dir.joinpath(str(sub_dir), img_sub_dir)
 
 
+@cache
 def get_output_dir(
     dir_root: str, sub_dir: str | int = "", output_dir: Path = base_output_dir
 ) -> Path:
@@ -103,9 +132,11 @@ def get_output_dir(
     :param output_dir: parent output directory
     :return: full output directory
     """
-    return output_dir.joinpath(os.path.join(str(sub_dir), dir_root))
+    return output_dir.joinpath(str(sub_dir), dir_root)
 
 
+# Bounded, as there is one entry for each file name
+@lru_cache(maxsize=1024)
 def get_output_path(
     base_name: str,
     dir_root: str,
@@ -190,6 +221,27 @@ def copy_temp_file(output_dir: Path, file_path: Path) -> Path:
     return output_path
 
 
+def link_temp_file(output_dir: Path, file_path: Path) -> Path:
+    """
+    Hard links a file at file_path to a temporary path in output dir,
+    then returns temp path. Falls back to copying the file if linking fails.
+    Only use this if neither file will be modified while the other is in use.
+
+    :param output_dir: output directory
+    :param file_path: file to link
+    :return: path of temporary file
+    """
+    output_path = get_temp_path(output_dir=output_dir, file_path=file_path)
+    logger.debug(f"Linking from {file_path} to {output_path}")
+    output_path.unlink(missing_ok=True)
+    try:
+        os.link(file_path, output_path)
+    except OSError:
+        # Not every filesystem supports hard links
+        shutil.copyfile(file_path, output_path)
+    return output_path
+
+
 def get_astrometry_keys() -> list:
     """
     Function to get a list of common astrometric keywords that could be present in a
@@ -13,6 +13,8 @@ The pipeline will process data using a chosen list of these individual
 import copy
 import logging
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +28,9 @@ from mirar.processors.utils.error_annotator import ErrorStackAnnotator
 
 logger = logging.getLogger(__name__)
 
+# Maximum pixel data held for the queued dither images the monitor reloads
+RAW_IMAGE_CACHE_MAX_BYTES = 2**30
+
 
 class Pipeline:
     """
@@ -73,6 +78,11 @@ class Pipeline:
             selected_configurations = [selected_configurations]
         self.selected_configurations = selected_configurations
         self.latest_configuration = None
+        self._raw_image_cache: OrderedDict[tuple, tuple[ImageBatch, int]] = (
+            OrderedDict()
+        )
+        self._raw_image_cache_bytes = 0
+        self._raw_image_cache_lock = threading.Lock()
         self.set_up_pipeline()
 
     @classmethod
@@ -118,15 +128,59 @@ class Pipeline:
         """
         raise NotImplementedError
 
-    def load_raw_image(self, path: str) -> ImageBatch:
+    def load_raw_image(self, path: str, use_cache: bool = False) -> ImageBatch:
         """
         Function to load in a raw image and create an
         :class:`~mirar.data.image_data.Image` object which
-        can then be processed further
+        can then be processed further.
+
+        If use_cache is True, the most recently loaded files are cached
+        (up to RAW_IMAGE_CACHE_MAX_BYTES of pixel data), keyed on their
+        modification time and size, so a file is only reloaded from disk if it
+        has changed. This is intended for files which are loaded repeatedly,
+        such as the queued dither images the monitor reloads for each new
+        exposure. A copy of the cached images is returned,
+        which can be freely modified.
 
         :param path: path of raw image
+        :param use_cache: whether to reuse earlier loads of the same file
         :return: Image object
         """
+        if not use_cache:
+            return self._load_raw_image_batch(path)
+
+        stat = os.stat(path)
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+        with self._raw_image_cache_lock:
+            cached = self._raw_image_cache.get(key)
+            if cached is not None:
+                self._raw_image_cache.move_to_end(key)
+
+        if cached is not None:
+            return copy.deepcopy(cached[0])
+
+        raw_images = self._load_raw_image_batch(path)
+        n_bytes = sum(x.get_data().nbytes for x in raw_images)
+
+        if n_bytes <= RAW_IMAGE_CACHE_MAX_BYTES:
+            with self._raw_image_cache_lock:
+                if key not in self._raw_image_cache:
+                    self._raw_image_cache[key] = (raw_images, n_bytes)
+                    self._raw_image_cache_bytes += n_bytes
+                while self._raw_image_cache_bytes > RAW_IMAGE_CACHE_MAX_BYTES:
+                    _, (_, old_bytes) = self._raw_image_cache.popitem(last=False)
+                    self._raw_image_cache_bytes -= old_bytes
+
+        return copy.deepcopy(raw_images)
+
+    def _load_raw_image_batch(self, path: str) -> ImageBatch:
+        """
+        Load a raw image file as an ImageBatch
+
+        :param path: path of raw image
+        :return: ImageBatch of the images in the file
+        """
         raw_images = self._load_raw_image(path)
         if not isinstance(raw_images, list):
             raw_images = [raw_images]
@@ -37,13 +37,13 @@ def load_raw_git_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Heade
     :return: data and header of image
     """
     data, header = open_fits(path)
-    if GAIN_KEY not in header.keys():
+    if GAIN_KEY not in header:
         header[GAIN_KEY] = 1.0
     header["FILTER"] = header["FILTER"].strip().lower()
 
     # header[SNCOSMO_KEY] = sncosmo_filters[header["FILTER"].lower()]
 
-    if "COADDS" in header.keys():
+    if "COADDS" in header:
         header["DETCOADD"] = header["COADDS"]
     if SATURATE_KEY not in header:
         header[SATURATE_KEY] = GIT_NONLINEAR_LEVEL * header["DETCOADD"]
@@ -60,23 +60,23 @@ def load_raw_git_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Heade
 
     header["JD"] = Time(header["DATE-OBS"]).jd
 
-    if COADD_KEY not in header.keys():
+    if COADD_KEY not in header:
         logger.debug(f"No {COADD_KEY} entry. Setting coadds to 1.")
         header[COADD_KEY] = 1
 
     header[PROC_HISTORY_KEY] = ""
     header[PROC_FAIL_KEY] = ""
 
-    if "FILTERID" not in header.keys():
+    if "FILTERID" not in header:
         header["FILTERID"] = git_filter_dict[header["FILTER"]]
 
     header["FID"] = header["FILTERID"]
 
-    if "FIELDID" not in header.keys():
+    if "FIELDID" not in header:
         header["FIELDID"] = 99999
-    if "PROGPI" not in header.keys():
+    if "PROGPI" not in header:
         header["PROGPI"] = "Kasliwal"
-    if "PROGID" not in header.keys():
+    if "PROGID" not in header:
         header["PROGID"] = 0
 
     header["ZP"] = header["ZP"]
@@ -96,7 +96,7 @@ def load_raw_lt_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Header
     :return: data and header of image
     """
     data, header = open_fits(path)
-    if GAIN_KEY not in header.keys():
+    if GAIN_KEY not in header:
         header[GAIN_KEY] = 1.0
 
     header["FILTER"] = header["FILTER1"][-1].lower()
@@ -119,23 +119,23 @@ def load_raw_lt_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Header
 
     header["JD"] = Time(header["DATE-OBS"]).jd
 
-    if COADD_KEY not in header.keys():
+    if COADD_KEY not in header:
         logger.debug(f"No {COADD_KEY} entry. Setting coadds to 1.")
         header[COADD_KEY] = 1
 
     header[PROC_HISTORY_KEY] = ""
     header[PROC_FAIL_KEY] = ""
 
-    if "FILTERID" not in header.keys():
+    if "FILTERID" not in header:
         header["FILTERID"] = git_filter_dict[header["FILTER"]]
 
     header["FID"] = header["FILTERID"]
 
-    if "FIELDID" not in header.keys():
+    if "FIELDID" not in header:
         header["FIELDID"] = 99999
-    if "PROGPI" not in header.keys():
+    if "PROGPI" not in header:
         header["PROGPI"] = "Kasliwal"
-    if "PROGID" not in header.keys():
+    if "PROGID" not in header:
         header["PROGID"] = 0
 
     # header["ZP"] = header["ZP"]
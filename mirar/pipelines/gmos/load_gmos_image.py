@@ -54,7 +54,7 @@ def load_detrended_gmos_fits(
     header[RAW_IMG_KEY] = str(path)
     header[BASE_NAME_KEY] = Path(path).name
 
-    if GAIN_KEY not in header.keys():
+    if GAIN_KEY not in header:
         header[GAIN_KEY] = header["GAIN"]
 
     header["FILTER"] = header["FILTER1"].replace(" ", "").split("_")[0].lower()
@@ -82,7 +82,7 @@ def load_detrended_gmos_fits(
     header[TIME_KEY] = t.isot
     header["MJD-OBS"] = t.mjd
 
-    if COADD_KEY not in header.keys():
+    if COADD_KEY not in header:
         logger.debug(f"No {COADD_KEY} entry. Setting coadds to 1.")
         header[COADD_KEY] = header["NCOMBINE"]
 
@@ -225,7 +225,7 @@ def load_raw_sedmv2_mef(
 
     header, split_data, split_headers = open_mef_fits(path)
 
-    if "IMGTYPE" in header.keys():  # all modes except mode0
+    if "IMGTYPE" in header:  # all modes except mode0
         check_header = header
         skip_first = True
         is_mode0 = False
@@ -123,7 +123,7 @@ def load_raw_summer_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.He
         default_id = 0
 
         for key in ["PROGID", "OBSID"]:
-            if key not in header.keys():
+            if key not in header:
                 # logger.warning(f"No {key} found in header of {path}")
                 header[key] = default_id
             else:
@@ -132,7 +132,7 @@ def load_raw_summer_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.He
                 except ValueError:
                     header[key] = default_id
 
-        if "SUBPROG" not in header.keys():
+        if "SUBPROG" not in header:
             # logger.warning(f"No SUBPROG found in header of {path}")
             header["SUBPROG"] = "none"
 
@@ -163,7 +163,7 @@ def load_raw_summer_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.He
         ]
         for key in sunmoon_keywords:
             val = 0
-            if key in header.keys():
+            if key in header:
                 if header[key] not in [""]:
                     val = header[key]
             header[key] = val
@@ -189,10 +189,10 @@ def load_raw_summer_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.He
         if header["ITID"] != 1:
             header["FIELDID"] = DEFAULT_FIELD
 
-        if "COADDS" not in header.keys():
+        if "COADDS" not in header:
             header["COADDS"] = 1
 
-        if "PROGPI" not in header.keys():
+        if "PROGPI" not in header:
             header["PROGPI"] = "?"
 
         if header["PROGID"] in ["", "WINTER"]:
@@ -221,7 +221,7 @@ def load_raw_summer_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.He
         # TODO Figure out what to do about primary keys
         header["RAWID"] = header["EXPID"]  # + subdetid
 
-        if GAIN_KEY not in header.keys():
+        if GAIN_KEY not in header:
             header[GAIN_KEY] = 1.0
 
     return data, header  # pylint: disable=no-member
@@ -248,14 +248,14 @@ def load_proc_summer_image(path: str) -> Image:
     """
     data, header = open_fits(path)
 
-    if "ZP" not in header.keys():
+    if "ZP" not in header:
         header["ZP"] = header["ZP_AUTO"]
         header["ZP_std"] = header["ZP_AUTO_std"]
 
     header["CENTRA"] = header["CRVAL1"]
     header["CENTDEC"] = header["CRVAL2"]
 
-    if "TARGET" in header.keys():
+    if "TARGET" in header:
         header[TARGET_KEY] = header["TARGET"]
 
     pipeline_version = __version__
@@ -264,7 +264,7 @@ def load_proc_summer_image(path: str) -> Image:
     )
     header["DIFFID"] = int(str(header["EXPID"]) + str(pipeline_version_padded_str))
 
-    if "PROCID" not in header.keys():
+    if "PROCID" not in header:
         header["PROCID"] = header["DIFFID"]
 
     header["TIMEUTC"] = header["UTCISO"]
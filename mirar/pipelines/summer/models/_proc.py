@@ -102,10 +102,12 @@ class Proc(BaseDB):
     @classmethod
     def validate_rawid(cls, rawid: int) -> int:
         """
-        Ensure that rawid exists in exposures table
+        Ensure that rawid exists in exposures table.
+        Raw frames are checked repeatedly as they are processed,
+        so the result of each check is reused.
 
         :param rawid: rawid
         :return: rawid
         """
-        assert Raw._exists(keys="rawid", values=rawid)
+        assert Raw._exists(keys="rawid", values=rawid, use_cache=True)
         return rawid
@@ -41,7 +41,7 @@ def load_raw_wasp_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Head
     :return: data and header of image
     """
     data, header = open_fits(path)
-    if GAIN_KEY not in header.keys():
+    if GAIN_KEY not in header:
         header[GAIN_KEY] = WASP_GAIN
 
     header["FILTER"] = header["FILTER"].lower().replace(" ", "")
@@ -79,7 +79,7 @@ def load_raw_wasp_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Head
     header[TIME_KEY] = t.isot
     header["MJD-OBS"] = t.mjd
 
-    if COADD_KEY not in header.keys():
+    if COADD_KEY not in header:
         logger.debug(f"No {COADD_KEY} entry. Setting coadds to 1.")
         header[COADD_KEY] = 1
 
@@ -61,10 +61,10 @@ def clean_header(header: fits.Header) -> fits.Header:
     header[GAIN_KEY] = 1.0
     header[SATURATE_KEY] = 40000.0
 
-    if "READOUTM" not in header.keys():
+    if "READOUTM" not in header:
         header["READOUTM"] = None
 
-    if "READOUTV" not in header.keys():
+    if "READOUTV" not in header:
         header["READOUTV"] = None
     elif header["READOUTV"] is not None:
         header["READOUTV"] = str(header["READOUTV"])
@@ -106,7 +106,7 @@ def clean_header(header: fits.Header) -> fits.Header:
         header[TARGET_KEY] = "flat"
 
     # Mirror cover should be open for science images, and open or closed for darks
-    if "MIRCOVER" in header.keys():
+    if "MIRCOVER" in header:
 
         bad_mirror_cover = False
 
@@ -133,10 +133,10 @@ def clean_header(header: fits.Header) -> fits.Header:
     # Set up the target name
 
     target = f"field_{header['FIELDID']}"
-    if ("SCHDNAME" in header.keys()) & ("OBHISTID" in header.keys()):
+    if ("SCHDNAME" in header) & ("OBHISTID" in header):
         if header["SCHDNAME"] != "":
             target = f"{header['SCHDNAME']}_{header['OBHISTID']}"
-    elif TARGET_KEY in header.keys():
+    elif TARGET_KEY in header:
         if header[TARGET_KEY] != "":
             target = header[TARGET_KEY]
     # If the observation is dark/bias/focus/pointing/flat/corrupted,
@@ -156,7 +156,7 @@ def clean_header(header: fits.Header) -> fits.Header:
 
     header[TARGET_KEY] = target
 
-    if "TARGNAME" in header.keys():
+    if "TARGNAME" in header:
         if header["TARGNAME"] == "":
             header["TARGNAME"] = None
     else:
@@ -167,7 +167,7 @@ def clean_header(header: fits.Header) -> fits.Header:
 
     header["EXPID"] = int((date_t.mjd - 59000.0) * 86400.0)  # seconds since 60000 MJD
 
-    if COADD_KEY not in header.keys():
+    if COADD_KEY not in header:
         logger.debug(f"No {COADD_KEY} entry. Setting coadds to 1.")
         header[COADD_KEY] = 1
 
@@ -176,7 +176,7 @@ def clean_header(header: fits.Header) -> fits.Header:
 
     # Make sure filter is a keyword that the pipeline recognizes
     filter_dict = {"J": 1, "H": 2, "Ks": 3}
-    if "FILTERID" not in header.keys():
+    if "FILTERID" not in header:
         header["FILTERID"] = filter_dict[header["FILTER"]]
     header["FILTER"] = header["FILTERID"]
     if header["FILTER"] == "Hs":
@@ -187,15 +187,15 @@ def clean_header(header: fits.Header) -> fits.Header:
         header["FID"] = -99
 
     # Set default values if field details seem incorrect
-    if "FIELDID" not in header.keys():
+    if "FIELDID" not in header:
         header["FIELDID"] = DEFAULT_FIELD
     if header["FIELDID"] < 0:
         header["FIELDID"] = DEFAULT_FIELD
 
     # Set default values if program is not correct
-    if "PROGPI" not in header.keys():
+    if "PROGPI" not in header:
         header["PROGPI"] = default_program.pi_name
-    if "PROGID" not in header.keys():
+    if "PROGID" not in header:
         header["PROGID"] = default_program.progid
     # If PROGNAME is not present or is empty, set it to default here.
     # Otherwise, it gets set to default in the insert_entry for exposures.
@@ -229,24 +229,24 @@ def clean_header(header: fits.Header) -> fits.Header:
     if header["FILTER"].lower() in ["y", "j", "h"]:
         header[SNCOSMO_KEY] = sncosmo_filters[header["FILTER"].lower()]
 
-    if "GAINCOLT" not in header.keys():
+    if "GAINCOLT" not in header:
         header["GAINCOLT"] = "[]"
-    if "GAINCOLB" not in header.keys():
+    if "GAINCOLB" not in header:
         header["GAINCOLB"] = "[]"
-    if "GAINROW" not in header.keys():
+    if "GAINROW" not in header:
         header["GAINROW"] = "[]"
 
-    if "NUMDITHS" not in header.keys():
+    if "NUMDITHS" not in header:
         header["NUMDITHS"] = None
     else:
         header["NUMDITHS"] = int(header["NUMDITHS"])
 
-    if "DITHNUM" not in header.keys():
+    if "DITHNUM" not in header:
         header["DITHNUM"] = None
     else:
         header["DITHNUM"] = int(header["DITHNUM"])
 
-    if "DITHSTEP" not in header.keys():
+    if "DITHSTEP" not in header:
         header["DITHSTEP"] = None
     else:
         header["DITHSTEP"] = float(header["DITHSTEP"])
@@ -281,18 +281,18 @@ def load_winter_stack(
     header["WGHTPATH"] = new_weightpath.as_posix()
     header["SAVEPATH"] = path
 
-    if "PSFCAT" in header.keys():
+    if "PSFCAT" in header:
         new_psfpath = Path(dirname) / header["PSFCAT"].split("/winter/")[-1]
         header["PSFCAT"] = new_psfpath.as_posix()
 
-    if "RFCTPATH" in header.keys():
+    if "RFCTPATH" in header:
         new_catpath = Path(dirname) / header["RFCTPATH"].split("/winter/")[-1]
         header["RFCTPATH"] = new_catpath.as_posix()
 
-    if TARGET_KEY not in header.keys():
-        if "TARGNAME" in header.keys():
+    if TARGET_KEY not in header:
+        if "TARGNAME" in header:
             header[TARGET_KEY] = header["TARGNAME"]
-    if SNCOSMO_KEY not in header.keys():
+    if SNCOSMO_KEY not in header:
         if header["FILTER"].lower() in ["y", "j", "h"]:
             header[SNCOSMO_KEY] = sncosmo_filters[header["FILTER"].lower()]
     return Image(data=data, header=header)
@@ -335,9 +335,9 @@ def load_stacked_winter_image(
         header["RAWPATH"] = ""
         header["BASENAME"] = os.path.basename(path)
         header[TARGET_KEY] = "weight"
-    if "UTCTIME" not in header.keys():
+    if "UTCTIME" not in header:
         header["UTCTIME"] = "2023-06-14T00:00:00"
-    if TARGET_KEY not in header.keys():
+    if TARGET_KEY not in header:
         header[TARGET_KEY] = header["TARGNAME"]
     return data, header
 
@@ -405,7 +405,7 @@ def load_raw_winter_mef(
             primary_header["TARGNAME"] = "CORRUPTED"
 
             for field in core_fields:
-                if field not in primary_header.keys():
+                if field not in primary_header:
                     primary_header[field] = -99.0
 
             primary_header = clean_header(primary_header)
@@ -443,10 +443,10 @@ def load_raw_winter_mef(
 
     # Sometimes there are exptime keys
     for board_header in split_headers:
-        if "EXPTIME" in board_header.keys():
+        if "EXPTIME" in board_header:
             del board_header["EXPTIME"]
         # This is especially annoying
-        if "BOARD_ID" in board_header.keys():
+        if "BOARD_ID" in board_header:
             board_header["BOARD_ID"] = int(board_header["BOARD_ID"])
 
     return primary_header, split_data, split_headers
@@ -504,7 +504,7 @@ def annotate_winter_subdet_headers(batch: ImageBatch) -> ImageBatch:
         image["RAWID"] = int(f"{image['EXPID']}_{str(image['SUBDETID']).rjust(2, '0')}")
         image["USTACKID"] = None
 
-        if "DATASEC" in image.keys():
+        if "DATASEC" in image:
             del image["DATASEC"]
 
         # TODO: Write a little snippet to estimate the central RA/Dec from the pointing
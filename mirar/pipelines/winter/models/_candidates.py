@@ -37,6 +37,28 @@ NAME_START = "aaaaa"
 MIN_NAME_LENGTH = len(CANDIDATE_PREFIX) + len(NAME_START) + 2
 
 
+def get_valid_progname(progname: str) -> str:
+    """
+    Check that a program exists in the database, and otherwise
+    return the default program name
+
+    :param progname: program name
+    :return: valid program name
+    """
+    prog_match = select_from_table(
+        DBQueryConstraints(columns="progname", accepted_values=progname),
+        sql_table=Program.sql_model,
+        use_cache=True,
+    )
+    if prog_match.empty:
+        logger.debug(
+            f"Program {progname} not found in database. "
+            f"Using default program {default_program.progname}"
+        )
+        return default_program.progname
+    return progname
+
+
 class CandidatesTable(WinterBase):  # pylint: disable=too-few-public-methods
     """
     Raw table in database
@@ -361,18 +383,38 @@ class Candidate(BaseDB):
         :return: None
         """
 
-        prog_match = select_from_table(
-            DBQueryConstraints(columns="progname", accepted_values=self.progname),
-            sql_table=Program.sql_model,
-        )
-        if prog_match.empty:
-            logger.debug(
-                f"Program {self.progname} not found in database. "
-                f"Using default program {default_program.progname}"
-            )
-            self.progname = default_program.progname
+        self.progname = get_valid_progname(self.progname)
 
         return self._insert_entry(
             duplicate_protocol=duplicate_protocol,
             returning_key_names=returning_key_names,
         )
+
+    @classmethod
+    def insert_entries(
+        cls,
+        entries: list[BaseDB],
+        duplicate_protocol: str,
+        returning_key_names: str | list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Insert several candidates into the corresponding sql database,
+        checking each distinct program only once
+
+        :param entries: candidates to insert
+        :param duplicate_protocol: protocol to follow if duplicate entry is found
+        :param returning_key_names: names of the keys to return
+        :return: dataframe of the sequence keys, with one row per entry
+        """
+        valid_prognames: dict[str, str] = {}
+        for entry in entries:
+            assert isinstance(entry, Candidate)
+            if entry.progname not in valid_prognames:
+                valid_prognames[entry.progname] = get_valid_progname(entry.progname)
+            entry.progname = valid_prognames[entry.progname]
+
+        return cls._insert_entries(
+            entries=entries,
+            duplicate_protocol=duplicate_protocol,
+            returning_key_names=returning_key_names,
+        )
@@ -217,6 +217,7 @@ class Exposure(BaseDB):
         prog_match = select_from_table(
             DBQueryConstraints(columns="progname", accepted_values=self.progname),
             sql_table=Program.sql_model,
+            use_cache=True,
         )
         if prog_match.empty:
             logger.debug(
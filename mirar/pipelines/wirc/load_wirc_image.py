@@ -50,13 +50,13 @@ def load_raw_wirc_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Head
 
     corrupted = False
 
-    if GAIN_KEY not in header.keys():
+    if GAIN_KEY not in header:
         header[GAIN_KEY] = 1.2
     header["FILTER"] = header["AFT"].split("__")[0][0]
 
     header[SNCOSMO_KEY] = sncosmo_filters[header["FILTER"].lower()]
 
-    if "COADDS" in header.keys():
+    if "COADDS" in header:
         header["DETCOADD"] = header["COADDS"]
     if SATURATE_KEY not in header:
         header[SATURATE_KEY] = WIRC_NONLINEAR_LEVEL * header["DETCOADD"]
@@ -68,7 +68,7 @@ def load_raw_wirc_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Head
 
     # Apparently for WIRC, the images come tagged correctly.
     header[TARGET_KEY] = header["OBJECT"].lower()
-    if "MJD-OBS" in header.keys():
+    if "MJD-OBS" in header:
         header["DATE-OBS"] = Time(header["MJD-OBS"], format="mjd").isot
     else:
         header["DATE-OBS"] = header["UTSHUT"]
@@ -76,7 +76,7 @@ def load_raw_wirc_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Head
 
     header["JD"] = Time(header["DATE-OBS"]).jd
 
-    if COADD_KEY not in header.keys():
+    if COADD_KEY not in header:
         logger.debug(f"No {COADD_KEY} entry. Setting coadds to 1.")
         header[COADD_KEY] = 1
 
@@ -91,27 +91,27 @@ def load_raw_wirc_fits(path: str | Path) -> tuple[np.array, astropy.io.fits.Head
         header["CRVAL1"] = 0
         header["CRVAL2"] = 0
 
-    if "FILTERID" not in header.keys():
+    if "FILTERID" not in header:
         header["FILTERID"] = wirc_filter_dict[header["FILTER"]]
 
     header["FID"] = header["FILTERID"]
 
-    if "FIELDID" not in header.keys():
+    if "FIELDID" not in header:
         header["FIELDID"] = 99999
-    if "PROGPI" not in header.keys():
+    if "PROGPI" not in header:
         header["PROGPI"] = "Kasliwal"
-    if "PROGID" not in header.keys():
+    if "PROGID" not in header:
         header["PROGID"] = 0
-    if "ZP" not in header.keys():
-        if "TMC_ZP" in header.keys():
+    if "ZP" not in header:
+        if "TMC_ZP" in header:
             header[ZP_KEY] = float(header["TMC_ZP"])
             header[ZP_STD_KEY] = float(header["TMC_ZPSD"])
-        if "ZP_AUTO" in header.keys():
+        if "ZP_AUTO" in header:
             header[ZP_KEY] = float(header["ZP_AUTO"])
             header[ZP_STD_KEY] = float(header["ZP_AUTO_std"])
 
     for key in ["TELFOCUS", "RA", "DEC"]:
-        if key not in header.keys():
+        if key not in header:
             logger.warning(
                 f"No '{key}' entry in header for image {path}. "
                 f"Setting as corrupted, will ignore."
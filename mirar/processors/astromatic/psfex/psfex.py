@@ -4,6 +4,7 @@ Module to run PSFex
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -11,15 +12,21 @@ import numpy as np
 from astropy.io import fits
 
 from mirar.data import ImageBatch
+from mirar.io import save_hdu_as_fits
 from mirar.paths import (
     NORM_PSFEX_KEY,
     PSFEX_CAT_KEY,
     SEXTRACTOR_HEADER_KEY,
+    astromatic_cache_dir,
     get_output_dir,
 )
 from mirar.processors.astromatic.sextractor.sextractor import Sextractor
-from mirar.processors.base_processor import BaseImageProcessor, PrerequisiteError
-from mirar.utils import execute
+from mirar.processors.base_processor import (
+    BaseImageProcessor,
+    BaseProcessor,
+    PrerequisiteError,
+)
+from mirar.utils import execute_with_cache
 
 logger = logging.getLogger(__name__)
 
@@ -46,15 +53,24 @@ def run_psfex(
         f"-PSF_DIR {psf_output_dir} -CHECKIMAGE_TYPE NONE"
     )
 
-    execute(psfex_command)
+    execute_with_cache(
+        psfex_command,
+        input_paths=[sextractor_cat_path, config_path],
+        output_paths=[
+            Path(psf_output_dir).joinpath(sextractor_cat_path.with_suffix(".psf").name)
+        ],
+        cache_dir=astromatic_cache_dir,
+    )
 
     if norm_psf_output_name is not None:
         psf_path = sextractor_cat_path.with_suffix(".psf")
         with fits.open(psf_path) as data_file:
-            psf_model_data = data_file[1].data[0][0][0]
-        psf_model_data = psf_model_data / np.sum(psf_model_data)
+            # Copy to a native-endian float32 array, which can then be
+            # normalised in place (the file data is read-only)
+            psf_model_data = data_file[1].data[0][0][0].astype(np.float32)
+        psf_model_data *= np.float32(1.0 / psf_model_data.sum(dtype=np.float64))
         psf_model_hdu = fits.PrimaryHDU(psf_model_data)
-        psf_model_hdu.writeto(norm_psf_output_name, overwrite=True)
+        save_hdu_as_fits(psf_model_hdu, norm_psf_output_name)
 
 
 class PSFex(BaseImageProcessor):
@@ -63,6 +79,7 @@ class PSFex(BaseImageProcessor):
     """
 
     base_key = "psfex"
+    max_n_cpu = 1
 
     def __init__(
         self,
@@ -91,29 +108,37 @@ class PSFex(BaseImageProcessor):
 
     def _apply_to_images(self, batch: ImageBatch) -> ImageBatch:
         psfex_out_dir = self.get_psfex_output_dir()
-        psfex_out_dir.mkdir(parents=True, exist_ok=True)
-
-        for image in batch:
-            sextractor_cat_path = Path(image[SEXTRACTOR_HEADER_KEY])
-
-            psf_path = sextractor_cat_path.with_suffix(".psf")
-            norm_psf_path = sextractor_cat_path.with_suffix(".psfmodel.fits")
-            run_psfex(
-                sextractor_cat_path=sextractor_cat_path,
-                config_path=self.config_path,
-                psf_output_dir=os.path.dirname(sextractor_cat_path),
-                norm_psf_output_name=norm_psf_path,
+        self.make_output_dir(psfex_out_dir)
+
+        sextractor_cat_paths = [Path(x[SEXTRACTOR_HEADER_KEY]) for x in batch]
+
+        # Each image has its own catalog, so PSFex can be run on all at once.
+        # As for Sextractor, batches are processed one at a time.
+        n_cpu = max(min(BaseProcessor.max_n_cpu, len(batch)), 1)
+        with ThreadPoolExecutor(max_workers=n_cpu) as executor:
+            list(
+                executor.map(
+                    lambda x: run_psfex(
+                        sextractor_cat_path=x,
+                        config_path=self.config_path,
+                        psf_output_dir=os.path.dirname(x),
+                        norm_psf_output_name=x.with_suffix(".psfmodel.fits"),
+                    ),
+                    sextractor_cat_paths,
+                )
             )
 
-            image[PSFEX_CAT_KEY] = str(psf_path)
-            image[NORM_PSFEX_KEY] = str(norm_psf_path)
+        for image, sextractor_cat_path in zip(batch, sextractor_cat_paths):
+            image[PSFEX_CAT_KEY] = str(sextractor_cat_path.with_suffix(".psf"))
+            image[NORM_PSFEX_KEY] = str(
+                sextractor_cat_path.with_suffix(".psfmodel.fits")
+            )
         return batch
 
     def check_prerequisites(
         self,
     ):
-        check = np.sum([isinstance(x, Sextractor) for x in self.preceding_steps])
-        if check < 1:
+        if not any(isinstance(x, Sextractor) for x in self.preceding_steps):
             err = (
                 f"{self.__module__} requires {Sextractor} as a prerequisite. "
                 f"However, the following steps were found: {self.preceding_steps}."
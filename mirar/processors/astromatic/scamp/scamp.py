@@ -4,7 +4,6 @@ Module to run Scamp
 
 import logging
 import os
-import shutil
 from collections.abc import Callable
 from pathlib import Path
 
@@ -15,17 +14,18 @@ from mirar.catalog.base.base_catalog import BaseCatalog
 from mirar.data import Image, ImageBatch
 from mirar.paths import (
     BASE_NAME_KEY,
-    copy_temp_file,
+    astromatic_cache_dir,
     get_astrometry_keys,
     get_output_dir,
     get_untemp_path,
+    link_temp_file,
 )
 from mirar.processors.astromatic.sextractor.sextractor import (
     SEXTRACTOR_HEADER_KEY,
     check_sextractor_prerequisite,
 )
 from mirar.processors.base_processor import BaseImageProcessor
-from mirar.utils import execute
+from mirar.utils import execute, execute_with_cache
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +82,25 @@ def run_scamp(
             f"{checkplot_basename}_phot_error"
             f" -CHECKPLOT_DEV {checkplot_dev}"
         )
-    execute(scamp_cmd, output_dir=output_dir, timeout=np.max([60.0, timeout_seconds]))
+        execute(
+            scamp_cmd, output_dir=output_dir, timeout=np.max([60.0, timeout_seconds])
+        )
+        return
+
+    # Without checkplots, the only outputs are a .head file for each catalog
+    with open(scamp_list_path, "r", encoding="utf8") as scamp_list_f:
+        cat_paths = [x.strip() for x in scamp_list_f.readlines() if x.strip()]
+
+    execute_with_cache(
+        scamp_cmd,
+        input_paths=[scamp_list_path, scamp_config_path, ast_ref_cat_path, *cat_paths],
+        output_paths=[
+            Path(os.path.splitext(x)[0]).with_suffix(".head") for x in cat_paths
+        ],
+        cache_dir=astromatic_cache_dir,
+        output_dir=output_dir,
+        timeout=np.max([60.0, timeout_seconds]),
+    )
 
 
 def write_scamp_header_to_image(image: Image):
@@ -100,7 +118,7 @@ def write_scamp_header_to_image(image: Image):
     # Remove any existing astrometry keywords
     astrometry_keys = get_astrometry_keys()
     for k in astrometry_keys:
-        if k in image_header.keys():
+        if k in image_header:
             del image_header[k]
 
     for k in scamp_header:
@@ -173,11 +191,13 @@ class Scamp(BaseImageProcessor):
         batch = ImageBatch([batch[i] for i in sort_inds])
 
         scamp_output_dir = self.get_scamp_output_dir()
-        scamp_output_dir.mkdir(parents=True, exist_ok=True)
+        self.make_output_dir(scamp_output_dir)
 
         ref_catalog = self.ref_catalog_generator(batch[0])
 
-        ref_cat_path = ref_catalog.write_catalog(batch[0], output_dir=scamp_output_dir)
+        ref_cat_path = ref_catalog.write_catalog(
+            batch[0], output_dir=scamp_output_dir, use_query_cache=True
+        )
 
         scamp_image_list_path = scamp_output_dir.joinpath(
             Path(batch[0][BASE_NAME_KEY]).name + "_scamp_list.txt",
@@ -195,7 +215,8 @@ class Scamp(BaseImageProcessor):
 
         with open(scamp_image_list_path, "w", encoding="utf8") as img_list_f:
             for image in batch:
-                temp_sextractor_cat_path = copy_temp_file(
+                # Scamp only reads the catalog, so a link is enough
+                temp_sextractor_cat_path = link_temp_file(
                     output_dir=scamp_output_dir, file_path=image[SEXTRACTOR_HEADER_KEY]
                 )
                 img_list_f.write(f"{temp_sextractor_cat_path}\n")
@@ -227,7 +248,8 @@ class Scamp(BaseImageProcessor):
         for i, out_path in enumerate(out_files):
             image = batch[i]
             new_out_path = get_untemp_path(out_path)
-            shutil.move(out_path, new_out_path)
+            # The untemp path is always in the same directory, so just rename
+            os.replace(out_path, new_out_path)
             image[SCAMP_HEADER_KEY] = str(new_out_path).strip()
             if self.copy_scamp_header_to_image:
                 image = write_scamp_header_to_image(image)
@@ -7,10 +7,10 @@ Module to run
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
-import numpy as np
 from astropy.io import fits
 from astropy.table import Table
 
@@ -52,8 +52,7 @@ def check_sextractor_prerequisite(processor: BaseProcessor):
     """
     Check that the preceding steps of a given processor contain Sextractor
     """
-    check = np.sum([isinstance(x, Sextractor) for x in processor.preceding_steps])
-    if check < 1:
+    if not any(isinstance(x, Sextractor) for x in processor.preceding_steps):
         err = (
             f"{processor.__module__} requires {Sextractor} as a prerequisite. "
             f"However, the following steps were found: {processor.preceding_steps}."
@@ -198,14 +197,19 @@ class Sextractor(BaseImageProcessor):  # pylint: disable=too-many-instance-attri
                 logger.error(err)
                 raise PrerequisiteError(err)
 
-    def _apply_to_images(  # pylint: disable=too-many-locals, too-many-branches
+    def _apply_to_images(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
         self, batch: ImageBatch
     ) -> ImageBatch:
         sextractor_out_dir = self.get_sextractor_output_dir()
-        sextractor_out_dir.mkdir(parents=True, exist_ok=True)
+        self.make_output_dir(sextractor_out_dir)
+
+        # Prepare the inputs for every image first, so sextractor can then
+        # be run on the whole batch at once
+        run_kwargs = []
+        all_temp_files = []
 
         for image in batch:
-            if self.gain is None and "GAIN" in image.keys():
+            if self.gain is None and "GAIN" in image:
                 self.gain = image["GAIN"]
 
             temp_path = get_temp_path(sextractor_out_dir, image[BASE_NAME_KEY])
@@ -217,24 +221,26 @@ class Sextractor(BaseImageProcessor):  # pylint: disable=too-many-instance-attri
 
             weight_path = None
 
-            if LATEST_WEIGHT_SAVE_KEY in image.keys():
+            if LATEST_WEIGHT_SAVE_KEY in image:
                 image_weight_path = sextractor_out_dir.joinpath(
                     image[LATEST_WEIGHT_SAVE_KEY]
                 )
                 temp_weight_path = get_temp_path(
                     sextractor_out_dir, image[LATEST_WEIGHT_SAVE_KEY]
                 )
-                if image_weight_path.exists():
+                try:
                     shutil.copyfile(image_weight_path, temp_weight_path)
                     weight_path = temp_weight_path
                     temp_files.append(weight_path)
+                except FileNotFoundError:
+                    pass
 
             if weight_path is None:
                 weight_path = self.save_mask_image(image, temp_path)
                 temp_files.append(weight_path)
 
             if self.use_psfex:
-                if PSFEX_CAT_KEY in image.keys():
+                if PSFEX_CAT_KEY in image:
                     self.psf_path = Path(image[PSFEX_CAT_KEY])
 
                 if self.psf_path is None:
@@ -258,27 +264,44 @@ class Sextractor(BaseImageProcessor):  # pylint: disable=too-many-instance-attri
 
             logger.debug(f"Sextractor checkimage name is {checkimage_name}")
 
-            output_cat, checkimage_name = run_sextractor_single(
-                img=temp_path,
-                config=self.config,
-                output_dir=sextractor_out_dir,
-                parameters_name=self.parameters_name,
-                filter_name=self.filter_name,
-                starnnw_name=self.starnnw_name,
-                saturation=self.saturation,
-                weight_image=weight_path,
-                verbose_type=self.verbose_type,
-                checkimage_name=checkimage_name,
-                checkimage_type=self.checkimage_type,
-                gain=self.gain,
-                psf_name=self.psf_path,
-                catalog_name=output_cat,
+            run_kwargs.append(
+                {
+                    "img": temp_path,
+                    "config": self.config,
+                    "output_dir": sextractor_out_dir,
+                    "parameters_name": self.parameters_name,
+                    "filter_name": self.filter_name,
+                    "starnnw_name": self.starnnw_name,
+                    "saturation": self.saturation,
+                    "weight_image": weight_path,
+                    "verbose_type": self.verbose_type,
+                    "checkimage_name": checkimage_name,
+                    "checkimage_type": self.checkimage_type,
+                    "gain": self.gain,
+                    "psf_name": self.psf_path,
+                    "catalog_name": output_cat,
+                }
+            )
+            all_temp_files.append(temp_files)
+
+        # Each sextractor call is a separate, single-threaded process,
+        # so run several at once rather than one after the other.
+        # Batches are processed one at a time (max_n_cpu = 1), so the
+        # overall limit comes from BaseProcessor instead.
+        n_cpu = max(min(BaseProcessor.max_n_cpu, len(run_kwargs)), 1)
+        with ThreadPoolExecutor(max_workers=n_cpu) as executor:
+            results = list(
+                executor.map(lambda x: run_sextractor_single(**x), run_kwargs)
             )
 
+        for image, (output_cat, checkimage_name), temp_files in zip(
+            batch, results, all_temp_files
+        ):
             logger.debug(f"Cache save is {self.cache}")
             if not self.cache:
                 for temp_file in temp_files:
-                    temp_file.unlink()
+                    # Images can share a weight map, so it may already be gone
+                    temp_file.unlink(missing_ok=True)
                     logger.debug(f"Deleted temporary file {temp_file}")
 
             if self.catalog_purifier is not None:
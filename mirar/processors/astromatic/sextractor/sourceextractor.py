@@ -8,8 +8,9 @@ from pathlib import Path
 from typing import Optional
 
 from mirar.data.utils import write_regions_file
+from mirar.paths import astromatic_cache_dir
 from mirar.processors.astromatic.config import astromatic_config_dir
-from mirar.utils import ExecutionError, execute
+from mirar.utils import ExecutionError, execute, execute_with_cache
 from mirar.utils.ldac_tools import get_table_from_ldac
 
 logger = logging.getLogger(__name__)
@@ -120,11 +121,7 @@ def run_sextractor(images: str | list, output_dir: str, *args, **kwargs):
         images = [images]
 
     # Make output directory if it doesn't exist
-
-    try:
-        os.makedirs(output_dir)
-    except OSError:
-        pass
+    os.makedirs(output_dir, exist_ok=True)
 
     for img in images:
         run_sextractor_single(img, output_dir, *args, **kwargs)
@@ -217,7 +214,21 @@ def run_sextractor_single(  # pylint: disable=too-many-arguments
     if psf_name is not None:
         cmd += f" -PSF_NAME {psf_name}"
     try:
-        execute(cmd, output_dir)
+        execute_with_cache(
+            cmd,
+            input_paths=[
+                img,
+                config,
+                parameters_name,
+                filter_name,
+                starnnw_name,
+                weight_image,
+                psf_name,
+            ],
+            output_paths=[catalog_name] + checkimage_name,
+            cache_dir=astromatic_cache_dir,
+            output_dir=output_dir,
+        )
     except ExecutionError as exc:
         raise SextractorError(exc) from exc
 
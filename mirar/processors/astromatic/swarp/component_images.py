@@ -67,7 +67,7 @@ class ReloadSwarpComponentImages(BaseImageProcessor):
             component_image = self.open_fits(component_image_path)
             if self.copy_header_keys is not None:
                 for key in self.copy_header_keys:
-                    if key in image.keys():
+                    if key in image:
                         component_image[key] = image[key]
             component_batch.append(component_image)
         logger.debug(f"Loaded {len(component_batch)} component images")
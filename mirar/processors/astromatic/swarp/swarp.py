@@ -299,7 +299,7 @@ class Swarp(BaseImageProcessor):
                     )
 
                 if np.logical_and(
-                    SWARP_FLUX_SCALING_KEY in image.header.keys(),
+                    SWARP_FLUX_SCALING_KEY in image.header,
                     self.flux_scaling_factor is not None,
                 ):
                     err = (
@@ -309,7 +309,7 @@ class Swarp(BaseImageProcessor):
                     )
                     raise SwarpError(err)
 
-                if SWARP_FLUX_SCALING_KEY not in image.header.keys():
+                if SWARP_FLUX_SCALING_KEY not in image.header:
                     if self.flux_scaling_factor is None:
                         image[SWARP_FLUX_SCALING_KEY] = 1
                     else:
@@ -337,7 +337,7 @@ class Swarp(BaseImageProcessor):
                 # Omit any astrometric keywords
                 tmp_dict = combined_header_dict.copy()
                 for key in combined_header_dict.keys():
-                    if key not in tmp_dict.keys():
+                    if key not in tmp_dict:
                         continue
                     if image[key] != tmp_dict[key]:
                         tmp_dict.pop(key)
@@ -436,7 +436,7 @@ class Swarp(BaseImageProcessor):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", AstropyWarning)
             for key in combined_header_dict:
-                if key not in new_image.keys():
+                if key not in new_image:
                     try:
                         new_image[key] = combined_header_dict[key]
                     except ValueError:
@@ -33,10 +33,7 @@ def run_astrometry_net(images: str | list, output_dir: str, *args, **kwargs):
 
     # make output directory if it doesn't exist
 
-    try:
-        os.makedirs(output_dir)
-    except OSError:
-        pass
+    os.makedirs(output_dir, exist_ok=True)
 
     for img in images:
         run_astrometry_net_single(img, output_dir, *args, **kwargs)
@@ -78,7 +78,7 @@ def get_img_src_list(
 
     header = fits.getheader(img_path)
     sextractor_catalog_path = None
-    if SEXTRACTOR_HEADER_KEY in header.keys():
+    if SEXTRACTOR_HEADER_KEY in header:
         sextractor_catalog_path = fits.getval(img_path, SEXTRACTOR_HEADER_KEY)
 
     if sextractor_catalog_path is not None:
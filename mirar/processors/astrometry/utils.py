@@ -44,7 +44,7 @@ class AstrometryFromFile(BaseImageProcessor):
                     f"scamp with cache=True?"
                 )
             for key in astrometry_keys:
-                if key in image.header.keys():
+                if key in image.header:
                     logger.debug(f"Removing {key} from {image[BASE_NAME_KEY]}")
                     del image.header[key]
 
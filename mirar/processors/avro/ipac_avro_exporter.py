@@ -5,10 +5,10 @@ Module with classes to make avro alert packets
 import io
 import logging
 from pathlib import Path
+from typing import Mapping
 
 import confluent_kafka
 import fastavro
-import pandas as pd
 from fastavro.types import Schema
 
 from mirar.data import SourceTable
@@ -54,12 +54,12 @@ class IPACAvroExporter(BaseAvroExporter):
         return alert_schema, candidate_schema, prv_candidate_schema
 
     @staticmethod
-    def fill_schema(schema: Schema, row: pd.Series, metadata: dict) -> dict:
+    def fill_schema(schema: Schema, row: Mapping, metadata: dict) -> dict:
         """
         Fill an avro schema with data from a row of a pandas dataframe
 
         :param schema: Schema to fill
-        :param row: Row of pandas dataframe
+        :param row: Row of pandas dataframe, as a dictionary
         :param metadata: Metadata to fill
         :return: Dictionary of filled schema
         """
@@ -67,13 +67,13 @@ class IPACAvroExporter(BaseAvroExporter):
 
         for field in schema["fields"]:
             key = field["name"]
-            if key in row.keys():
+            if key in row:
                 new[key] = row[key]
-            elif key.upper() in row.keys():
+            elif key.upper() in row:
                 new[key] = row[key.upper()]
-            elif key in metadata.keys():
+            elif key in metadata:
                 new[key] = metadata[key]
-            elif key.upper() in metadata.keys():
+            elif key.upper() in metadata:
                 new[key] = metadata[key.upper()]
 
         return new
@@ -92,7 +92,9 @@ class IPACAvroExporter(BaseAvroExporter):
 
         metadata = source_table.get_metadata()
 
-        for _, row in source_table.get_data().iterrows():
+        # Convert the table to dictionaries in a single pass, rather than
+        # building a pd.Series for each row
+        for row in source_table.get_data().to_dict(orient="records"):
 
             alert = self.fill_schema(self.alert_schema, row, metadata)
             candidate = self.fill_schema(self.candidate_schema, row, metadata)
@@ -100,7 +102,7 @@ class IPACAvroExporter(BaseAvroExporter):
 
             prv_candidates = []
 
-            if SOURCE_HISTORY_KEY in row.keys():
+            if SOURCE_HISTORY_KEY in row:
                 prv_cands = row[SOURCE_HISTORY_KEY]
                 if len(prv_cands) > 0:
 
@@ -2,19 +2,22 @@
 Module containing the :class:`~wintedrp.processors.BaseProcessor`
 """
 
+import copy
 import datetime
 import getpass
 import hashlib
 import logging
+import os
 import socket
 import threading
 from abc import ABC
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
 from queue import Queue
 from threading import Thread
 from typing import Callable
 
-import numpy as np
 import pandas as pd
 from tqdm.auto import tqdm
 
@@ -41,6 +44,29 @@ from mirar.paths import (
 
 logger = logging.getLogger(__name__)
 
+# Number of cached images (e.g. master flats) each processor keeps in memory
+CAL_CACHE_SIZE = int(os.getenv("CAL_CACHE_SIZE", "32"))
+
+
+@cache
+def get_reducer() -> str:
+    """
+    Get the user running the pipeline, which does not change during a run
+
+    :return: user name
+    """
+    return getpass.getuser()
+
+
+@cache
+def get_reduction_machine() -> str:
+    """
+    Get the name of the machine running the pipeline
+
+    :return: host name
+    """
+    return socket.gethostname()
+
 
 class PrerequisiteError(ProcessorError):
     """
@@ -132,6 +158,16 @@ class BaseProcessor:
         self.night_sub_dir = night_sub_dir
         self.night = night_sub_dir.split("/")[-1]
 
+    def make_output_dir(self, output_dir: Path) -> Path:
+        """
+        Make an output directory if it does not exist
+
+        :param output_dir: output directory
+        :return: output directory
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+
     def generate_error_report(
         self, exception: Exception, batch: DataBatch
     ) -> ErrorReport:
@@ -172,6 +208,7 @@ class BaseProcessor:
         """
         del self.passed_batches[cache_id]
         del self.err_stack[cache_id]
+        self.progress.pop(cache_id, None)
 
     def base_apply(self, dataset: Dataset) -> tuple[Dataset, ErrorStack]:
         """
@@ -221,6 +258,12 @@ class BaseProcessor:
                 self.progress[cache_id].refresh()
                 self.progress[cache_id].close()
 
+            # Stop the workers, rather than leaving them waiting forever
+            for _ in workers:
+                watchdog_queue.put(item=None)
+            for worker in workers:
+                worker.join()
+
         new_dataset = []
 
         for key in sorted(self.passed_batches[cache_id].keys()):
@@ -240,14 +283,20 @@ class BaseProcessor:
     def apply_to_batch(self, queue, cache_id: int):
         """
         Function to run self.apply on a batch in the queue, catch any errors, and then
-        update the internal cache with the results.
+        update the internal cache with the results. Returns once None is
+        taken from the queue.
 
         :param queue: python threading queue
         :param cache_id: key for cache
         :return: None
         """
         while True:
-            j, batch = queue.get()
+            item = queue.get()
+            if item is None:
+                queue.task_done()
+                return
+
+            j, batch = item
             try:
                 batch = self.apply(batch)
                 self.passed_batches[cache_id][j] = batch
@@ -301,13 +350,13 @@ class BaseProcessor:
         :param batch: Input data batch
         :return: Updated data batch
         """
-        for i, data_block in enumerate(batch):
+        # Data blocks are updated in place, so the batch itself is unchanged
+        for data_block in batch:
             data_block[PROC_HISTORY_KEY] += self.base_key + ","
-            data_block["REDUCER"] = getpass.getuser()
-            data_block["REDMACH"] = socket.gethostname()
+            data_block["REDUCER"] = get_reducer()
+            data_block["REDMACH"] = get_reduction_machine()
             data_block["REDTIME"] = str(datetime.datetime.now())
             data_block["REDSOFT"] = PACKAGE_NAME
-            batch[i] = data_block
         return batch
 
     def check_duplicates(self, batch: DataBatch):
@@ -331,7 +380,10 @@ class CleanupProcessor(BaseProcessor, ABC):
 
     def update_dataset(self, dataset: Dataset) -> Dataset:
         # Remove empty dataset
-        new_dataset = Dataset([x for x in dataset.get_batches() if len(x) > 0])
+        new_dataset = Dataset()
+        for batch in dataset.get_batches():
+            if len(batch) > 0:
+                new_dataset.append(batch)
         return new_dataset
 
 
@@ -400,7 +452,9 @@ class ImageHandler:
                 logger.warning(
                     f"Could not find weight file {image.header[LATEST_WEIGHT_SAVE_KEY]}"
                 )
-        self.save_fits(Image(mask.astype(float), header), mask_path, compress=compress)
+        self.save_fits(
+            Image(mask.astype(float, copy=False), header), mask_path, compress=compress
+        )
 
         return mask_path
 
@@ -412,10 +466,13 @@ class ImageHandler:
         :param image_batch: image batch
         :return: unique hash for that batch
         """
-        key = "".join(
-            sorted([x[BASE_NAME_KEY] + x[PROC_HISTORY_KEY] for x in image_batch])
-        )
-        return hashlib.sha1(key.encode()).hexdigest()
+        # The hash only names cache files, so it need not be cryptographically secure
+        digest = hashlib.sha1(usedforsecurity=False)
+        for key in sorted(
+            f"{x[BASE_NAME_KEY]}{x[PROC_HISTORY_KEY]}" for x in image_batch
+        ):
+            digest.update(key.encode())
+        return digest.hexdigest()
 
 
 class BaseImageProcessor(BaseProcessor, ImageHandler, ABC):
@@ -453,6 +510,10 @@ class ProcessorWithCache(BaseImageProcessor, ABC):
         self.cache_sub_dir = cache_sub_dir
         self.cache_image_name_header_keys = cache_image_name_header_keys
 
+        # Most recently loaded cached images, evicted beyond CAL_CACHE_SIZE
+        self._loaded_cache_files: OrderedDict[tuple, Image] = OrderedDict()
+        self._loaded_cache_files_lock = threading.Lock()
+
     def select_cache_images(self, images: ImageBatch) -> ImageBatch:
         """
         Select the appropriate cached image for the batch
@@ -476,7 +537,7 @@ class ProcessorWithCache(BaseImageProcessor, ABC):
             base_name=file_name, dir_root=self.cache_sub_dir, sub_dir=self.night_sub_dir
         )
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.make_output_dir(output_path.parent)
 
         return output_path
 
@@ -514,18 +575,46 @@ class ProcessorWithCache(BaseImageProcessor, ABC):
 
         exists = path.exists()
 
-        if np.logical_and(self.try_load_cache, exists):
-            logger.debug(f"Loading cached file {path}")
-            return self.open_fits(path)
+        if self.try_load_cache and exists:
+            return self.load_cache_file(path)
 
         image = self.make_image(images)
 
         if self.write_to_cache:
-            if np.sum([not exists, self.overwrite]) > 0:
+            if (not exists) or self.overwrite:
                 self.save_fits(image, path)
 
         return image
 
+    def load_cache_file(self, path: Path) -> Image:
+        """
+        Load a cached image from disk.
+        The most recently loaded images (up to CAL_CACHE_SIZE, set via the
+        CAL_CACHE_SIZE environment variable) are kept in memory, keyed on
+        their modification time and size, so a file is only reloaded
+        if it has changed. A copy is returned, which can be freely modified.
+
+        :param path: path of cached image
+        :return: cached image
+        """
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+        with self._loaded_cache_files_lock:
+            image = self._loaded_cache_files.get(key)
+            if image is not None:
+                self._loaded_cache_files.move_to_end(key)
+
+        if image is None:
+            logger.debug(f"Loading cached file {path}")
+            image = self.open_fits(path)
+            with self._loaded_cache_files_lock:
+                self._loaded_cache_files[key] = image
+                while len(self._loaded_cache_files) > CAL_CACHE_SIZE:
+                    self._loaded_cache_files.popitem(last=False)
+
+        return copy.deepcopy(image)
+
     def make_image(self, images: ImageBatch) -> Image:
         """
         Make a cached image (e.g master flat)
@@ -624,17 +713,18 @@ class BaseSourceProcessor(BaseProcessor, ABC):
         raise NotImplementedError
 
     @staticmethod
-    def generate_super_dict(metadata: dict, source_row: pd.Series) -> dict:
+    def generate_super_dict(metadata: dict, source_row: pd.Series | dict) -> dict:
         """
         Generate a dictionary of metadata and candidate row, with lower case keys
 
         :param metadata: Metadata for the source table
-        :param source_row: Individual row of the source table
+        :param source_row: Individual row of the source table (Series or dict)
         :return: Combined dictionary
         """
+        if isinstance(source_row, pd.Series):
+            source_row = source_row.to_dict()
+
         super_dict = {key.lower(): val for key, val in metadata.items()}
-        super_dict.update(
-            {key.lower(): val for key, val in source_row.to_dict().items()}
-        )
+        super_dict.update({key.lower(): val for key, val in source_row.items()})
         super_dict.update({key.upper(): val for key, val in super_dict.items()})
         return super_dict
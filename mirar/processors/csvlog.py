@@ -3,7 +3,6 @@ Module to generate a CSV log of observations
 """
 
 import logging
-import os
 from pathlib import Path
 from typing import Optional
 
@@ -73,10 +72,7 @@ class CSVLog(BaseImageProcessor):
             sub_dir=self.output_sub_dir,
         )
 
-        try:
-            os.makedirs(os.path.dirname(output_path))
-        except OSError:
-            pass
+        self.make_output_dir(output_path.parent)
 
         return output_path
 
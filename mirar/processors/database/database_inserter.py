@@ -35,6 +35,7 @@ class BaseDatabaseInserter(BaseDatabaseProcessor, ABC):
 
     base_key = "dbinserter"
     max_n_cpu = 1
+    row_kind = "sources"
 
     def __init__(self, *args, duplicate_protocol: str = "fail", **kwargs):
         super().__init__(*args, **kwargs)
@@ -46,8 +47,7 @@ class BaseDatabaseInserter(BaseDatabaseProcessor, ABC):
 
     def description(self):
         return (
-            f"Processor to save "
-            f"{['sources', 'images'][isinstance(self, BaseImageProcessor)]} "
+            f"Processor to save {self.row_kind} "
             f"to the '{self.db_table.__name__}' table of "
             f"the '{self.db_name}' Postgres database."
         )
@@ -58,17 +58,22 @@ class DatabaseImageInserter(BaseDatabaseInserter, BaseImageProcessor):
     Processor for exporting images to a database
     """
 
+    row_kind = "images"
+
     def _apply_to_images(self, batch: ImageBatch) -> ImageBatch:
-        for image in batch:
-            val_dict = self.generate_value_dict(image)
+        entries = self.db_table.validate_entries(
+            [self.generate_value_dict(x) for x in batch]
+        )
 
-            new = self.db_table(**val_dict)
-            res = new.insert_entry(duplicate_protocol=self.duplicate_protocol)
+        res = self.db_table.insert_entries(
+            entries, duplicate_protocol=self.duplicate_protocol
+        )
 
-            assert len(res) == 1
+        assert len(res) == len(batch)
 
+        for i, image in enumerate(batch):
             for key in res.columns:
-                image[key] = res[key].iloc[0]
+                image[key] = res[key].iloc[i]
         return batch
 
     @staticmethod
@@ -92,18 +97,19 @@ class DatabaseSourceInserter(BaseDatabaseInserter, BaseSourceProcessor):
             source_table = source_list.get_data()
             metadata = source_list.get_metadata()
 
-            primary_key_df_list = []
-            for _, source_row in source_table.iterrows():
-                super_dict = self.generate_super_dict(metadata, source_row)
-
-                new = self.db_table(**super_dict)
-                res = new.insert_entry(duplicate_protocol=self.duplicate_protocol)
+            entries = self.db_table.validate_entries(
+                [
+                    self.generate_super_dict(metadata, source_row)
+                    for source_row in source_table.to_dict(orient="records")
+                ]
+            )
 
-                assert len(res) == 1
+            primary_key_df = self.db_table.insert_entries(
+                entries, duplicate_protocol=self.duplicate_protocol
+            )
 
-                primary_key_df_list.append(res.loc[0])
+            assert len(primary_key_df) == len(source_table)
 
-            primary_key_df = pd.DataFrame(primary_key_df_list).reset_index(drop=True)
             for key in primary_key_df:
                 source_table[key] = primary_key_df[key]
 
@@ -119,11 +125,7 @@ class DatabaseImageBatchInserter(DatabaseImageInserter):
 
     def _apply_to_images(self, batch: ImageBatch) -> ImageBatch:
         column_names = [
-            x
-            for x in self.db_table.__dict__["__annotations__"]
-            if (x != "sql_model")
-            & (x not in self.db_table.model_computed_fields.keys())
-            & (x in batch[0].keys())
+            x for x in self.db_table.get_column_names() if x in batch[0].keys()
         ]
 
         for column in column_names:
@@ -11,7 +11,11 @@ import pandas as pd
 
 from mirar.data import DataBlock, Image, ImageBatch, SourceBatch
 from mirar.database.constraints import DBQueryConstraints
-from mirar.database.transactions import select_from_table
+from mirar.database.transactions import (
+    crossmatch_many_from_table,
+    select_from_table,
+    select_many_from_table,
+)
 from mirar.paths import SOURCE_HISTORY_KEY
 from mirar.processors.base_processor import BaseImageProcessor, BaseSourceProcessor
 from mirar.processors.database.base_database_processor import BaseDatabaseProcessor
@@ -28,10 +32,12 @@ class BaseDatabaseSelector(BaseDatabaseProcessor, ABC):
         self,
         *args,
         boolean_match_key: Optional[str] = None,
+        use_cache: bool = False,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.boolean_match_key = boolean_match_key
+        self.use_cache = use_cache
 
     def get_constraints(self, data: dict) -> None | DBQueryConstraints:
         """
@@ -53,7 +59,7 @@ def update_header_with_single_match(data: DataBlock, res: list[dict]) -> DataBlo
     """
     assert len(res) == 1
 
-    for key, value in res[0]:
+    for key, value in res[0].items():
         data[key] = value
 
     return data
@@ -75,21 +81,40 @@ class BaseImageDatabaseSelector(BaseDatabaseSelector, BaseImageProcessor, ABC):
     ):
         super().__init__(**kwargs)
         self.update_header = update_header
+        if isinstance(db_output_columns, str):
+            db_output_columns = [db_output_columns]
         self.db_output_columns = db_output_columns
+        if isinstance(output_alias_map, str):
+            output_alias_map = [output_alias_map]
         self.output_alias_map = output_alias_map
 
+    def get_rename_map(self) -> dict[str, str]:
+        """
+        Get the mapping from database column names to output header keys
+
+        :return: rename map
+        """
+        assert self.output_alias_map is not None
+        assert len(self.db_output_columns) == len(self.output_alias_map)
+        return dict(zip(self.db_output_columns, self.output_alias_map))
+
     def _apply_to_images(
         self,
         batch: ImageBatch,
     ) -> ImageBatch:
-        for i, image in enumerate(batch):
-            query_constraints = self.get_constraints(image)
+        # All queries are independent, so send them together
+        results = select_many_from_table(
+            db_constraints=[self.get_constraints(image) for image in batch],
+            sql_table=self.db_table.sql_model,
+            output_columns=self.db_output_columns,
+            use_cache=self.use_cache,
+        )
 
-            res = select_from_table(
-                sql_table=self.db_table,
-                db_constraints=query_constraints,
-                output_columns=self.db_output_columns,
-            )
+        for i, (image, res) in enumerate(zip(batch, results)):
+            if self.output_alias_map is not None:
+                res = res.rename(columns=self.get_rename_map())
+
+            res = res.to_dict(orient="records")
 
             image = self.update_header(image, res)
 
@@ -181,24 +206,42 @@ class BaseDatabaseSourceSelector(BaseDatabaseSelector, BaseSourceProcessor, ABC)
         for source_table in batch:
             metadata = source_table.get_metadata()
             candidate_table = source_table.get_data()
-            results = []
-            for _, source in candidate_table.iterrows():
-
-                res = self.query_for_source(source, metadata)
-
-                results.append(res)
-
+            results = self.query_sources(candidate_table, metadata)
             new_table = self.update_dataframe(candidate_table, results)
             source_table.set_data(new_table)
         return batch
 
-    def query_for_source(self, source: pd.Series, metadata: dict) -> pd.DataFrame:
+    def query_sources(
+        self, candidate_table: pd.DataFrame, metadata: dict
+    ) -> list[pd.DataFrame]:
         """
-        Query the database for a single source
+        Query the database for every source in a table
+
+        :param candidate_table: Source table
+        :param metadata: Source Batch metadata
+        :return: Results from the database, one per source
+        """
+        # All queries are independent, so send them together
+        return select_many_from_table(
+            db_constraints=[
+                self.get_source_constraints(source, metadata)
+                for _, source in candidate_table.iterrows()
+            ],
+            sql_table=self.db_table.sql_model,
+            output_columns=self.db_output_columns,
+            max_num_results=self.max_num_results,
+            use_cache=self.use_cache,
+        )
+
+    def get_source_constraints(
+        self, source: pd.Series, metadata: dict
+    ) -> DBQueryConstraints:
+        """
+        Get the full query constraints for a single source
 
         :param source: Source data
         :param metadata: Source Batch metadata
-        :return: Results from the database
+        :return: Query constraints
         """
         super_dict = self.generate_super_dict(metadata, source)
         query_constraints = self.get_constraints(super_dict)
@@ -206,11 +249,23 @@ class BaseDatabaseSourceSelector(BaseDatabaseSelector, BaseSourceProcessor, ABC)
         if self.additional_query_constraints is not None:
             query_constraints = query_constraints + self.additional_query_constraints
         logger.debug(f"Query constraints: " f"{query_constraints.parse_constraints()}")
+        return query_constraints
+
+    def query_for_source(self, source: pd.Series, metadata: dict) -> pd.DataFrame:
+        """
+        Query the database for a single source
+
+        :param source: Source data
+        :param metadata: Source Batch metadata
+        :return: Results from the database
+        """
+        query_constraints = self.get_source_constraints(source, metadata)
         res = select_from_table(
             sql_table=self.db_table.sql_model,
             db_constraints=query_constraints,
             output_columns=self.db_output_columns,
             max_num_results=self.max_num_results,
+            use_cache=self.use_cache,
         )
         return res
 
@@ -235,18 +290,21 @@ class DatabaseSingleMatchSelector(BaseDatabaseSourceSelector, ABC):
         """
         assert len(results) == len(candidate_table)
 
-        new_cols = []
+        no_match = dict.fromkeys(self.db_output_columns)
+
+        new_cols: list[dict] = []
         for res in results:
             if len(res) > 0:
                 assert len(res) == 1
-                new_row = {x: res.iloc[0][x] for x in self.db_output_columns}
-
+                new_cols += res[self.db_output_columns].to_dict(orient="records")
             else:
-                new_row = {x: None for x in self.db_output_columns}
-
-            new_cols.append(new_row)
+                new_cols.append(no_match)
 
-        candidate_table = candidate_table.join(pd.DataFrame(new_cols))
+        candidate_table = candidate_table.join(
+            pd.DataFrame(
+                new_cols, index=candidate_table.index, columns=self.db_output_columns
+            )
+        )
 
         return candidate_table
 
@@ -282,6 +340,11 @@ class BaseSpatialCrossmatchSource(BaseDatabaseSourceSelector, ABC):
     Processor to crossmatch to sources in a database using spatial search
     """
 
+    # Whether all sources can be crossmatched in a single joined query.
+    # This requires the constraints for each source to be purely spatial,
+    # so it is also skipped for subclasses which override the constraints.
+    batch_crossmatch = True
+
     def __init__(
         self,
         crossmatch_radius_arcsec: float,
@@ -321,6 +384,45 @@ class BaseSpatialCrossmatchSource(BaseDatabaseSourceSelector, ABC):
     def get_constraints(self, data: dict) -> DBQueryConstraints:
         return self.get_source_crossmatch_constraints(data)
 
+    def can_batch_crossmatch(self) -> bool:
+        """
+        Check whether sources can be crossmatched in a single joined query,
+        which only applies the spatial constraint (and the additional constraints)
+
+        :return: boolean
+        """
+        cls = type(self)
+        return (
+            self.batch_crossmatch
+            and (not self.use_cache)
+            and cls.get_constraints is BaseSpatialCrossmatchSource.get_constraints
+            and cls.get_source_crossmatch_constraints
+            is BaseSpatialCrossmatchSource.get_source_crossmatch_constraints
+        )
+
+    def query_sources(
+        self, candidate_table: pd.DataFrame, metadata: dict
+    ) -> list[pd.DataFrame]:
+        if not self.can_batch_crossmatch():
+            return super().query_sources(candidate_table, metadata)
+
+        super_dicts = [
+            self.generate_super_dict(metadata, source)
+            for source in candidate_table.to_dict(orient="records")
+        ]
+
+        return crossmatch_many_from_table(
+            ra=[x["ra"] for x in super_dicts],
+            dec=[x["dec"] for x in super_dicts],
+            crossmatch_radius_arcsec=self.xmatch_radius_arcsec,
+            sql_table=self.db_table.sql_model,
+            ra_field_name=self.ra_field_name,
+            dec_field_name=self.dec_field_name,
+            db_constraints=self.additional_query_constraints,
+            output_columns=self.db_output_columns,
+            max_num_results=self.max_num_results,
+        )
+
 
 class SingleSpatialCrossmatchSource(
     BaseSpatialCrossmatchSource, DatabaseSingleMatchSelector
@@ -358,6 +460,9 @@ class DatabaseHistorySelector(SpatialCrossmatchSourceWithDatabase):
     Processor to import previous detections of a source from a database
     """
 
+    # The time window differs for each source
+    batch_crossmatch = False
+
     def __init__(
         self,
         history_duration_days: float,
@@ -6,11 +6,13 @@ import logging
 from abc import ABC
 from typing import Optional
 
-import pandas as pd
-
 from mirar.data import ImageBatch
+from mirar.database.base_model import BaseDB
 from mirar.database.constraints import DBQueryConstraints
-from mirar.database.transactions import select_from_table
+from mirar.database.transactions import (
+    _update_many_database_entries,
+    select_many_from_table,
+)
 from mirar.database.utils import get_sequence_key_names_from_table
 from mirar.processors.database.database_inserter import DatabaseImageInserter
 from mirar.processors.database.database_selector import (
@@ -118,18 +120,20 @@ class ImageDatabaseMultiEntryUpdater(ImageSequenceDatabaseUpdater):
             except ValueError as exc:
                 raise ValueError("Sequence keys must be integers") from exc
 
-            data_df = pd.DataFrame(unique_key_vals, columns=[self.sequence_key])
+            all_old = select_many_from_table(
+                db_constraints=[
+                    DBQueryConstraints(columns=self.sequence_key, accepted_values=x)
+                    for x in unique_key_vals
+                ],
+                sql_table=self.db_table.sql_model,
+            )
 
-            for _, row in data_df.iterrows():
-                constraints = DBQueryConstraints(
-                    columns=self.sequence_key, accepted_values=row[self.sequence_key]
-                )
+            # Batching is only possible if update_entry has not been customised
+            batch_updates = self.db_table.update_entry is BaseDB.update_entry
 
-                old = select_from_table(
-                    db_constraints=constraints,
-                    sql_table=self.db_table.sql_model,
-                )
+            update_dicts: list[dict] = []
 
+            for old in all_old:
                 assert (
                     len(old) == 1
                 ), f"Multiple entries found for unique key {self.sequence_key}"
@@ -139,6 +143,22 @@ class ImageDatabaseMultiEntryUpdater(ImageSequenceDatabaseUpdater):
 
                 new = self.db_table(**old.to_dict(orient="records")[0])
 
-                new.update_entry(update_keys=self.db_alter_columns)
+                if not batch_updates:
+                    new.update_entry(update_keys=self.db_alter_columns)
+                    continue
+
+                update_dicts.append(
+                    {
+                        self.sequence_key: old[self.sequence_key].iloc[0],
+                        **new.get_update_dict(self.db_alter_columns),
+                    }
+                )
+
+            # All entries are written in one batch, rather than one update each
+            _update_many_database_entries(
+                update_dicts=update_dicts,
+                key_names=self.sequence_key,
+                sql_table=self.db_table.sql_model,
+            )
 
         return batch
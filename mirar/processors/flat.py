@@ -118,7 +118,7 @@ class FlatCalibrator(ProcessorWithCache):
             data = img.get_data().copy()
 
             if self.flat_mask_key is not None:
-                if self.flat_mask_key not in img.header.keys():
+                if self.flat_mask_key not in img.header:
                     err = (
                         f"Image {img} does not have a mask with key "
                         f"{self.flat_mask_key}"
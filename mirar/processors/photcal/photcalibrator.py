@@ -241,14 +241,14 @@ class PhotCalibrator(BaseProcessorWithCrossMatch):
                     # Check if the right zeropoint keys are in the image header
                     for key in [f"ZP_{aper}", f"ZP_{aper}_std", f"ZP_{aper}_nstars"]:
                         assert (
-                            key in image.header.keys()
+                            key in image.header
                         ), f"Zeropoint key {key} not found in image header."
                     zp_values.append(image[f"ZP_{aper}"])
                     if col in ["MAG_AUTO", "MAG_PSF", "MAG_POINTSOURCE"]:
                         aperture_diameters.append(med_fwhm_pix * 2)
                     else:
                         aperture_diameters.append(float(aper))
-                if sextractor_checkimg_map["BACKGROUND_RMS"] in image.header.keys():
+                if sextractor_checkimg_map["BACKGROUND_RMS"] in image.header:
                     logger.debug(
                         "Calculating limiting magnitudes from background RMS file"
                     )
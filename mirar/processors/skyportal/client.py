@@ -7,6 +7,7 @@ import os
 from typing import Mapping, Optional
 from urllib.parse import urljoin
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
@@ -57,7 +58,7 @@ class SkyportalClient:
     ):
         self.base_url = base_url
         self._session = None
-        self.session_headers = None
+        self.session_headers: Optional[dict[str, str]] = None
 
     def set_up_session(self):
         """
@@ -114,6 +115,18 @@ class SkyportalClient:
 
         return token_fritz
 
+    @staticmethod
+    def serialize(data: Optional[Mapping]) -> bytes:
+        """
+        Serialize data to JSON bytes using orjson.
+        Numpy arrays and scalars are serialized natively,
+        without first being converted to python lists.
+
+        :param data: data to serialize
+        :return: JSON-encoded bytes
+        """
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
     def api(
         self, method: str, endpoint: str, data: Optional[Mapping] = None
     ) -> requests.Response:
@@ -124,7 +137,7 @@ class SkyportalClient:
 
         :param method: HTTP method
         :param endpoint: API endpoint
-        :param data: JSON data to send
+        :param data: JSON data to send (may contain numpy arrays)
         :return: response from API call
         """
         method = method.lower()
@@ -153,11 +166,17 @@ class SkyportalClient:
                 params=data,
                 headers=self.session_headers,
             )
+        elif data is None:
+            # Send no body at all, rather than a serialised 'null'
+            response = methods[method](url, headers=self.session_headers)
         else:
             response = methods[method](
                 url,
-                json=data,
-                headers=self.session_headers,
+                data=self.serialize(data),
+                headers={
+                    **(self.session_headers or {}),
+                    "Content-Type": "application/json",
+                },
             )
 
         return response
@@ -3,7 +3,9 @@ Module for sending candidates to Fritz.
 """
 
 import logging
+from concurrent.futures import Future
 from datetime import datetime
+from typing import Optional
 
 from astropy.time import Time
 
@@ -175,38 +177,48 @@ class SkyportalCandidateUploader(SkyportalSourceUploader):
                 )
                 logger.error(response.json())
 
-    def export_to_skyportal(self, alert):
-        """
-        Posts a candidate to SkyPortal.
+    def get_skyportal_status(self, alert: dict) -> dict[str, bool]:
+        """Get whether an alert already exists on SkyPortal,
+        as a candidate and as a source
 
-        :param alert: _description_
-        :type alert: _type_
+        :param alert: dict of candidate information
+        :return: status, as passed to export_to_skyportal
         """
-        # check if candidate exists in SkyPortal
-        logger.debug(f"Checking if {alert[SOURCE_NAME_KEY]} is candidate in SkyPortal")
-        response = self.api("HEAD", f"candidates/{alert[SOURCE_NAME_KEY]}")
+        return {
+            "is_candidate": self.skyportal_check_exists(alert, "candidate"),
+            "is_source": self.skyportal_check_exists(alert, "source"),
+        }
 
-        if response.status_code not in [200, 404]:
-            response.raise_for_status()
+    def needs_thumbnails(self, status: dict[str, bool]) -> bool:
+        """Whether export_to_skyportal will post thumbnails for an alert,
+        i.e. if thumbnails are updated or it is neither a candidate nor a source
 
-        is_candidate = response.status_code == 200
-        logger.debug(
-            f"{alert[SOURCE_NAME_KEY]} {'is' if is_candidate else 'is not'} "
-            f"candidate in SkyPortal"
+        :param status: status of the alert on SkyPortal
+        :return: whether thumbnails will be posted
+        """
+        return self.update_thumbnails or not (
+            status["is_candidate"] or status["is_source"]
         )
 
-        # check if source exists in SkyPortal
-        logger.debug(f"Checking if {alert[SOURCE_NAME_KEY]} is source in SkyPortal")
-        response = self.api("HEAD", f"sources/{alert[SOURCE_NAME_KEY]}")
+    def export_to_skyportal(
+        self,
+        alert,
+        thumbnails: Optional[Future | list[dict]] = None,
+        status: Optional[dict[str, bool]] = None,
+    ):
+        """
+        Posts a candidate to SkyPortal.
 
-        if response.status_code not in [200, 404]:
-            response.raise_for_status()
+        :param alert: _description_
+        :type alert: _type_
+        :param thumbnails: pre-rendered thumbnails (or a future for them)
+        :param status: status of the alert on SkyPortal, if already checked
+        """
+        if status is None:
+            status = self.get_skyportal_status(alert)
 
-        is_source = response.status_code == 200
-        logger.debug(
-            f"{alert[SOURCE_NAME_KEY]} "
-            f"{'is' if is_source else 'is not'} source in SkyPortal"
-        )
+        is_candidate = status["is_candidate"]
+        is_source = status["is_source"]
 
         # object does not exist in SkyPortal: neither cand nor source
         if (not is_candidate) and (not is_source):
@@ -221,7 +233,7 @@ class SkyportalCandidateUploader(SkyportalSourceUploader):
             self.skyportal_put_photometry(alert)
 
             # post thumbnails
-            self.skyportal_post_thumbnails(alert)
+            self.skyportal_post_thumbnails(alert, thumbnails=thumbnails)
 
         # obj already exists in SkyPortal
         else:
@@ -259,6 +271,6 @@ class SkyportalCandidateUploader(SkyportalSourceUploader):
             self.skyportal_put_photometry(alert)
 
             if self.update_thumbnails:
-                self.skyportal_post_thumbnails(alert)
+                self.skyportal_post_thumbnails(alert, thumbnails=thumbnails)
 
         logger.debug(f"SendToSkyportal Manager complete for {alert[SOURCE_NAME_KEY]}")
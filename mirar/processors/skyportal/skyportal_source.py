@@ -3,7 +3,8 @@ Module for sending sources to Fritz.
 """
 
 import logging
-from copy import deepcopy
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Mapping, Optional
 
 import matplotlib
@@ -15,7 +16,7 @@ from astropy.time import Time
 from mirar.data import SourceBatch
 from mirar.data.utils import decode_img
 from mirar.paths import SOURCE_HISTORY_KEY, SOURCE_NAME_KEY, TIME_KEY
-from mirar.processors.base_processor import BaseSourceProcessor
+from mirar.processors.base_processor import BaseProcessor, BaseSourceProcessor
 from mirar.processors.skyportal.client import SkyportalClient
 from mirar.processors.skyportal.thumbnail import make_thumbnail
 
@@ -25,6 +26,86 @@ logger = logging.getLogger(__name__)
 
 SNCOSMO_KEY = "sncosmof"
 
+# Mapping of source keys to SkyPortal photometry keys
+PHOTOMETRY_COLUMNS = {
+    "mjd": "mjd",
+    "magpsf": "mag",
+    "sigmapsf": "magerr",
+    SNCOSMO_KEY: "filter",
+    "ra": "ra",
+    "dec": "dec",
+}
+
+THUMBNAIL_TYPES = [
+    ("new", "science"),
+    ("ref", "template"),
+    ("sub", "difference"),
+]
+
+
+def make_skyportal_thumbnail(
+    source: Mapping | pd.Series, skyportal_type: str, alert_packet_type: str
+) -> dict:
+    """
+    Convert lossless FITS cutouts from ZTF-like alerts into PNGs.
+    Make thumbnail for pushing to SkyPortal.
+
+    :param source: ZTF-like alert packet/dict
+    :param skyportal_type: <new|ref|sub> thumbnail type expected by SkyPortal
+    :param alert_packet_type: <Science|Template|Difference> survey naming
+    :return: Thumbnail dictionary
+    """
+    cutout_data = source[f"cutout_{alert_packet_type}"]
+
+    linear_stretch = alert_packet_type.lower() in ["difference"]
+
+    skyportal_thumbnail = make_thumbnail(
+        image_data=decode_img(cutout_data),
+        linear_stretch=linear_stretch,
+    )
+
+    thumbnail_dict = {
+        "obj_id": source[SOURCE_NAME_KEY],
+        "data": skyportal_thumbnail,
+        "ttype": skyportal_type,
+    }
+
+    return thumbnail_dict
+
+
+def make_skyportal_thumbnails(source: Mapping | pd.Series) -> list[dict]:
+    """
+    Make all SkyPortal thumbnails for a source. This is purely CPU-bound,
+    and does not interact with SkyPortal, so can be run in a separate process.
+
+    :param source: ZTF-like alert packet/dict
+    :return: List of thumbnail dictionaries
+    """
+    thumbnails = []
+    for ttype, instrument_type in THUMBNAIL_TYPES:
+        logger.debug(
+            f"Making {instrument_type} thumbnail for {source[SOURCE_NAME_KEY]} "
+        )
+        try:
+            thumbnails.append(make_skyportal_thumbnail(source, ttype, instrument_type))
+        except KeyError:
+            logger.error(
+                f"Missing {instrument_type} cutout for {source[SOURCE_NAME_KEY]}"
+            )
+    return thumbnails
+
+
+def get_thumbnail_source(source: Mapping) -> dict:
+    """
+    Get the minimal subset of an alert needed to make thumbnails,
+    to limit the data sent to worker processes.
+
+    :param source: ZTF-like alert packet/dict
+    :return: Dictionary with source name and cutouts
+    """
+    keys = [SOURCE_NAME_KEY] + [f"cutout_{x}" for _, x in THUMBNAIL_TYPES]
+    return {key: source[key] for key in keys if key in source}
+
 
 class SkyportalSourceUploader(BaseSourceProcessor):
     """
@@ -61,18 +142,95 @@ class SkyportalSourceUploader(BaseSourceProcessor):
         :param batch: SourceBatch to process
         :return: SourceBatch after processing
         """
-        for source_table in batch:
-            candidate_df = source_table.get_data()
+        executor = None
+        try:
+            for source_table in batch:
+                candidate_df = source_table.get_data()
+
+                metadata = source_table.get_metadata()
+
+                candidate_df["mjd"] = Time(metadata[TIME_KEY]).mjd
+
+                # Convert the table to records column-wise in one go, rather than
+                # building (and deep-copying) a pd.Series for each row
+                alerts = [
+                    self.generate_super_dict(metadata, src)
+                    for src in candidate_df.fillna("").to_dict(orient="records")
+                ]
+
+                # Check what already exists on SkyPortal first, so that
+                # thumbnails are only rendered for alerts which will post them
+                statuses = [self.get_skyportal_status(x) for x in alerts]
+                to_render = [self.needs_thumbnails(x) for x in statuses]
+
+                if (executor is None) and (sum(to_render) > 1):
+                    # Render thumbnails in parallel processes, while the main
+                    # thread handles the (IO-bound) communication with SkyPortal.
+                    # Workers are spawned rather than forked, as forking this
+                    # multithreaded process could copy locks held by other threads.
+                    executor = ProcessPoolExecutor(
+                        max_workers=BaseProcessor.max_n_cpu,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
 
-            metadata = source_table.get_metadata()
+                # Alerts without a future render their thumbnails as needed
+                futures = [
+                    (
+                        executor.submit(
+                            make_skyportal_thumbnails, get_thumbnail_source(alert)
+                        )
+                        if render and (executor is not None)
+                        else None
+                    )
+                    for alert, render in zip(alerts, to_render)
+                ]
 
-            candidate_df["mjd"] = Time(metadata[TIME_KEY]).mjd
-            for _, src in candidate_df.iterrows():
-                super_dict = self.generate_super_dict(metadata, src.fillna(""))
-                self.export_to_skyportal(deepcopy(super_dict))
+                for alert, status, thumbnails in zip(alerts, statuses, futures):
+                    self.export_to_skyportal(
+                        alert, thumbnails=thumbnails, status=status
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         return batch
 
+    def skyportal_check_exists(self, alert: dict, kind: str) -> bool:
+        """Check whether an alert already exists on SkyPortal
+
+        :param alert: dict of source/candidate information
+        :param kind: <source|candidate> type of SkyPortal object to check
+        :return: boolean object exists
+        """
+        logger.debug(f"Checking if {alert[SOURCE_NAME_KEY]} is {kind} in SkyPortal")
+        response = self.api("HEAD", f"{kind}s/{alert[SOURCE_NAME_KEY]}")
+
+        if response.status_code not in [200, 404]:
+            response.raise_for_status()
+
+        exists = response.status_code == 200
+        logger.debug(
+            f"{alert[SOURCE_NAME_KEY]} {'is' if exists else 'is not'} "
+            f"{kind} in SkyPortal"
+        )
+        return exists
+
+    def get_skyportal_status(self, alert: dict) -> dict[str, bool]:
+        """Get the existing state of an alert on SkyPortal
+
+        :param alert: dict of source/candidate information
+        :return: status, as passed to export_to_skyportal
+        """
+        return {"is_source": self.skyportal_check_exists(alert, "source")}
+
+    def needs_thumbnails(self, status: dict[str, bool]) -> bool:
+        """Whether export_to_skyportal will post thumbnails for an alert
+
+        :param status: status of the alert on SkyPortal
+        :return: whether thumbnails will be posted
+        """
+        return self.update_thumbnails or (not status["is_source"])
+
     def skyportal_post_source(self, alert: dict, group_ids: Optional[list[int]] = None):
         """Add a new source to SkyPortal
 
@@ -128,60 +286,40 @@ class SkyportalSourceUploader(BaseSourceProcessor):
         :param alert_packet_type: <Science|Template|Difference> survey naming
         :return:
         """
-        source = deepcopy(source)
-        cutout_data = source[f"cutout_{alert_packet_type}"]
-
-        linear_stretch = alert_packet_type.lower() in ["difference"]
+        return make_skyportal_thumbnail(source, skyportal_type, alert_packet_type)
 
-        skyportal_thumbnail = make_thumbnail(
-            image_data=decode_img(cutout_data),
-            linear_stretch=linear_stretch,
-        )
-
-        thumbnail_dict = {
-            "obj_id": source[SOURCE_NAME_KEY],
-            "data": skyportal_thumbnail,
-            "ttype": skyportal_type,
-        }
-
-        return thumbnail_dict
-
-    def skyportal_post_thumbnails(self, alert):
+    def skyportal_post_thumbnails(
+        self, alert, thumbnails: Optional[Future | list[dict]] = None
+    ):
         """Post alert Science, Reference, and Subtraction thumbnails to SkyPortal
 
         :param alert: dict of source/candidate information
+        :param thumbnails: pre-rendered thumbnails (or a future for them),
+            if None, the thumbnails will be made from the alert
         :return: None
         """
-        for ttype, instrument_type in [
-            ("new", "science"),
-            ("ref", "template"),
-            ("sub", "difference"),
-        ]:
-            logger.debug(
-                f"Making {instrument_type} thumbnail for {alert[SOURCE_NAME_KEY]} "
-            )
-            try:
-                thumb = self.make_thumbnail(alert, ttype, instrument_type)
-            except KeyError:
-                logger.error(
-                    f"Missing {instrument_type} cutout for {alert[SOURCE_NAME_KEY]}"
-                )
-                continue
+        if thumbnails is None:
+            thumbs = make_skyportal_thumbnails(alert)
+        elif isinstance(thumbnails, Future):
+            thumbs = thumbnails.result()
+        else:
+            thumbs = thumbnails
 
+        for thumb in thumbs:
             logger.debug(
-                f"Posting {instrument_type} thumbnail for {alert[SOURCE_NAME_KEY]} "
+                f"Posting {thumb['ttype']} thumbnail for {alert[SOURCE_NAME_KEY]} "
             )
             response = self.api("POST", "thumbnail", thumb)
 
             if response.json()["status"] == "success":
                 logger.debug(
                     f"Posted {alert[SOURCE_NAME_KEY]} "
-                    f"{instrument_type} cutout to SkyPortal"
+                    f"{thumb['ttype']} cutout to SkyPortal"
                 )
             else:
                 logger.error(
                     f"Failed to post {alert[SOURCE_NAME_KEY]} "
-                    f"{instrument_type} cutout to SkyPortal"
+                    f"{thumb['ttype']} cutout to SkyPortal"
                 )
                 logger.error(response.json())
 
@@ -194,34 +332,23 @@ class SkyportalSourceUploader(BaseSourceProcessor):
         :return: pandas.DataFrame with photometry
         """
 
-        photometry_table = [
-            {
-                "mjd": source["mjd"],
-                "mag": source["magpsf"],
-                "magerr": source["sigmapsf"],
-                "filter": source[SNCOSMO_KEY],
-                "ra": source["ra"],
-                "dec": source["dec"],
-            }
-        ]
+        df_photometry = pd.DataFrame(
+            [{new: source[old] for old, new in PHOTOMETRY_COLUMNS.items()}]
+        )
 
         if SOURCE_HISTORY_KEY in source:
             if len(source[SOURCE_HISTORY_KEY]) > 0:
                 prv_detections = pd.DataFrame.from_records(source[SOURCE_HISTORY_KEY])
 
-                for _, row in prv_detections.iterrows():
-                    photometry_table.append(
-                        {
-                            "mjd": row["mjd"],
-                            "mag": row["magpsf"],
-                            "magerr": row["sigmapsf"],
-                            "filter": row[SNCOSMO_KEY],
-                            "ra": row["ra"],
-                            "dec": row["dec"],
-                        }
-                    )
+                # Select and rename the history columns in one go,
+                # rather than rebuilding each row as a dictionary
+                prv_photometry = prv_detections.loc[
+                    :, list(PHOTOMETRY_COLUMNS.keys())
+                ].rename(columns=PHOTOMETRY_COLUMNS)
 
-        df_photometry = pd.DataFrame(photometry_table)
+                df_photometry = pd.concat(
+                    [df_photometry, prv_photometry], ignore_index=True
+                )
 
         df_photometry["magsys"] = "ab"
 
@@ -254,7 +381,15 @@ class SkyportalSourceUploader(BaseSourceProcessor):
         df_photometry = self.make_photometry(alert)
 
         if len(df_photometry) > 0:
-            photometry = df_photometry.to_dict("list")
+            # Keep numeric columns as numpy arrays, which orjson serializes natively
+            photometry = {
+                key: (
+                    np.ascontiguousarray(df_photometry[key].to_numpy())
+                    if pd.api.types.is_numeric_dtype(df_photometry[key])
+                    else df_photometry[key].tolist()
+                )
+                for key in df_photometry.columns
+            }
             photometry["obj_id"] = alert[SOURCE_NAME_KEY]
             photometry["instrument_id"] = self.instrument_id
             if hasattr(self, "stream_id"):
@@ -269,35 +404,34 @@ class SkyportalSourceUploader(BaseSourceProcessor):
                 )
                 logger.error(response.json())
 
-    def export_to_skyportal(self, alert):
+    def export_to_skyportal(
+        self,
+        alert,
+        thumbnails: Optional[Future | list[dict]] = None,
+        status: Optional[dict[str, bool]] = None,
+    ):
         """
         Posts a source to SkyPortal.
 
         :param alert: _description_
         :type alert: _type_
+        :param thumbnails: pre-rendered thumbnails (or a future for them)
+        :param status: status of the alert on SkyPortal, if already checked
         """
-        # check if source exists in SkyPortal # pylint: disable=duplicate-code
-        logger.debug(f"Checking if {alert[SOURCE_NAME_KEY]} is source in SkyPortal")
-        response = self.api("HEAD", f"sources/{alert[SOURCE_NAME_KEY]}")
-
-        if response.status_code not in [200, 404]:
-            response.raise_for_status()
+        if status is None:
+            status = self.get_skyportal_status(alert)
 
-        is_source = response.status_code == 200
-        logger.debug(
-            f"{alert[SOURCE_NAME_KEY]} "
-            f"{'is' if is_source else 'is not'} source in SkyPortal"
-        )
+        is_source = status["is_source"]
 
         if not is_source:
             self.skyportal_post_source(alert, group_ids=self.group_ids)
             # post thumbnails
-            self.skyportal_post_thumbnails(alert)
+            self.skyportal_post_thumbnails(alert, thumbnails=thumbnails)
 
         # post full light curve
         self.skyportal_put_photometry(alert)
 
         if self.update_thumbnails:
-            self.skyportal_post_thumbnails(alert)
+            self.skyportal_post_thumbnails(alert, thumbnails=thumbnails)
 
         logger.debug(f"SendToSkyportal Manager complete for {alert[SOURCE_NAME_KEY]}")
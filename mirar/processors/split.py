@@ -89,7 +89,7 @@ class SplitImage(BaseImageProcessor):
                     new_header = copy.copy(image.get_header())
 
                     for key in ["DETSIZE", "INFOSEC", "TRIMSEC", "DATASEC"]:
-                        if key in new_header.keys():
+                        if key in new_header:
                             del new_header[key]
 
                     sub_img_id = f"{index_x}_{index_y}"
@@ -119,7 +119,7 @@ class SplitImage(BaseImageProcessor):
                     )
 
                     for key in [LATEST_SAVE_KEY, LATEST_WEIGHT_SAVE_KEY]:
-                        if key in new_header.keys():
+                        if key in new_header:
                             del new_header[key]
 
                     new_images.append(Image(data=new_data, header=new_header))
@@ -5,7 +5,8 @@ Module for loading images
 import logging
 import os
 from collections.abc import Callable
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from tqdm import tqdm
@@ -20,7 +21,7 @@ from mirar.io import (
     open_raw_image,
 )
 from mirar.paths import RAW_IMG_KEY, RAW_IMG_SUB_DIR, base_raw_dir
-from mirar.processors.base_processor import BaseImageProcessor
+from mirar.processors.base_processor import BaseImageProcessor, BaseProcessor
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +48,49 @@ def unzip(zipped_list: list[str]) -> list[str]:
     return unzipped_list
 
 
+def load_file(
+    path: str | Path,
+    open_f: Callable[[str | Path], Image | list[Image]],
+) -> list[Image]:
+    """
+    Load the images from a single file, skipping it if invalid or incomplete
+
+    :param path: Path of file
+    :param open_f: Function to open images
+    :return: List of images (empty if the file was skipped)
+    """
+    if not check_file_is_complete(str(path)):
+        logger.warning(f"File {path} is not complete. Skipping!")
+        return []
+
+    try:
+        image_list = open_f(path)
+
+        if not isinstance(image_list, list):
+            image_list = [image_list]
+
+        for image in image_list:
+            try:
+                check_image_has_core_fields(image)
+            except MissingCoreFieldError as err:
+                raise BadImageError(err) from err
+    except InvalidImage:
+        logger.warning(f"Image {path} is invalid. Skipping!")
+        return []
+    except BadImageError:
+        logger.error(f"Image {path} cannot be parsed. Skipping!")
+        return []
+
+    return image_list
+
+
 def load_from_list(
     img_list: list[str | Path],
     open_f: Callable[[str | Path], Image | list[Image]],
 ) -> ImageBatch:
     """
-    Load images from a list of files
+    Load images from a list of files.
+    Loading is mostly I/O-bound, so files are read in parallel threads.
 
     :param img_list: Image list
     :param open_f: Function to open images
@@ -60,26 +98,14 @@ def load_from_list(
     """
     images = ImageBatch()
 
-    for path in tqdm(img_list):
-        if check_file_is_complete(path):
-            try:
-                image_list = open_f(path)
-
-                if not isinstance(image_list, list):
-                    image_list = [image_list]
-
-                for image in image_list:
-                    try:
-                        check_image_has_core_fields(image)
-                    except MissingCoreFieldError as err:
-                        raise BadImageError(err) from err
-                    images.append(image)
-            except InvalidImage:
-                logger.warning(f"Image {path} is invalid. Skipping!")
-            except BadImageError:
-                logger.error(f"Image {path} cannot be parsed. Skipping!")
-        else:
-            logger.warning(f"File {path} is not complete. Skipping!")
+    n_cpu = max(min(BaseProcessor.max_n_cpu, len(img_list)), 1)
+
+    with ThreadPoolExecutor(max_workers=n_cpu) as executor:
+        # map returns the results in the same order as img_list
+        loaded = executor.map(partial(load_file, open_f=open_f), img_list)
+        for image_list in tqdm(loaded, total=len(img_list)):
+            for image in image_list:
+                images.append(image)
 
     return images
 
@@ -95,10 +121,21 @@ def load_from_dir(
     :param open_f: Function to open images
     :return: ImageBatch object
     """
-    img_list = sorted(glob(f"{input_dir}/*.fits"))
+    # List the directory once, rather than globbing it for each extension
+    try:
+        with os.scandir(input_dir) as entries:
+            file_list = [
+                entry.path
+                for entry in entries
+                if entry.is_file() and not entry.name.startswith(".")
+            ]
+    except FileNotFoundError:
+        file_list = []
+
+    img_list = sorted(x for x in file_list if x.endswith(".fits"))
 
     # check for zipped files too
-    zipped_list = sorted(glob(f"{input_dir}/*.fz"))
+    zipped_list = sorted(x for x in file_list if x.endswith(".fz"))
     if len(zipped_list) > 0:
         unzipped_list = unzip(zipped_list)
         for file in unzipped_list:
@@ -45,6 +45,24 @@ class ReferenceGenerationError(ProcessorError):
     """Error for reference generation"""
 
 
+def save_hdu_atomically(hdu: fits.PrimaryHDU, output_path: Path):
+    """
+    Save an hdu to a temporary file, and then move it into place, so that
+    output_path never points to a missing or partially-written file
+
+    :param hdu: hdu to save
+    :param output_path: final output path
+    :return: None
+    """
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        save_hdu_as_fits(hdu, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
 class BaseReferenceGenerator:
     """
     Base Reference Image Generator.
@@ -122,16 +140,13 @@ class BaseReferenceGenerator:
 
         # This is because Swarp requires the COADDS keyword. I am setting it to
         # zero manually
-        if COADD_KEY not in ref_hdu.header.keys():
+        if COADD_KEY not in ref_hdu.header:
             logger.debug("Setting COADDS to 1")
             ref_hdu.header[COADD_KEY] = 1
-        if PROC_HISTORY_KEY not in ref_hdu.header.keys():
+        if PROC_HISTORY_KEY not in ref_hdu.header:
             logger.debug("Setting CALSTEPS to blank")
             ref_hdu.header[PROC_HISTORY_KEY] = ""
 
-        # Remove if needed
-        output_path.unlink(missing_ok=True)
-
         logger.debug(f"Saving reference image to {output_path}")
         ref_hdu.header[BASE_NAME_KEY] = os.path.basename(output_path)
         ref_hdu.header[RAW_IMG_KEY] = os.path.basename(output_path)
@@ -139,16 +154,20 @@ class BaseReferenceGenerator:
         ref_hdu.header[TARGET_KEY] = image[TARGET_KEY]
         ref_hdu.header[PROC_FAIL_KEY] = False
 
-        if ("MJD-OBS" in ref_hdu.header.keys()) & (
-            "DATE-OBS" not in ref_hdu.header.keys()
-        ):
+        if ("MJD-OBS" in ref_hdu.header) & ("DATE-OBS" not in ref_hdu.header):
             ref_hdu.header["DATE-OBS"] = Time(
                 ref_hdu.header["MJD-OBS"], format="mjd"
             ).isot
 
-        ref_hdu.data[ref_hdu.data == 0] = np.nan  # pylint: disable=no-member
+        ref_data = ref_hdu.data  # pylint: disable=no-member
+        # NaN cannot be stored in integer arrays
+        if ref_data.dtype.kind != "f":
+            ref_data = ref_data.astype(float)
+        np.copyto(ref_data, np.nan, where=ref_data == 0)
+        # Keep the saved reference consistent with the in-memory image
+        ref_hdu.data = ref_data
 
-        ref_image = Image(header=ref_hdu.header, data=ref_hdu.data)
+        ref_image = Image(header=ref_hdu.header, data=ref_data)
 
         # Reference images should have all the core fields
         try:
@@ -161,19 +180,18 @@ class BaseReferenceGenerator:
                 str(self.get_output_path(output_dir, base_name)).replace(".fits", "")
                 + "_ref.weight.fits"
             )
-            output_weight_path.unlink(missing_ok=True)
             ref_weight_hdu.header[BASE_NAME_KEY] = os.path.basename(output_weight_path)
             ref_weight_hdu.header[OBSCLASS_KEY] = "WEIGHT"
             ref_weight_hdu.header[TARGET_KEY] = image[TARGET_KEY]
             ref_weight_hdu.header[PROC_FAIL_KEY] = False
             if self.write_image:
                 ref_weight_hdu.header[LATEST_SAVE_KEY] = output_weight_path.as_posix()
-                save_hdu_as_fits(ref_weight_hdu, output_weight_path)
+                save_hdu_atomically(ref_weight_hdu, output_weight_path)
                 ref_hdu.header[LATEST_WEIGHT_SAVE_KEY] = output_weight_path.as_posix()
 
         if self.write_image:
             ref_hdu.header[LATEST_SAVE_KEY] = output_path.as_posix()
-            save_hdu_as_fits(ref_hdu, output_path)
+            save_hdu_atomically(ref_hdu, output_path)
 
         if self.write_to_db:
             dbexporter = DatabaseImageInserter(
@@ -112,12 +112,12 @@ def combine_headers(primary_header: fits.Header, header_to_append: fits.Header):
     Returns:
         :return: combined header
     """
-    if "SIMPLE" not in primary_header.keys():
+    if "SIMPLE" not in primary_header:
         primary_header.insert(0, ("SIMPLE", True))
-    if "XTENSION" in primary_header.keys():
+    if "XTENSION" in primary_header:
         del primary_header["XTENSION"]
     for k in header_to_append.keys():
-        if k not in primary_header.keys():
+        if k not in primary_header:
             try:
                 primary_header[k] = header_to_append[k]
             except ValueError:
@@ -184,7 +184,7 @@ def make_wfcam_image_from_hdulist(
     combined_header[OBSCLASS_KEY] = "ref"
     combined_header[COADD_KEY] = 1
     for key in core_fields:
-        if key not in combined_header.keys():
+        if key not in combined_header:
             combined_header[key] = ""
     data = ukirt_hdulist[1].data
     image = Image(header=combined_header, data=data)
@@ -218,7 +218,7 @@ def make_wfcam_image_from_hdulist(
     image.header[ZP_STD_KEY] = image.header["MAGZRR"]
     image.header[COMPID_KEY] = int(f"{multiframeid}{extension_id}")
 
-    if "SEEING" not in image.header.keys():
+    if "SEEING" not in image.header:
         image.header["SEEING"] = -99
 
     return image
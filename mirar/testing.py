@@ -2,19 +2,61 @@
 Base class for unit testing, with common cleanup method
 """
 
+import logging
+import os
+import shutil
 import tempfile
 import unittest
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from mirar.data import Dataset, ImageBatch
 from mirar.data.cache import cache
+from mirar.errors import ErrorStack
 from mirar.paths import TEMP_DIR
 
+if TYPE_CHECKING:
+    from mirar.pipelines.base_pipeline import Pipeline
+
 
 class BaseTestCase(unittest.TestCase):
     """Base TestCase object with additional cleanup"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Only log pipeline warnings during tests, unless debugging is requested
+        if os.getenv("MIRAR_TEST_DEBUG", default="") != "":
+            logging.basicConfig(level=logging.DEBUG)
+        else:
+            logging.getLogger("mirar").setLevel(logging.WARNING)
+
     def __init__(self, *arg, **kwargs):
         super().__init__(*arg, **kwargs)
         # pylint: disable=consider-using-with
         self.temp_dir = tempfile.TemporaryDirectory(dir=TEMP_DIR)
         cache.set_cache_dir(self.temp_dir.name)
         self.addCleanup(self.temp_dir.cleanup)
+
+
+def reduce_test_pipeline(
+    pipeline: "Pipeline", output_dir: Path
+) -> tuple[Dataset, ErrorStack]:
+    """
+    Run a test pipeline on an empty dataset, and then delete its output directory.
+    Any output left behind by an aborted earlier run is removed first.
+    Tests should call this once in setUpClass, and share the result.
+
+    :param pipeline: pipeline to run
+    :param output_dir: output directory of the pipeline, to clean up
+    :return: Post-processing dataset and summary of errors caught
+    """
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+
+    res = pipeline.reduce_images(Dataset([ImageBatch()]), catch_all_errors=False)
+
+    # Cleanup - delete output dir
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+
+    return res
@@ -6,6 +6,7 @@ from mirar.utils.execute_cmd import (
     ExecutionError,
     TimeoutExecutionError,
     execute,
+    execute_with_cache,
     run_docker,
     run_local,
 )
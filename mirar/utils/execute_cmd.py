@@ -2,9 +2,14 @@
 Module for executing bash commands
 """
 
+import hashlib
 import logging
 import os
+import shlex
+import shutil
 import subprocess
+import tempfile
+from collections.abc import Sequence
 from pathlib import Path
 from subprocess import TimeoutExpired
 
@@ -30,6 +35,12 @@ class TimeoutExecutionError(Exception):
 
 DEFAULT_TIMEOUT = 300.0
 
+# Commands containing any of these need a shell to be interpreted correctly
+SHELL_CHARACTERS = frozenset("|&;<>()$`*?[]{}~#!=\n\\\"'")
+
+# Total size of cached outputs to keep, before the least recently used are removed
+EXECUTION_CACHE_MAX_BYTES = 10 * 1024**3
+
 
 def run_local(cmd: str, timeout: float = DEFAULT_TIMEOUT):
     """
@@ -50,14 +61,17 @@ def run_local(cmd: str, timeout: float = DEFAULT_TIMEOUT):
 
     """
 
+    # Simple commands are run directly, rather than via an extra shell process
+    use_shell = not isinstance(cmd, str) or not SHELL_CHARACTERS.isdisjoint(cmd)
+
     try:
         # Run command so that output is printed at terminal and captured in rval
 
         rval = subprocess.run(
-            cmd,
+            cmd if use_shell else shlex.split(cmd),
             check=True,
             capture_output=False,
-            shell=True,
+            shell=use_shell,
             stdout=subprocess.PIPE,
             timeout=timeout,
         )
@@ -68,9 +82,18 @@ def run_local(cmd: str, timeout: float = DEFAULT_TIMEOUT):
             msg += f"Found the following output: {rval.stdout.decode()}"
         logger.debug(msg)
 
+    except FileNotFoundError as err:
+        # Without a shell, a missing executable is raised directly
+        msg = (
+            f"Execution Error found when running with command: \n \n '{cmd}' \n \n"
+            f"The executable could not be found: {err}"
+        )
+        logger.error(msg)
+        raise ExecutionError(msg) from err
+
     except subprocess.CalledProcessError as err:
         msg = (
-            f"Execution Error found when running with command: \n \n '{err.cmd}' \n \n"
+            f"Execution Error found when running with command: \n \n '{cmd}' \n \n"
             f"This yielded a return code of {err.returncode}. "
             f"The following traceback was found: \n {err.stderr}"
         )
@@ -79,7 +102,7 @@ def run_local(cmd: str, timeout: float = DEFAULT_TIMEOUT):
 
     except TimeoutExpired as err:
         msg = (
-            f"Timeout error found when running with command: \n \n '{err.cmd}' \n \n"
+            f"Timeout error found when running with command: \n \n '{cmd}' \n \n"
             f"The timeout was set to {timeout} seconds. "
             f"The following traceback was found: \n {err.stderr}"
         )
@@ -272,3 +295,116 @@ def execute(
         run_local(cmd, timeout=timeout)
     else:
         run_docker(cmd, output_dir=output_dir)
+
+
+def get_execution_cache_key(cmd: str, input_paths: Sequence[str | Path]) -> str:
+    """
+    Get a key for a command, based on the command itself
+    and the contents of all of its input files
+
+    :param cmd: command
+    :param input_paths: paths of the files read by the command
+    :return: cache key
+    """
+    hasher = hashlib.blake2b(cmd.encode(), digest_size=20)
+    for path in input_paths:
+        hasher.update(str(path).encode())
+        with open(path, "rb") as input_file:
+            while chunk := input_file.read(1024**2):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def prune_execution_cache(cache_dir: Path, max_bytes: int = EXECUTION_CACHE_MAX_BYTES):
+    """
+    Remove the least recently used entries from an execution cache,
+    until the total size is below max_bytes
+
+    :param cache_dir: cache directory
+    :param max_bytes: maximum total size of the cache
+    :return: None
+    """
+    entries = []
+    for entry in cache_dir.iterdir():
+        # Skip entries which are still being written
+        if entry.is_dir() and not entry.name.startswith("temp_"):
+            try:
+                size = sum(x.stat().st_size for x in entry.iterdir())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                # Removed by another process
+                continue
+
+    total = sum(x[1] for x in entries)
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+
+def execute_with_cache(  # pylint: disable=too-many-arguments
+    cmd: str,
+    input_paths: Sequence[str | Path | None],
+    output_paths: Sequence[str | Path],
+    cache_dir: Path | None,
+    output_dir: Path | str = ".",
+    local: bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+):
+    """
+    Execute a command as with :func:`execute`, reusing the outputs of an
+    earlier identical run if possible.
+
+    Runs are identified by the command and the contents of the input files.
+    If a matching run is in cache_dir, its outputs are copied to output_paths
+    and the command is not run. Otherwise, the command is run
+    and its outputs are added to the cache.
+
+    :param cmd: command
+    :param input_paths: paths of the files read by the command (None is ignored)
+    :param output_paths: paths of the files written by the command
+    :param cache_dir: cache directory, or None to always run the command
+    :param output_dir: output directory for command
+    :param local: boolean whether use local or docker
+    :param timeout: timeout for local execution
+    :return: None
+    """
+    if cache_dir is None:
+        execute(cmd, output_dir=output_dir, local=local, timeout=timeout)
+        return
+
+    entry = cache_dir.joinpath(
+        get_execution_cache_key(cmd, [x for x in input_paths if x is not None])
+    )
+
+    if entry.exists():
+        try:
+            for i, output_path in enumerate(output_paths):
+                shutil.copyfile(entry.joinpath(str(i)), output_path)
+            os.utime(entry)
+        except FileNotFoundError:
+            # The entry was pruned while being read, so just run the command
+            logger.debug(f"Cached outputs in {entry} were removed, rerunning")
+        else:
+            logger.debug(f"Reused cached outputs of `{cmd}` from {entry}")
+            return
+
+    execute(cmd, output_dir=output_dir, local=local, timeout=timeout)
+
+    if not all(os.path.exists(x) for x in output_paths):
+        logger.debug(f"Not all outputs of `{cmd}` were found, so not caching them")
+        return
+
+    # Outputs are copied rather than linked, as they may later be edited in place
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    temp_entry = Path(tempfile.mkdtemp(dir=cache_dir, prefix="temp_"))
+    for i, output_path in enumerate(output_paths):
+        shutil.copyfile(output_path, temp_entry.joinpath(str(i)))
+    try:
+        os.replace(temp_entry, entry)
+    except OSError:
+        # Another process cached the same run first
+        shutil.rmtree(temp_entry, ignore_errors=True)
+
+    prune_execution_cache(cache_dir)
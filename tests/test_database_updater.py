@@ -0,0 +1,173 @@
+"""
+Tests for updating database entries,
+in ..module::mirar.processors.database.database_updater
+"""
+
+import logging
+from typing import ClassVar
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from astropy.io.fits import Header
+from sqlalchemy import VARCHAR, Column, Integer
+from sqlalchemy.orm import DeclarativeBase
+
+from mirar.data import Image, ImageBatch
+from mirar.database.base_model import BaseDB, DatabaseUpdateError
+from mirar.database.base_table import BaseTable
+from mirar.paths import BASE_NAME_KEY, PROC_HISTORY_KEY
+from mirar.processors.database import database_updater
+from mirar.processors.database.database_updater import ImageDatabaseMultiEntryUpdater
+from mirar.testing import BaseTestCase
+
+logger = logging.getLogger(__name__)
+
+
+class UpdaterTestBase(DeclarativeBase, BaseTable):
+    """
+    Parent class for the test table
+    """
+
+    db_name = "mirar_test"
+
+
+class RowsTable(UpdaterTestBase):  # pylint: disable=too-few-public-methods
+    """
+    Test table
+    """
+
+    __tablename__ = "rows"
+
+    rid = Column(Integer, primary_key=True)
+    name = Column(VARCHAR(10), unique=True)
+    status = Column(Integer)
+
+
+class Row(BaseDB):
+    """
+    A pydantic model for a test row
+    """
+
+    sql_model: ClassVar = RowsTable
+    rid: int
+    name: str
+    status: int
+
+
+class CustomRow(Row):
+    """
+    A test row with a customised update_entry
+    """
+
+    sql_model: ClassVar = RowsTable
+
+    def update_entry(self, update_keys=None):
+        super().update_entry(update_keys=update_keys)
+
+
+class TestDatabaseUpdater(BaseTestCase):
+    """Class for testing ..module::mirar.processors.database.database_updater"""
+
+    def setUp(self):
+        self.table = pd.DataFrame(
+            {"rid": [1, 2, 3], "name": ["a", "b", "c"], "status": [0, 0, 0]}
+        )
+
+    def select_many(self, db_constraints, **_) -> list[pd.DataFrame]:
+        """
+        Select rows from the test table, for each set of constraints
+
+        :param db_constraints: constraints, one per query
+        :return: results
+        """
+        return [self.select(db_constraints=x) for x in db_constraints]
+
+    def select(self, db_constraints, **_) -> pd.DataFrame:
+        """
+        Select rows from the test table
+
+        :param db_constraints: constraints
+        :return: results
+        """
+        mask = np.ones(len(self.table), dtype=bool)
+        for column, value, _ in db_constraints:
+            mask &= self.table[column] == value
+        return self.table[mask].reset_index(drop=True)
+
+    def update(self, update_dict: dict, db_constraints, **_):
+        """
+        Update the rows of the test table matching the constraints
+
+        :param update_dict: values to update
+        :param db_constraints: constraints
+        :return: None
+        """
+        rows = self.select(db_constraints)
+        mask = self.table["rid"].isin(rows["rid"])
+        for key, value in update_dict.items():
+            self.table.loc[mask, key] = value
+
+    def update_many(self, update_dicts: list[dict], key_names: str, **_):
+        """
+        Update the rows of the test table matching each key value
+
+        :param update_dicts: key values and values to update
+        :param key_names: name of the column identifying each row
+        :return: None
+        """
+        for update_dict in update_dicts:
+            mask = self.table[key_names] == update_dict[key_names]
+            for key, value in update_dict.items():
+                self.table.loc[mask, key] = value
+
+    def run_updater(self, db_table: type[Row], db_alter_columns: list[str]):
+        """
+        Run the multi-entry updater on an image updating rows 1 and 3
+
+        :param db_table: model for the test table
+        :param db_alter_columns: columns to update
+        :return: None
+        """
+        header = Header()
+        header[BASE_NAME_KEY] = "test_image.fits"
+        header[PROC_HISTORY_KEY] = ""
+        header["rid"] = "1,3"
+        header["status"] = 5
+        header["badfield"] = 1
+        image = Image(data=np.zeros((2, 2)), header=header)
+
+        processor = ImageDatabaseMultiEntryUpdater(
+            db_table=db_table, db_alter_columns=db_alter_columns, sequence_key="rid"
+        )
+
+        with (
+            mock.patch.object(
+                database_updater, "select_many_from_table", self.select_many
+            ),
+            mock.patch.object(
+                database_updater, "_update_many_database_entries", self.update_many
+            ),
+            mock.patch("mirar.database.base_model.select_from_table", self.select),
+            mock.patch("mirar.database.base_model._update_database_entry", self.update),
+        ):
+            processor.apply(ImageBatch([image]))
+
+    def test_batched_matches_per_row(self):
+        """Test that batched updates give the same result as per-row updates"""
+        self.run_updater(Row, ["status"])
+        batched = self.table.copy()
+
+        self.setUp()
+        self.run_updater(CustomRow, ["status"])
+
+        pd.testing.assert_frame_equal(batched, self.table)
+        self.assertEqual(self.table["status"].tolist(), [5, 0, 5])
+
+    def test_unknown_column(self):
+        """Test that updating a column which is not a model field fails"""
+        for db_table in [Row, CustomRow]:
+            with self.assertRaises(DatabaseUpdateError):
+                self.run_updater(db_table, ["status", "badfield"])
+
+        self.assertEqual(self.table["status"].tolist(), [0, 0, 0])
@@ -11,10 +11,6 @@ from mirar.testing import BaseTestCase
 
 logger = logging.getLogger(__name__)
 
-pipeline = get_pipeline(
-    instrument="summer", selected_configurations=["test"], night="20220401"
-)
-
 expected_error = {
     "processor_name": "mirar.processors.utils.image_loader",
     "contents": [],
@@ -26,6 +22,16 @@ expected_error = {
 class TestErrors(BaseTestCase):
     """Class for testing errors in ..module::mirar.errors"""
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Function to build the summer pipeline used for the error tests
+        """
+        super().setUpClass()
+        cls.pipeline = get_pipeline(
+            instrument="summer", selected_configurations=["test"], night="20220401"
+        )
+
     def setUp(self):
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -33,7 +39,7 @@ class TestErrors(BaseTestCase):
     def test_pipeline(self):
         self.logger.info("\n\n Testing summer pipeline \n\n")
 
-        _, errorstack = pipeline.reduce_images(
+        _, errorstack = self.pipeline.reduce_images(
             Dataset(ImageBatch()), catch_all_errors=True
         )
 
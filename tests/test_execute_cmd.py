@@ -0,0 +1,136 @@
+"""
+Tests for running commands and caching their outputs,
+in ..module::mirar.utils.execute_cmd
+"""
+
+import logging
+import shlex
+from pathlib import Path
+from unittest import mock
+
+from mirar.testing import BaseTestCase
+from mirar.utils import execute_cmd
+from mirar.utils.execute_cmd import (
+    ExecutionError,
+    execute_with_cache,
+    prune_execution_cache,
+    run_local,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestExecuteCmd(BaseTestCase):
+    """Class for testing ..module::mirar.utils.execute_cmd"""
+
+    def setUp(self):
+        self.work_dir = Path(self.temp_dir.name)
+        self.cache_dir = self.work_dir.joinpath("execution_cache")
+        self.input_path = self.work_dir.joinpath("input.txt")
+        self.output_path = self.work_dir.joinpath("output.txt")
+        self.input_path.write_text("first", encoding="utf8")
+        self.cmd = f"cp {self.input_path} {self.output_path}"
+
+    def run_cached(self) -> mock.MagicMock:
+        """
+        Run the test command with the cache, recording calls to execute
+
+        :return: mock wrapping execute
+        """
+        with mock.patch.object(
+            execute_cmd, "execute", wraps=execute_cmd.execute
+        ) as mock_execute:
+            execute_with_cache(
+                self.cmd,
+                input_paths=[self.input_path, None],
+                output_paths=[self.output_path],
+                cache_dir=self.cache_dir,
+            )
+        return mock_execute
+
+    def get_cache_entries(self) -> list[Path]:
+        """
+        Get the completed entries in the cache
+
+        :return: list of entry directories
+        """
+        return [x for x in self.cache_dir.iterdir() if x.is_dir()]
+
+    def test_cache_miss_and_hit(self):
+        """Test that a repeated command reuses the cached outputs"""
+        self.assertEqual(self.run_cached().call_count, 1)
+        self.assertEqual(len(self.get_cache_entries()), 1)
+
+        self.output_path.unlink()
+        self.assertEqual(self.run_cached().call_count, 0)
+        self.assertEqual(self.output_path.read_text(encoding="utf8"), "first")
+
+    def test_cache_miss_on_new_input(self):
+        """Test that changing the contents of an input reruns the command"""
+        self.run_cached()
+
+        self.input_path.write_text("second", encoding="utf8")
+        self.assertEqual(self.run_cached().call_count, 1)
+        self.assertEqual(self.output_path.read_text(encoding="utf8"), "second")
+        self.assertEqual(len(self.get_cache_entries()), 2)
+
+    def test_pruned_entry(self):
+        """Test that pruned entries are removed, and the command is then rerun"""
+        self.run_cached()
+
+        # Entries still being written are never pruned
+        temp_entry = self.cache_dir.joinpath("temp_entry")
+        temp_entry.mkdir()
+
+        prune_execution_cache(self.cache_dir, max_bytes=0)
+        self.assertEqual(self.get_cache_entries(), [temp_entry])
+
+        self.assertEqual(self.run_cached().call_count, 1)
+
+    def test_entry_pruned_while_reading(self):
+        """Test that a partially-removed entry falls back to running the command"""
+        self.run_cached()
+
+        entry = self.get_cache_entries()[0]
+        entry.joinpath("0").unlink()
+
+        self.assertEqual(self.run_cached().call_count, 1)
+        self.assertEqual(self.output_path.read_text(encoding="utf8"), "first")
+
+    def test_no_cache_dir(self):
+        """Test that the command is always run without a cache directory"""
+        for _ in range(2):
+            with mock.patch.object(execute_cmd, "execute") as mock_execute:
+                execute_with_cache(
+                    self.cmd,
+                    input_paths=[self.input_path],
+                    output_paths=[self.output_path],
+                    cache_dir=None,
+                )
+            self.assertEqual(mock_execute.call_count, 1)
+
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_run_local_shell(self):
+        """Test that only commands with shell syntax are run via a shell"""
+        run_local(self.cmd)
+        self.assertEqual(self.output_path.read_text(encoding="utf8"), "first")
+
+        shell_cmd = f"echo second > {self.output_path}"
+        run_local(shell_cmd)
+        self.assertEqual(self.output_path.read_text(encoding="utf8"), "second\n")
+
+        for cmd, use_shell in [(self.cmd, False), (shell_cmd, True)]:
+            with mock.patch.object(execute_cmd.subprocess, "run") as mock_run:
+                run_local(cmd)
+            args, kwargs = mock_run.call_args
+            self.assertEqual(kwargs["shell"], use_shell)
+            self.assertEqual(args[0], cmd if use_shell else shlex.split(cmd))
+
+    def test_run_local_errors(self):
+        """Test that failing or missing commands raise an ExecutionError"""
+        with self.assertRaises(ExecutionError):
+            run_local(f"cp {self.work_dir.joinpath('missing.txt')} {self.output_path}")
+
+        with self.assertRaises(ExecutionError):
+            run_local("mirar-executable-which-does-not-exist")
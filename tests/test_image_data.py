@@ -0,0 +1,88 @@
+"""
+Tests for storing image data, in ..module::mirar.data.image_data
+"""
+
+import copy
+import logging
+import unittest
+
+import numpy as np
+from astropy.io.fits import Header
+
+from mirar.data import Image
+from mirar.data.cache import USE_CACHE
+from mirar.paths import BASE_NAME_KEY
+from mirar.testing import BaseTestCase
+
+logger = logging.getLogger(__name__)
+
+
+def make_image(data: np.ndarray, **kwargs) -> Image:
+    """
+    Make a test image with a minimal header
+
+    :param data: image data
+    :param kwargs: additional arguments for Image
+    :return: Image
+    """
+    header = Header()
+    header[BASE_NAME_KEY] = "test_image.fits"
+    return Image(data=data, header=header, **kwargs)
+
+
+@unittest.skipUnless(USE_CACHE, "Image data is only cached in cache mode")
+class TestImageData(BaseTestCase):
+    """Class for testing ..module::mirar.data.image_data in cache mode"""
+
+    def setUp(self):
+        self.data = np.arange(12, dtype=np.float64).reshape(3, 4)
+
+    def test_round_trip(self):
+        """Test that cached data is returned unchanged"""
+        image = make_image(self.data)
+        self.assertTrue(image.cache_path.exists())
+
+        loaded = image.get_data()
+        self.assertEqual(loaded.dtype, self.data.dtype)
+        np.testing.assert_array_equal(loaded, self.data)
+
+        # Modifying the loaded array does not change the cache
+        loaded[0, 0] = -1.0
+        np.testing.assert_array_equal(image.get_data(), self.data)
+
+        # Arrays loaded earlier are unchanged when the data is updated
+        image.set_data(self.data * 2.0)
+        np.testing.assert_array_equal(image.get_data(), self.data * 2.0)
+        self.assertEqual(loaded[0, 1], self.data[0, 1])
+
+    def test_empty_data(self):
+        """Test that empty arrays, which cannot be memory-mapped, are cached"""
+        image = make_image(np.empty((0, 5), dtype=np.int16))
+
+        loaded = image.get_data()
+        self.assertEqual(loaded.shape, (0, 5))
+        self.assertEqual(loaded.dtype, np.int16)
+
+    def test_copy_independence(self):
+        """Test that copies can be modified without affecting the original"""
+        image = make_image(self.data)
+
+        for new in [copy.deepcopy(image), copy.copy(image)]:
+            self.assertNotEqual(new.cache_path, image.cache_path)
+            np.testing.assert_array_equal(new.get_data(), self.data)
+
+            new.set_data(self.data + 1.0)
+            np.testing.assert_array_equal(new.get_data(), self.data + 1.0)
+            np.testing.assert_array_equal(image.get_data(), self.data)
+
+        # Deep copies have an independent header
+        new = copy.deepcopy(image)
+        new[BASE_NAME_KEY] = "copy.fits"
+        self.assertEqual(image[BASE_NAME_KEY], "test_image.fits")
+
+    def test_cache_file_removed(self):
+        """Test that the cache file is removed with the image"""
+        image = make_image(self.data)
+        cache_path = image.cache_path
+        del image
+        self.assertFalse(cache_path.exists())
@@ -3,6 +3,7 @@ Module to test SEDMv2 pipeline with "default_stellar" configuration
 """
 
 import logging
+import os
 import shutil
 
 from mirar.data import Dataset, ImageBatch
@@ -105,11 +106,13 @@ class TestSEDMv2StellarPipeline(BaseTestCase):
 
         header = new.get_metadata()
 
-        new_exp = "expected_zp = { \n"  # pylint: disable=C0103, W0621
-        for header_key in expected_zp.keys():  # pylint: disable=C0201, W0621
-            new_exp += f'    "{header_key}": {header[header_key]}, \n'
-        new_exp += "}"
-        print(new_exp)
+        # Set MIRAR_UPDATE_EXPECTED to print new expected ZP dict
+        if os.getenv("MIRAR_UPDATE_EXPECTED", default="") != "":
+            lines = [  # pylint: disable=W0621
+                f'    "{header_key}": {header[header_key]}, '
+                for header_key in expected_zp
+            ]
+            print("\n".join(["expected_zp = { ", *lines, "}"]))
 
         for key, value in expected_zp.items():  # pylint: disable=R0801
             if isinstance(value, float):
@@ -125,11 +128,14 @@ class TestSEDMv2StellarPipeline(BaseTestCase):
 
         assert len(source_table) == 1
 
-        new_row = "expected_ap_phot = { \n"  # pylint: disable=C0103
-        for header_key in expected_ap_phot.keys():  # pylint: disable=C0201
-            new_row += f'    "{header_key}": {source_table.iloc[0][header_key]}, \n'
-        new_row += "}"
-        print(new_row)
+        first_row = source_table.iloc[0]
+        # Set MIRAR_UPDATE_EXPECTED to print new expected aperture photometry dict
+        if os.getenv("MIRAR_UPDATE_EXPECTED", default="") != "":
+            lines = [
+                f'    "{header_key}": {first_row[header_key]}, '
+                for header_key in expected_ap_phot
+            ]
+            print("\n".join(["expected_ap_phot = { ", *lines, "}"]))
 
         for _, row in source_table.iterrows():
             for key, value in expected_ap_phot.items():
@@ -158,9 +164,9 @@ if __name__ == "__main__":  # pylint: disable=R0801
 
     new_header = new_res[0][0].get_header()
 
-    new_exp = "expected_zp = { \n"  # pylint: disable=C0103
-    for header_key in new_header.keys():
-        if "ZP_" in header_key:  # pylint: disable=R0801
-            new_exp += f'    "{header_key}": {new_header[header_key]}, \n'
-    new_exp += "}"
-    print(new_exp)
+    lines = [
+        f'    "{header_key}": {new_header[header_key]}, '
+        for header_key in new_header
+        if "ZP_" in header_key  # pylint: disable=R0801
+    ]
+    print("\n".join(["expected_zp = { ", *lines, "}"]))
@@ -104,9 +104,9 @@ if __name__ == "__main__":
 
     new_header = new_res[0][0].get_header()
 
-    new_exp = "expected_zp = { \n"  # pylint: disable=C0103
-    for header_key in new_header.keys():
-        if "ZP_" in header_key:
-            new_exp += f'    "{header_key}": {new_header[header_key]}, \n'
-    new_exp += "}"
-    print(new_exp)
+    lines = [
+        f'    "{header_key}": {new_header[header_key]}, '
+        for header_key in new_header
+        if "ZP_" in header_key
+    ]
+    print("\n".join(["expected_zp = { ", *lines, "}"]))
@@ -3,6 +3,7 @@ Module to test summer image subtraction pipeline
 """
 
 import logging
+import os
 import shutil
 
 from mirar.data import Dataset, ImageBatch
@@ -19,17 +20,20 @@ expected_values = {
 }
 
 
-pipeline = SummerPipeline(night="20220815", selected_configurations=["test_imsub"])
-
-
 class TestSummerImsubPipeline(BaseTestCase):
     """
     Class to test summer imsub pipeline
     """
 
-    def setUp(self):
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
+    @classmethod
+    def setUpClass(cls):
+        """
+        Function to build the summer imsub pipeline
+        """
+        super().setUpClass()
+        cls.pipeline = SummerPipeline(
+            night="20220815", selected_configurations=["test_imsub"]
+        )
 
     def test_pipeline(self):
         """
@@ -37,9 +41,11 @@ class TestSummerImsubPipeline(BaseTestCase):
         Returns:
 
         """
-        self.logger.info("\n\n Testing summer pipeline \n\n")
+        logger.info("\n\n Testing summer pipeline \n\n")
 
-        res, _ = pipeline.reduce_images(Dataset([ImageBatch()]), catch_all_errors=False)
+        res, _ = self.pipeline.reduce_images(
+            Dataset([ImageBatch()]), catch_all_errors=False
+        )
 
         self.assertEqual(len(res), 1)
 
@@ -49,13 +55,15 @@ class TestSummerImsubPipeline(BaseTestCase):
 
         header = res[0][0].get_header()
 
-        print("New Results SUMMER imsub:")
-        new_exp = "expected_values = { \n"
-        for header_key in header.keys():
-            if header_key in expected_values.keys():
-                new_exp += f'    "{header_key}": {header[header_key]}, \n'
-        new_exp += "}"
-        print(new_exp)
+        # Set MIRAR_UPDATE_EXPECTED to print new expected values dict
+        if os.getenv("MIRAR_UPDATE_EXPECTED", default="") != "":
+            print("New Results SUMMER imsub:")
+            lines = [
+                f'    "{header_key}": {header[header_key]}, '
+                for header_key in header
+                if header_key in expected_values
+            ]
+            print("\n".join(["expected_values = { ", *lines, "}"]))
 
         for key, value in expected_values.items():
             if isinstance(value, float):
@@ -3,6 +3,7 @@ Tests for summer reduction
 """
 
 import logging
+import os
 import shutil
 
 from mirar.data import Dataset, ImageBatch
@@ -39,16 +40,22 @@ expected_zp = {
     "ZP_AUTO_nstars": 30,
 }
 
-pipeline = get_pipeline(
-    instrument="summer", selected_configurations=["test"], night="20220402"
-)
-
 
 class TestSummerPipeline(BaseTestCase):
     """
     Module for testing summer pipeline
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Function to build the summer test pipeline
+        """
+        super().setUpClass()
+        cls.pipeline = get_pipeline(
+            instrument="summer", selected_configurations=["test"], night="20220402"
+        )
+
     def setUp(self):
         """
         Function to set up test
@@ -66,7 +73,9 @@ class TestSummerPipeline(BaseTestCase):
         """
         self.logger.info("\n\n Testing summer pipeline \n\n")
 
-        res, _ = pipeline.reduce_images(Dataset([ImageBatch()]), catch_all_errors=False)
+        res, _ = self.pipeline.reduce_images(
+            Dataset([ImageBatch()]), catch_all_errors=False
+        )
 
         # Cleanup - delete non-empty ouptut dir
         output_dir = get_output_dir(dir_root="summer/20220402")
@@ -76,13 +85,15 @@ class TestSummerPipeline(BaseTestCase):
 
         header = res[0][0].get_header()
 
-        print("New Results SUMMER:")
-        new_exp = "expected_zp = { \n"
-        for header_key in header.keys():
-            if header_key in expected_zp:
-                new_exp += f'    "{header_key}": {header[header_key]}, \n'
-        new_exp += "}"
-        print(new_exp)
+        # Set MIRAR_UPDATE_EXPECTED to print new expected ZP dict
+        if os.getenv("MIRAR_UPDATE_EXPECTED", default="") != "":
+            print("New Results SUMMER:")
+            lines = [
+                f'    "{header_key}": {header[header_key]}, '
+                for header_key in header
+                if header_key in expected_zp
+            ]
+            print("\n".join(["expected_zp = { ", *lines, "}"]))
 
         for key, value in expected_zp.items():
             if isinstance(value, float):